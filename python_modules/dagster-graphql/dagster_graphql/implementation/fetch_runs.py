@@ -11,7 +11,12 @@
 from dagster._core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.dagster_run import (
+    DagsterRunStatsSnapshot,
+    DagsterRunStatus,
+    RunRecord,
+    RunsFilter,
+)
 from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import BACKFILL_ID_TAG, TagType, get_tag_type
 from dagster._record import copy, record
@@ -352,11 +357,10 @@ async def get_execution_plan(
     )
 
 
-def get_stats(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunStatsSnapshot":
+async def gen_stats(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunStatsSnapshot":
     from dagster_graphql.schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
-    stats.id = "stats-{run_id}"  # type: ignore  # (unused code path)
+    stats = check.not_none(await DagsterRunStatsSnapshot.gen(graphene_info.context, run_id))
     return GrapheneRunStatsSnapshot(stats)
 
 
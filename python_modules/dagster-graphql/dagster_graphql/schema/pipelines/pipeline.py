@@ -47,7 +47,7 @@
 from dagster_graphql.implementation.fetch_asset_checks import get_asset_checks_for_run
 from dagster_graphql.implementation.fetch_assets import get_assets_for_run
 from dagster_graphql.implementation.fetch_pipelines import get_job_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from dagster_graphql.implementation.fetch_runs import gen_stats, get_runs, get_step_stats
 from dagster_graphql.implementation.fetch_schedules import get_schedules_for_job
 from dagster_graphql.implementation.fetch_sensors import get_sensors_for_job
 from dagster_graphql.implementation.loader import RepositoryScopedBatchLoader
@@ -773,8 +773,8 @@ def resolve_parentPipelineSnapshotId(self, graphene_info: ResolveInfo):
         return None
 
     @capture_error
-    def resolve_stats(self, graphene_info: ResolveInfo):
-        return get_stats(graphene_info, self.run_id)
+    async def resolve_stats(self, graphene_info: ResolveInfo):
+        return await gen_stats(graphene_info, self.run_id)
 
     def resolve_stepStats(self, graphene_info: ResolveInfo):
         return get_step_stats(graphene_info, self.run_id)
@@ -882,7 +882,9 @@ def resolve_startTime(self, graphene_info: ResolveInfo):
                 return self._run_record.end_time
 
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = check.not_none(
+                    DagsterRunStatsSnapshot.blocking_get(graphene_info.context, self.runId)
+                )
 
             if self._run_stats.start_time is None and self._run_stats.end_time:
                 return self._run_stats.end_time
@@ -893,7 +895,9 @@ def resolve_startTime(self, graphene_info: ResolveInfo):
     def resolve_endTime(self, graphene_info: ResolveInfo):
         if self._run_record.end_time is None and self.dagster_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = check.not_none(
+                    DagsterRunStatsSnapshot.blocking_get(graphene_info.context, self.runId)
+                )
             return self._run_stats.end_time
         return self._run_record.end_time
 
@@ -1,6 +1,6 @@
 import graphene
 from dagster._core.scheduler.instigation import TickStatus
-from dagster._core.storage.dagster_run import RunsFilter
+from dagster._core.storage.dagster_run import RunRecord
 
 from dagster_graphql.schema.errors import GraphenePythonError
 from dagster_graphql.schema.instigation import GrapheneInstigationTickStatus
@@ -24,12 +24,10 @@ def tick_specific_data_from_dagster_tick(graphene_info, tick):
     from dagster_graphql.schema.pipelines.pipeline import GrapheneRun
 
     if tick.status == TickStatus.SUCCESS:
-        if tick.run_ids and graphene_info.context.instance.has_run(tick.run_ids[0]):
-            record = graphene_info.context.instance.get_run_records(
-                RunsFilter(run_ids=[tick.run_ids[0]])
-            )[0]
-            return GrapheneScheduleTickSuccessData(run=GrapheneRun(record))
-        return GrapheneScheduleTickSuccessData(run=None)
+        record = (
+            RunRecord.blocking_get(graphene_info.context, tick.run_ids[0]) if tick.run_ids else None
+        )
+        return GrapheneScheduleTickSuccessData(run=GrapheneRun(record) if record else None)
     elif tick.status == TickStatus.FAILURE:
         error = tick.error
         return GrapheneScheduleTickFailureData(error=GraphenePythonError(error))
@@ -253,6 +253,19 @@
 """
 
 
+ASSET_NODES_LATEST_MATERIALIZATION_QUERY = """
+query AssetNodesLatestMaterializationQuery {
+  assetNodes {
+    assetKey {
+      path
+    }
+    assetMaterializations(limit: 1) {
+      runId
+    }
+  }
+}
+"""
+
 RUN_CONCURRENCY_QUERY = """
 {
   pipelineRunsOrError {
@@ -269,6 +282,24 @@
 }
 """
 
+RUN_STATS_QUERY = """
+query RunStatsQuery($filter: RunsFilter) {
+  pipelineRunsOrError(filter: $filter) {
+    ... on Runs {
+      results {
+        runId
+        stats {
+          ... on RunStatsSnapshot {
+            stepsSucceeded
+            stepsFailed
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 RUN_LOGS_QUERY = """
 query RunLogsQuery($afterCursor:String, $limit:Int, $runId: ID!) {
   pipelineRunOrError(runId: $runId) {
@@ -619,6 +650,31 @@ def asset_repo():
     return asset_repo
 
 
+def get_latest_materialization_repo():
+    @asset
+    def upstream_asset():
+        return 1
+
+    @asset
+    def downstream_asset(upstream_asset):
+        return upstream_asset
+
+    @asset
+    def unmaterialized_asset():
+        return 1
+
+    @repository
+    def latest_materialization_repo():
+        return [
+            upstream_asset,
+            downstream_asset,
+            unmaterialized_asset,
+            define_asset_job("materialize_job", selection=["upstream_asset", "downstream_asset"]),
+        ]
+
+    return latest_materialization_repo
+
+
 def test_runs_over_time():
     with instance_for_test() as instance:
         repo_1 = get_repo_at_time_1()
@@ -1081,6 +1137,55 @@ def test_asset_batching():
             assert asset_ids == ['["my_fail_asset"]']
 
 
+def test_run_stats_batching():
+    with instance_for_test() as instance:
+        repo = get_repo_at_time_1()
+        run_ids = [
+            repo.get_job("foo_job").execute_in_process(instance=instance).run_id for _ in range(3)
+        ]
+
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(
+                context, RUN_STATS_QUERY, variables={"filter": {"runIds": run_ids}}
+            )
+            assert result.data
+            runs = result.data["pipelineRunsOrError"]["results"]
+            assert {run["runId"] for run in runs} == set(run_ids)
+            for run in runs:
+                assert run["stats"] == {"stepsSucceeded": 1, "stepsFailed": 0}
+
+            # the stats for every run are fetched in a single batch
+            counts = traced_counter.get().counts()  # ty: ignore[unresolved-attribute]
+            assert counts.get("DagsterRunStatsSnapshot.batch_load") == 1
+
+
+def test_latest_materialization_batching():
+    with instance_for_test() as instance:
+        repo = get_latest_materialization_repo()
+        run_id = repo.get_job("materialize_job").execute_in_process(instance=instance).run_id
+
+        with define_out_of_process_context(
+            __file__, "get_latest_materialization_repo", instance
+        ) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(context, ASSET_NODES_LATEST_MATERIALIZATION_QUERY)
+            assert result.data
+            materializations_by_key = {
+                tuple(node["assetKey"]["path"]): node["assetMaterializations"]
+                for node in result.data["assetNodes"]
+            }
+            assert materializations_by_key == {
+                ("upstream_asset",): [{"runId": run_id}],
+                ("downstream_asset",): [{"runId": run_id}],
+                ("unmaterialized_asset",): [],
+            }
+
+            # the asset records for every asset node are fetched in a single batch
+            counts = traced_counter.get().counts()  # ty: ignore[unresolved-attribute]
+            assert counts.get("AssetRecord.batch_load") == 1
+
+
 def test_run_has_concurrency_slots():
     with tempfile.TemporaryDirectory() as temp_dir:
         with instance_for_test(
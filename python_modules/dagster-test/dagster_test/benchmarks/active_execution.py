@@ -0,0 +1,121 @@
+import argparse
+import time
+
+import dagster as dg
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Measure the orchestration overhead of ActiveExecution for a job that fans out to a large number of
+dynamic steps. Steps are marked as succeeded as soon as they are vended, so the timings only include
+the work done by ActiveExecution to track which steps are ready to execute.
+"""
+
+parser = argparse.ArgumentParser(prog="active_execution", description=DESC)
+parser.add_argument("--num-dynamic-steps", type=int, nargs="+", default=[10_000, 50_000])
+parser.add_argument("--max-concurrent", type=int, default=64)
+parser.add_argument(
+    "--limit",
+    type=int,
+    default=1,
+    help="Steps requested per call to get_steps_to_execute. The in-process executor requests 1.",
+)
+
+
+def build_fan_out_job() -> dg.JobDefinition:
+    @dg.op(out=dg.DynamicOut())
+    def fan_out():
+        yield from []
+
+    @dg.op
+    def mapped(x):
+        return x
+
+    @dg.op
+    def fan_in(xs):
+        return len(xs)
+
+    @dg.job
+    def fan_out_job():
+        fan_in(fan_out().map(mapped).collect())
+
+    return fan_out_job
+
+
+def _event(job_name: str, event_type: DagsterEventType, step_key: str, **kwargs) -> DagsterEvent:
+    return DagsterEvent(event_type.value, job_name=job_name, step_key=step_key, **kwargs)
+
+
+def run_active_execution(
+    job: dg.JobDefinition, num_dynamic_steps: int, max_concurrent: int, limit: int | None
+):
+    """Returns the number of steps executed and the time spent executing them."""
+    execution_plan = create_execution_plan(job)
+    start = time.perf_counter()
+    num_steps = 0
+    with execution_plan.start(RetryMode.DISABLED, max_concurrent=max_concurrent) as active:
+        while True:
+            # like the executors, poll for steps before checking for completion, so that newly
+            # resolved dynamic steps are added to the plan
+            steps = active.get_steps_to_execute(limit=limit)
+            if not steps and active.is_complete:
+                break
+            for step in steps:
+                # emit each output, so that downstream steps are executed rather than skipped
+                mapping_keys = (
+                    [str(i) for i in range(num_dynamic_steps)] if step.key == "fan_out" else [None]
+                )
+                for mapping_key in mapping_keys:
+                    active.handle_event(
+                        _event(
+                            job.name,
+                            DagsterEventType.STEP_OUTPUT,
+                            step.key,
+                            event_specific_data=StepOutputData(
+                                StepOutputHandle(step.key, "result", mapping_key)
+                            ),
+                        )
+                    )
+                active.handle_event(
+                    _event(
+                        job.name,
+                        DagsterEventType.STEP_SUCCESS,
+                        step.key,
+                        event_specific_data=StepSuccessData(duration_ms=0.0),
+                    )
+                )
+                num_steps += 1
+    return num_steps, time.perf_counter() - start
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_dynamic_steps: list[int], max_concurrent: int, limit: int | None):
+    console = Console()
+    job = build_fan_out_job()
+
+    table = Table(
+        title=f"ActiveExecution dynamic fan-out (max_concurrent={max_concurrent}, limit={limit})"
+    )
+    for column in ["dynamic steps", "steps executed", "time (s)", "us / step"]:
+        table.add_column(column)
+    for num in num_dynamic_steps:
+        num_steps, elapsed = run_active_execution(job, num, max_concurrent, limit)
+        assert num_steps == num + 2
+        table.add_row(
+            str(num), str(num_steps), f"{elapsed:.2f}", f"{elapsed / num_steps * 1e6:.1f}"
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_dynamic_steps, args.max_concurrent, args.limit)
@@ -0,0 +1,87 @@
+import argparse
+import random
+import time
+
+from dagster._core.definitions.assets.graph.reachability import ReachabilityIndex
+from dagster._core.selector.subset_selector import DependencyGraph, fetch_connected
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare answering upstream and downstream queries on a synthetic DAG with a ReachabilityIndex
+against traversing the graph breadth-first, as asset selections and the automation evaluator do.
+Each node depends on up to --max-parents nodes chosen from the --window nodes before it, so smaller
+windows produce deeper, narrower graphs.
+"""
+
+parser = argparse.ArgumentParser(prog="asset_graph_reachability", description=DESC)
+parser.add_argument("--num-nodes", type=int, default=50_000)
+parser.add_argument("--max-parents", type=int, default=3)
+parser.add_argument("--window", type=int, nargs="+", default=[50, 1000])
+parser.add_argument("--num-queries", type=int, default=200)
+parser.add_argument("--seed", type=int, default=0)
+
+
+def build_graph(
+    num_nodes: int, max_parents: int, window: int, rng: random.Random
+) -> DependencyGraph[int]:
+    upstream: dict[int, set[int]] = {i: set() for i in range(num_nodes)}
+    downstream: dict[int, set[int]] = {i: set() for i in range(num_nodes)}
+    for i in range(1, num_nodes):
+        candidates = range(max(0, i - window), i)
+        for parent in rng.sample(candidates, min(len(candidates), rng.randint(1, max_parents))):
+            upstream[i].add(parent)
+            downstream[parent].add(i)
+    return {"upstream": upstream, "downstream": downstream}
+
+
+def time_queries(fn, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(*query)
+    return time.perf_counter() - start
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_nodes: int, max_parents: int, windows: list[int], num_queries: int, seed: int):
+    console = Console()
+    rng = random.Random(seed)
+
+    table = Table(title=f"Reachability queries ({num_nodes} nodes, {num_queries} queries each)")
+    for column in ["window", "query", "bfs (s)", "index (s)"]:
+        table.add_column(column)
+    for window in windows:
+        graph = build_graph(num_nodes, max_parents, window, rng)
+
+        start = time.perf_counter()
+        index = ReachabilityIndex(graph, list(range(num_nodes)))
+        table.add_row(str(window), "build index", "", f"{time.perf_counter() - start:.2f}")
+
+        for direction in ("upstream", "downstream"):
+            for depth in (None, 2):
+                queries = [
+                    ({rng.randrange(num_nodes)}, direction, depth) for _ in range(num_queries)
+                ]
+                bfs_time = time_queries(
+                    lambda nodes, direction, depth: (
+                        nodes | fetch_connected(nodes, graph, direction=direction, depth=depth)
+                    ),
+                    queries,
+                )
+                index_time = time_queries(index.fetch_connected, queries)
+                table.add_row(
+                    str(window),
+                    f"{direction} (depth={depth})",
+                    f"{bfs_time:.2f}",
+                    f"{index_time:.2f}",
+                )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_nodes, args.max_parents, args.window, args.num_queries, args.seed)
@@ -0,0 +1,113 @@
+import argparse
+import time
+
+import dagster as dg
+from dagster._core.definitions.antlr_asset_selection.antlr_asset_selection import (
+    _parse_asset_selection_string,
+    parse_asset_selection_string,
+)
+from dagster._core.definitions.assets.graph.asset_graph import AssetGraph
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Measure the time to parse and resolve a set of distinct asset selection strings against a large
+asset graph. Each pass parses and resolves every string once, as a sensor or the webserver would.
+The first pass parses every string with the ANTLR parser; later passes reuse the cached parses, so
+the difference between passes is the parsing overhead saved by the cache.
+"""
+
+parser = argparse.ArgumentParser(prog="asset_selection_strings", description=DESC)
+parser.add_argument("--num-assets", type=int, default=20_000)
+parser.add_argument("--num-selections", type=int, default=1_000)
+parser.add_argument("--num-passes", type=int, default=3)
+
+NUM_GROUPS = 50
+NUM_TAG_VALUES = 100
+KINDS = ["python", "snowflake", "dbt", "s3", "bigquery"]
+
+
+def build_asset_graph(num_assets: int) -> AssetGraph:
+    specs = [
+        dg.AssetSpec(
+            f"asset_{i}",
+            deps=[f"asset_{(i - 1) // 2}"] if i > 0 else [],
+            group_name=f"group_{i % NUM_GROUPS}",
+            tags={"team": f"team_{i % NUM_TAG_VALUES}"},
+            kinds={KINDS[i % len(KINDS)]},
+            owners=[f"team:owner_{i % NUM_TAG_VALUES}"],
+        )
+        for i in range(num_assets)
+    ]
+
+    @dg.multi_asset(specs=specs, can_subset=True)
+    def all_assets(): ...
+
+    return AssetGraph.from_assets([all_assets])
+
+
+def build_selection_strings(num_assets: int, num_selections: int) -> list[str]:
+    templates = [
+        'key:"asset_{i}"+',
+        '2+key:"asset_{i}"',
+        'group:"group_{g}" and kind:"{kind}"',
+        'tag:"team"="team_{t}" or owner:"team:owner_{t}"',
+        '(group:"group_{g}" or tag:"team"="team_{t}") and not kind:"{kind}"',
+        'sinks(key:"asset_{i}"+)',
+    ]
+    return [
+        templates[n % len(templates)].format(
+            i=(n * 7919) % num_assets,
+            g=n % NUM_GROUPS,
+            t=n % NUM_TAG_VALUES,
+            kind=KINDS[n % len(KINDS)],
+        )
+        # make each string distinct, so that the first pass parses every one of them
+        + f' or key:"missing_{n}"'
+        for n in range(num_selections)
+    ]
+
+
+def run_pass(asset_graph: AssetGraph, selection_strings: list[str]) -> tuple[float, float]:
+    """Returns the time spent parsing and the time spent resolving the selection strings."""
+    parse_time = resolve_time = 0.0
+    for selection_string in selection_strings:
+        start = time.perf_counter()
+        selection = parse_asset_selection_string(selection_string)
+        parsed = time.perf_counter()
+        selection.resolve(asset_graph, allow_missing=True)
+        parse_time += parsed - start
+        resolve_time += time.perf_counter() - parsed
+    return parse_time, resolve_time
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_selections: int, num_passes: int):
+    console = Console()
+    asset_graph = build_asset_graph(num_assets)
+    selection_strings = build_selection_strings(num_assets, num_selections)
+    _parse_asset_selection_string.cache_clear()
+
+    table = Table(
+        title=f"Asset selection strings ({num_selections} selections, {num_assets} assets)"
+    )
+    for column in ["pass", "parse (s)", "resolve (s)", "total (s)"]:
+        table.add_column(column)
+    for i in range(num_passes):
+        parse_time, resolve_time = run_pass(asset_graph, selection_strings)
+        table.add_row(
+            str(i + 1),
+            f"{parse_time:.2f}",
+            f"{resolve_time:.2f}",
+            f"{parse_time + resolve_time:.2f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_selections, args.num_passes)
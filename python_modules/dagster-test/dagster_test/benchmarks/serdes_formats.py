@@ -0,0 +1,123 @@
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dagster import AssetsDefinition, DailyPartitionsDefinition, Definitions, asset
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+)
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._serdes import deserialize_value, serialize_value
+from dagster_shared.serdes.binary import (
+    MSGPACK_CODEC_NAME,
+    deserialize_value_from_bytes,
+    serialize_value_to_bytes,
+)
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare the size and encode/decode time of the JSON and binary serdes wire formats.
+
+By default the benchmark serializes the RepositorySnap of a synthetic code location with
+`--num-assets` partitioned assets arranged in layers. Pass `--snapshot-file` to instead benchmark a
+value that was previously serialized with `serialize_value` (e.g. a RepositorySnap or an
+AssetDaemonCursor copied out of storage).
+
+Requires the `msgpack` package.
+"""
+
+parser = argparse.ArgumentParser(prog="serdes_formats", description=DESC)
+parser.add_argument("--num-assets", type=int, default=5000)
+parser.add_argument("--assets-per-layer", type=int, default=100)
+parser.add_argument("--snapshot-file", type=str, default=None)
+parser.add_argument("--iterations", type=int, default=5)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_assets(num_assets: int, assets_per_layer: int) -> list[AssetsDefinition]:
+    partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
+    assets = []
+    for i in range(num_assets):
+        layer = i // assets_per_layer
+        deps = (
+            [f"asset_{(layer - 1) * assets_per_layer + j}" for j in range(i % 3 + 1)]
+            if layer > 0
+            else []
+        )
+
+        @asset(
+            name=f"asset_{i}",
+            deps=deps,
+            partitions_def=partitions_def,
+            group_name=f"group_{layer}",
+            tags={"layer": str(layer)},
+            kinds={"python"},
+            automation_condition=AutomationCondition.eager(),
+            description=f"Asset number {i} in layer {layer}.",
+        )
+        def _asset() -> None: ...
+
+        assets.append(_asset)
+    return assets
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> tuple[Any, float]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = fn()
+    return result, (time.perf_counter() - start) / iterations
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, assets_per_layer: int, snapshot_file: str | None, iterations: int):
+    console = Console()
+    if snapshot_file:
+        with open(snapshot_file, encoding="utf-8") as f:
+            value = deserialize_value(f.read())
+        name = snapshot_file
+    else:
+        defs = Definitions(assets=build_assets(num_assets, assets_per_layer))
+        value = RepositorySnap.from_def(defs.get_repository_def())
+        name = f"RepositorySnap ({num_assets} assets)"
+
+    console.print(f"Benchmarking serdes formats for {name}")
+
+    json_str, json_encode = _time(lambda: serialize_value(value), iterations)
+    _, json_decode = _time(lambda: deserialize_value(json_str), iterations)
+    json_size = len(json_str.encode("utf-8"))
+
+    packed, binary_encode = _time(
+        lambda: serialize_value_to_bytes(value, codec=MSGPACK_CODEC_NAME), iterations
+    )
+    binary_value, binary_decode = _time(lambda: deserialize_value_from_bytes(packed), iterations)
+    assert binary_value == deserialize_value(json_str)
+
+    table = Table(title=name)
+    for column in ["format", "size (bytes)", "encode (s)", "decode (s)"]:
+        table.add_column(column)
+    table.add_row("json", f"{json_size:,}", f"{json_encode:.4f}", f"{json_decode:.4f}")
+    table.add_row(
+        MSGPACK_CODEC_NAME, f"{len(packed):,}", f"{binary_encode:.4f}", f"{binary_decode:.4f}"
+    )
+    table.add_row(
+        "ratio",
+        f"{len(packed) / json_size:.2f}",
+        f"{binary_encode / json_encode:.2f}",
+        f"{binary_decode / json_decode:.2f}",
+    )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.assets_per_layer, args.snapshot_file, args.iterations)
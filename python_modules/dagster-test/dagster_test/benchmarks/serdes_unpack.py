@@ -0,0 +1,95 @@
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dagster import AssetMaterialization, serialize_value
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster_shared.serdes.serdes import _WHITELIST_MAP, UnpackContext
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare the compiled per-class unpack function of a serdes ObjectSerializer against the generic
+field loop, on the fields of an EventLogEntry for an asset materialization.
+"""
+
+parser = argparse.ArgumentParser(prog="serdes_unpack", description=DESC)
+parser.add_argument("--num-unpacks", type=int, default=2000)
+parser.add_argument("--iterations", type=int, default=5)
+
+
+def build_event_log_entry() -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id="run_id",
+        timestamp=1.0,
+        step_key="step",
+        job_name="job",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "job",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key="asset", metadata={"rows": 1})
+            ),
+            step_key="step",
+        ),
+    )
+
+
+def _time(unpack_fn: Callable[..., Any], unpacked_dict: dict, num_unpacks: int, iterations: int):
+    timings = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for _ in range(num_unpacks):
+            result = unpack_fn(dict(unpacked_dict), _WHITELIST_MAP, UnpackContext())
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_unpacks: int, iterations: int):
+    console = Console()
+    entry = build_event_log_entry()
+    # the EventLogEntry fields as they are passed to its serializer during deserialization, i.e.
+    # with nested objects already unpacked
+    unpacked_dict = {
+        **json.loads(serialize_value(entry)),
+        "dagster_event": entry.dagster_event,
+    }
+    serializer = _WHITELIST_MAP.object_serializers["EventLogEntry"]
+
+    compiled_result, compiled_time = _time(
+        serializer._compiled_unpack,  # noqa: SLF001
+        unpacked_dict,
+        num_unpacks,
+        iterations,
+    )
+    generic_result, generic_time = _time(
+        serializer._unpack_fields,  # noqa: SLF001
+        unpacked_dict,
+        num_unpacks,
+        iterations,
+    )
+    assert compiled_result == generic_result == entry
+
+    table = Table(title=f"EventLogEntry unpack ({num_unpacks} unpacks, best of {iterations})")
+    for column in ["unpack", "time (s)", "ratio"]:
+        table.add_column(column)
+    table.add_row("field loop", f"{generic_time:.4f}", "1.00")
+    table.add_row("compiled", f"{compiled_time:.4f}", f"{compiled_time / generic_time:.2f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_unpacks, args.iterations)
@@ -0,0 +1,94 @@
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dagster import HourlyPartitionsDefinition, TimeWindowPartitionsDefinition
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Time partition key lookups on an hourly TimeWindowPartitionsDefinition, with and without the
+closed-form mapping between partition keys and indexes.
+
+Without the closed form, every lookup iterates the cron schedule from the start of the partitions
+definition, so lookups for recent partitions get slower as the definition gets longer.
+"""
+
+parser = argparse.ArgumentParser(prog="time_window_partitions", description=DESC)
+parser.add_argument("--years", type=int, default=10)
+parser.add_argument("--timezone", type=str, default="America/New_York")
+parser.add_argument("--num-lookups", type=int, default=100)
+parser.add_argument("--page-size", type=int, default=100)
+
+
+def _time(fn: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _iterative(partitions_def: TimeWindowPartitionsDefinition) -> TimeWindowPartitionsDefinition:
+    # disable the closed form by pre-populating its cached property
+    partitions_def.__dict__["_closed_form_tick_index"] = None
+    return partitions_def
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(years: int, timezone: str, num_lookups: int, page_size: int):
+    console = Console()
+    start_year = 2025 - years
+    end_date = "2025-01-01-00:00"
+
+    def build() -> TimeWindowPartitionsDefinition:
+        return HourlyPartitionsDefinition(
+            start_date=f"{start_year}-01-01-00:00", end_date=end_date, timezone=timezone
+        )
+
+    all_keys = build().get_partition_keys()
+    num_partitions = len(all_keys)
+    console.print(f"Benchmarking {num_partitions:,} hourly partitions in {timezone}")
+
+    rng = random.Random(0)
+    lookup_keys = rng.sample(all_keys, num_lookups)
+    page_start = num_partitions - page_size
+
+    benchmarks: dict[str, Callable[[TimeWindowPartitionsDefinition], Any]] = {
+        "get_partition_keys_between_indexes (last page)": lambda pd: (
+            pd.get_partition_keys_between_indexes(page_start, num_partitions)
+        ),
+        f"has_partition_key (x{num_lookups})": lambda pd: [
+            pd.has_partition_key(key) for key in lookup_keys
+        ],
+        f"time_window_for_partition_key (x{num_lookups})": lambda pd: [
+            pd.time_window_for_partition_key(key) for key in lookup_keys
+        ],
+        f"time_windows_for_partition_keys ({num_lookups} keys)": lambda pd: (
+            pd.time_windows_for_partition_keys(frozenset(lookup_keys))
+        ),
+    }
+
+    table = Table(title=f"{num_partitions:,} hourly partitions")
+    for column in ["operation", "iterative (s)", "closed form (s)", "speedup"]:
+        table.add_column(column)
+    for name, fn in benchmarks.items():
+        iterative_result, iterative_time = _time(lambda: fn(_iterative(build())))
+        closed_form_result, closed_form_time = _time(lambda: fn(build()))
+        assert iterative_result == closed_form_result, name
+        table.add_row(
+            name,
+            f"{iterative_time:.4f}",
+            f"{closed_form_time:.4f}",
+            f"{iterative_time / closed_form_time:.0f}x",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.years, args.timezone, args.num_lookups, args.page_size)
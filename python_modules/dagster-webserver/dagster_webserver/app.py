@@ -4,6 +4,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from starlette.applications import Starlette
 
+from dagster_webserver.graphql import DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS, GraphQLExecutionMode
 from dagster_webserver.webserver import DagsterWebserver
 
 
@@ -11,6 +12,8 @@ def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: int | None = None,
+    graphql_execution_mode: GraphQLExecutionMode = GraphQLExecutionMode.THREAD,
+    graphql_max_blocking_threads: int = DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
@@ -34,4 +37,6 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        graphql_execution_mode=graphql_execution_mode,
+        graphql_max_blocking_threads=graphql_max_blocking_threads,
     ).create_asgi_app(**kwargs)
@@ -28,6 +28,7 @@
 from dagster_shared.ipc import interrupt_on_ipc_shutdown_message
 
 from dagster_webserver.app import create_app_from_workspace_process_context
+from dagster_webserver.graphql import DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS, GraphQLExecutionMode
 from dagster_webserver.version import __version__
 
 
@@ -192,6 +193,27 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--graphql-execution-mode",
+    help=(
+        "How GraphQL requests are executed. `thread` runs each request on its own worker thread"
+        " and event loop. `event_loop` runs requests on the server's event loop and dispatches"
+        " their blocking calls to a thread pool shared between requests."
+    ),
+    type=click.Choice([mode.value for mode in GraphQLExecutionMode], case_sensitive=False),
+    default=GraphQLExecutionMode.THREAD.value,
+    show_default=True,
+)
+@click.option(
+    "--graphql-max-blocking-threads",
+    help=(
+        "The maximum number of threads used for the blocking calls of GraphQL requests, when"
+        " using the `event_loop` GraphQL execution mode."
+    ),
+    type=click.INT,
+    default=DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
+    show_default=True,
+)
 @click.option(
     "--shutdown-pipe",
     type=click.INT,
@@ -216,6 +238,8 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: str | None,
     live_data_poll_rate: int,
+    graphql_execution_mode: str,
+    graphql_max_blocking_threads: int,
     shutdown_pipe: int | None,
     **other_opts: object,
 ):
@@ -265,6 +289,8 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                graphql_execution_mode=GraphQLExecutionMode(graphql_execution_mode.lower()),
+                graphql_max_blocking_threads=graphql_max_blocking_threads,
             )
 
 
@@ -288,6 +314,8 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: int | None = None,
+    graphql_execution_mode: GraphQLExecutionMode = GraphQLExecutionMode.THREAD,
+    graphql_max_blocking_threads: int = DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -300,7 +328,12 @@ def host_dagster_ui_with_workspace_process_context(
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        graphql_execution_mode=graphql_execution_mode,
+        graphql_max_blocking_threads=graphql_max_blocking_threads,
+        lifespan=_lifespan,
     )
 
     if not port:
@@ -1,17 +1,24 @@
+import sys
+import time
 from abc import ABC, abstractmethod
-from asyncio import Task, get_event_loop, run
-from collections.abc import AsyncGenerator, Collection, Iterator, Sequence
-from contextlib import AbstractContextManager, contextmanager
+from asyncio import Lock, Task, get_event_loop, get_running_loop, run
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Collection, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from contextvars import Context, copy_context
 from enum import Enum
-from inspect import isawaitable
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 import dagster._check as check
+from dagster._core.loader import blocking_batch_load_runner
 from dagster._serdes import pack_value
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster_graphql.implementation.utils import ErrorCapture
 from dagster_shared.seven import json
 from graphene import Schema
+from graphene.types.resolver import dict_or_attr_resolver
 from graphql import (
     ASTValidationRule,
     GraphQLError,
@@ -22,6 +29,7 @@
     validate,
 )
 from graphql.execution import ExecutionResult
+from graphql.type import GraphQLResolveInfo
 from starlette import status
 from starlette.applications import Starlette
 from starlette.concurrency import run_in_threadpool
@@ -53,17 +61,55 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+class GraphQLExecutionMode(str, Enum):
+    """How GraphQL queries and mutations are executed by the server.
+
+    THREAD: each request is executed on its own worker thread, in a new event loop.
+    EVENT_LOOP: requests are executed on the server's event loop, with their blocking calls
+        dispatched to a bounded thread pool shared between requests.
+    """
+
+    THREAD = "thread"
+    EVENT_LOOP = "event_loop"
+
+
+# matches the default number of worker threads that starlette runs requests on in THREAD mode
+DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS = 40
+
+GRAPHQL_EXECUTION_METRICS_HEADER = "x-dagster-graphql-execution"
+
 TRequestContext = TypeVar("TRequestContext", bound=AbstractContextManager)
+T = TypeVar("T")
 
 
 class GraphQLServer(ABC, Generic[TRequestContext]):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(
+        self,
+        app_path_prefix: str = "",
+        graphql_execution_mode: GraphQLExecutionMode = GraphQLExecutionMode.THREAD,
+        graphql_max_blocking_threads: int = DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
+    ):
         self._app_path_prefix = app_path_prefix
+        self._graphql_execution_mode = check.inst_param(
+            graphql_execution_mode, "graphql_execution_mode", GraphQLExecutionMode
+        )
 
         self._graphene_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
         self._graphql_validation_rules = self.build_graphql_validation_rules()
 
+        self._blocking_executor = (
+            ThreadPoolExecutor(
+                max_workers=check.int_param(
+                    graphql_max_blocking_threads, "graphql_max_blocking_threads"
+                ),
+                thread_name_prefix="dagster-webserver-graphql",
+            )
+            if graphql_execution_mode == GraphQLExecutionMode.EVENT_LOOP
+            else None
+        )
+        self._num_in_flight_requests = 0
+
     @abstractmethod
     def build_graphql_schema(self) -> Schema: ...
 
@@ -88,6 +134,29 @@ def request_context(self, conn: HTTPConnection) -> Iterator[TRequestContext]:
         with self._make_request_context(conn) as request_context:
             yield request_context
 
+    @asynccontextmanager
+    async def gen_request_context_on_runner(
+        self, conn: HTTPConnection, runner: "BlockingCallRunner", context: Context
+    ) -> AsyncIterator[TRequestContext]:
+        """Like request_context, but enters and exits the request context with the given runner,
+        since creating it (e.g. loading the workspace snapshot) can block. Both run in the given
+        context, so the context vars set on enter are visible to code run in (a copy of) it.
+        """
+        context_manager = self.request_context(conn)
+        request_context = await runner.run_in_context(context, context_manager.__enter__)
+        try:
+            yield request_context
+        except BaseException:
+            if not await runner.run_in_context(context, context_manager.__exit__, *sys.exc_info()):
+                raise
+        else:
+            await runner.run_in_context(context, context_manager.__exit__, None, None, None)
+
+    def shutdown(self) -> None:
+        """Releases the resources held by the server, once the app has stopped serving requests."""
+        if self._blocking_executor:
+            self._blocking_executor.shutdown(wait=False, cancel_futures=True)
+
     def handle_graphql_errors(self, errors: Sequence[GraphQLError]):
         results = []
         for err in errors:
@@ -238,6 +307,14 @@ async def execute_graphql_request(
         variables: dict[str, Any] | None,
         operation_name: str | None,
     ) -> JSONResponse:
+        if self._graphql_execution_mode == GraphQLExecutionMode.EVENT_LOOP:
+            return await self.execute_graphql_request_on_event_loop(
+                request=request,
+                query=query,
+                variables=variables,
+                operation_name=operation_name,
+            )
+
         # run each query in a separate thread, as much of the schema is sync/blocking
         # use execute_async to allow async resolvers to facilitate dataloader pattern
         return await run_in_threadpool(
@@ -248,6 +325,51 @@ async def execute_graphql_request(
             operation_name=operation_name,
         )
 
+    async def execute_graphql_request_on_event_loop(
+        self,
+        request: Request,
+        query: str,
+        variables: dict[str, Any] | None,
+        operation_name: str | None,
+    ) -> JSONResponse:
+        # run the query on the server's event loop, so that dataloaders can batch across all of
+        # the resolvers that are awaiting in parallel, and hand off the blocking parts of the
+        # request to the shared thread pool:
+        # * entering and exiting the request context
+        # * sync resolvers, other than the default ones that read an attribute of their parent
+        # * the batch loads of Loadable objects
+        runner = BlockingCallRunner(check.not_none(self._blocking_executor))
+        self._num_in_flight_requests += 1
+        num_in_flight_requests = self._num_in_flight_requests
+        runner_token = blocking_batch_load_runner.set(runner.run)
+        try:
+            context = copy_context()
+            async with self.gen_request_context_on_runner(
+                request, runner, context
+            ) as request_context:
+                # the task runs in a copy of the context that the request context was entered in
+                response = await context.run(
+                    get_running_loop().create_task,
+                    self.gen_graphql_response(
+                        request_context=request_context,
+                        query=query,
+                        variables=variables,
+                        operation_name=operation_name,
+                        middleware=[BlockingResolverMiddleware(runner)],
+                    ),
+                )
+        finally:
+            blocking_batch_load_runner.reset(runner_token)
+            self._num_in_flight_requests -= 1
+
+        response.headers[GRAPHQL_EXECUTION_METRICS_HEADER] = json.dumps(
+            {
+                "inFlightRequests": num_in_flight_requests,
+                **runner.get_metrics(),
+            }
+        )
+        return response
+
     def graphql_execution_thread(
         self,
         request: Request,
@@ -271,6 +393,7 @@ async def gen_graphql_response(
         query: str,
         variables: dict[str, Any] | None,
         operation_name: str | None,
+        middleware: Sequence[Any] | None = None,
     ) -> JSONResponse:
         # Parse
         try:
@@ -308,7 +431,7 @@ async def gen_graphql_response(
                 context_value=request_context,
                 variable_values=variables,
                 operation_name=operation_name,
-                middleware=self._graphql_middleware,
+                middleware=[*self._graphql_middleware, *(middleware or [])],
             )
             if isawaitable(gql_result):
                 gql_result = await gql_result
@@ -365,9 +488,23 @@ def create_asgi_app(
         self,
         **kwargs,
     ) -> Starlette:
+        lifespan = kwargs.pop("lifespan", None)
+
+        @asynccontextmanager
+        async def _lifespan(app: Starlette) -> AsyncIterator[Any]:
+            try:
+                if lifespan is None:
+                    yield
+                else:
+                    async with lifespan(app) as state:
+                        yield state
+            finally:
+                self.shutdown()
+
         return Starlette(
             routes=self.build_routes(),
             middleware=self.build_middleware(),
+            lifespan=_lifespan,
             **kwargs,
         )
 
@@ -400,6 +537,88 @@ def _determine_status_code(
         return status.HTTP_200_OK
 
 
+class BlockingCallRunner:
+    """Runs the blocking calls made while executing a single GraphQL request on a thread pool that
+    is shared between requests, keeping track of how long those calls spend waiting for a free
+    thread and running.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self._executor = executor
+        self._num_calls = 0
+        self._queued_seconds = 0.0
+        self._running_seconds = 0.0
+        self._max_queued_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # propagate context vars, like the traced call counter, to the worker thread
+        return await self.run_in_context(copy_context(), fn, *args, **kwargs)
+
+    async def run_in_context(
+        self, context: Context, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        submitted_at = time.perf_counter()
+
+        def _run() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = context.run(fn, *args, **kwargs)
+            return result, started_at, time.perf_counter()
+
+        self._num_calls += 1
+        result, started_at, finished_at = await get_running_loop().run_in_executor(
+            self._executor, _run
+        )
+        self._queued_seconds += started_at - submitted_at
+        self._max_queued_seconds = max(self._max_queued_seconds, started_at - submitted_at)
+        self._running_seconds += finished_at - started_at
+        return result
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "blockingCalls": self._num_calls,
+            "blockingQueuedMs": round(self._queued_seconds * 1000, 3),
+            "blockingMaxQueuedMs": round(self._max_queued_seconds * 1000, 3),
+            "blockingRunningMs": round(self._running_seconds * 1000, 3),
+        }
+
+
+class BlockingResolverMiddleware:
+    """GraphQL middleware that moves the resolution of sync fields off of the event loop.
+
+    Fields resolved by the default resolver, which reads an attribute of the parent object, and
+    async resolvers stay on the event loop. The other sync fields of the same request are resolved
+    one at a time, as they would be if the request was executed on its own thread.
+    """
+
+    def __init__(self, runner: BlockingCallRunner):
+        self._runner = runner
+        self._lock = Lock()
+
+    def resolve(self, next_: Callable[..., Any], root: Any, info: GraphQLResolveInfo, **args: Any):
+        # meta fields like __typename are not in the fields of the parent type
+        field = info.parent_type.fields.get(info.field_name)
+        resolver = field.resolve if field else None
+        if (
+            resolver is None
+            or (isinstance(resolver, partial) and resolver.func is dict_or_attr_resolver)
+            or iscoroutinefunction(resolver)
+        ):
+            return next_(root, info, **args)
+
+        return self._resolve_blocking_field(next_, root, info, **args)
+
+    async def _resolve_blocking_field(
+        self, next_: Callable[..., Any], root: Any, info: GraphQLResolveInfo, **args: Any
+    ) -> Any:
+        async with self._lock:
+            result = await self._runner.run(next_, root, info, **args)
+
+        if isawaitable(result):
+            result = await result
+
+        return result
+
+
 async def _handle_async_results(results: AsyncGenerator, operation_id: str, websocket: WebSocket):
     try:
         async for result in results:
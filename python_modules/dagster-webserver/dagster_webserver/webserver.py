@@ -40,7 +40,11 @@
     handle_report_asset_materialization_request,
     handle_report_asset_observation_request,
 )
-from dagster_webserver.graphql import GraphQLServer
+from dagster_webserver.graphql import (
+    DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
+    GraphQLExecutionMode,
+    GraphQLServer,
+)
 from dagster_webserver.version import __version__
 
 mimetypes.init()
@@ -62,11 +66,17 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: int | None = None,
         uses_app_path_prefix: bool = True,
+        graphql_execution_mode: GraphQLExecutionMode = GraphQLExecutionMode.THREAD,
+        graphql_max_blocking_threads: int = DEFAULT_GRAPHQL_MAX_BLOCKING_THREADS,
     ) -> None:
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        super().__init__(
+            app_path_prefix,
+            graphql_execution_mode=graphql_execution_mode,
+            graphql_max_blocking_threads=graphql_max_blocking_threads,
+        )
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -2,6 +2,7 @@
 from dagster import DagsterInstance, __version__
 from dagster._cli.workspace.cli_target import WorkspaceOpts, workspace_opts_to_load_target
 from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster_webserver.graphql import GraphQLExecutionMode
 from dagster_webserver.webserver import DagsterWebserver
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -56,3 +57,20 @@ def read_only_test_client(instance):
 
     app = TestDagsterWebserver(process_context).create_asgi_app(debug=True)
     return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def event_loop_test_client(instance):
+    process_context = WorkspaceProcessContext(
+        instance=instance,
+        version=__version__,
+        read_only=False,
+        workspace_load_target=workspace_opts_to_load_target(
+            WorkspaceOpts(empty_workspace=True),
+        ),
+    )
+
+    app = TestDagsterWebserver(
+        process_context, graphql_execution_mode=GraphQLExecutionMode.EVENT_LOOP
+    ).create_asgi_app(debug=True)
+    return TestClient(app)
@@ -4,16 +4,24 @@
 import pytest
 from dagster import (
     __version__ as dagster_version,
+    _check as check,
     job,
     op,
 )
+from dagster._cli.workspace.cli_target import WorkspaceOpts, workspace_opts_to_load_target
 from dagster._core.events import DagsterEventType
+from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._serdes import unpack_value
 from dagster._utils.error import SerializableErrorInfo
 from dagster_graphql.version import __version__ as dagster_graphql_version
 from dagster_shared.seven import json
-from dagster_webserver.graphql import GraphQLWS
+from dagster_webserver.graphql import (
+    GRAPHQL_EXECUTION_METRICS_HEADER,
+    GraphQLExecutionMode,
+    GraphQLWS,
+)
 from dagster_webserver.version import __version__ as dagster_webserver_version
+from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
 EVENT_LOG_SUBSCRIPTION = """
@@ -291,6 +299,73 @@ def test_async(test_client: TestClient):
     assert result["data"]["test"]["two"] == "slept concurrently", result
 
 
+def test_graphql_event_loop_execution(instance, event_loop_test_client: TestClient):
+    run_id = _add_run(instance)
+
+    response = event_loop_test_client.post(
+        "/graphql",
+        json={"query": RUN_QUERY, "variables": {"runId": run_id}},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"pipelineRunOrError": {"__typename": "Run", "id": run_id}}}
+
+    # the blocking calls of the request are run on the shared thread pool, and reported on the
+    # response
+    metrics = json.loads(response.headers[GRAPHQL_EXECUTION_METRICS_HEADER])
+    assert metrics["inFlightRequests"] == 1
+    assert metrics["blockingCalls"] >= 1
+    assert metrics["blockingQueuedMs"] >= 0
+    assert metrics["blockingRunningMs"] > 0
+
+    # async resolvers still run concurrently
+    response = event_loop_test_client.post(
+        "/graphql",
+        params={"query": "{test{one: asyncString, two: asyncString}}"},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["data"]["test"]["one"] == "slept", result
+    assert result["data"]["test"]["two"] == "slept concurrently", result
+
+    # errors are reported as they are when executing on a thread
+    response = event_loop_test_client.post(
+        "/graphql",
+        params={"query": "{test{alwaysException}}"},
+    )
+    assert response.status_code == 500, response.text
+    assert response.json()["errors"][0]["extensions"]["errorInfo"]
+
+    # sync resolvers of nested fields are run on the thread pool too, while fields that read an
+    # attribute of their parent stay on the event loop
+    def _get_blocking_calls(query: str) -> int:
+        response = event_loop_test_client.post("/graphql", params={"query": query})
+        return json.loads(response.headers[GRAPHQL_EXECUTION_METRICS_HEADER])["blockingCalls"]
+
+    assert (
+        _get_blocking_calls("{test{one: alwaysException, two: alwaysException}}")
+        == _get_blocking_calls("{test{__typename}}") + 2
+    )
+
+
+def test_graphql_event_loop_shutdown(instance):
+    process_context = WorkspaceProcessContext(
+        instance=instance,
+        version=dagster_version,
+        read_only=False,
+        workspace_load_target=workspace_opts_to_load_target(WorkspaceOpts(empty_workspace=True)),
+    )
+    webserver = DagsterWebserver(
+        process_context, graphql_execution_mode=GraphQLExecutionMode.EVENT_LOOP
+    )
+    with TestClient(webserver.create_asgi_app()) as client:
+        response = client.post("/graphql", params={"query": "{test{asyncString}}"})
+        assert response.status_code == 200, response.text
+
+    # the blocking thread pool is shut down with the app
+    with pytest.raises(RuntimeError, match="shutdown"):
+        check.not_none(webserver._blocking_executor).submit(lambda: None)  # noqa: SLF001
+
+
 def test_download_captured_logs_not_found(test_client: TestClient):
     response = test_client.get("/logs/does-not-exist/stdout")
     assert response.status_code == 404
@@ -11,13 +11,17 @@
     from dagster._grpc.types import ListRepositoriesResponse
 
 
-def sync_list_repositories_grpc(api_client: "DagsterGrpcClient") -> "ListRepositoriesResponse":
+def sync_list_repositories_grpc(
+    api_client: "DagsterGrpcClient", include_repository_snapshot_ids: bool = False
+) -> "ListRepositoriesResponse":
     from dagster._grpc.client import DagsterGrpcClient
     from dagster._grpc.types import ListRepositoriesResponse
 
     check.inst_param(api_client, "api_client", DagsterGrpcClient)
     result = deserialize_value(
-        api_client.list_repositories(),
+        api_client.list_repositories(
+            include_repository_snapshot_ids=include_repository_snapshot_ids
+        ),
         (ListRepositoriesResponse, SerializableErrorInfo),
     )
     if isinstance(result, SerializableErrorInfo):
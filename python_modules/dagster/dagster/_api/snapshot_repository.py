@@ -1,7 +1,7 @@
 import os
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -11,38 +11,64 @@
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation.code_location import CodeLocation
+    from dagster._core.remote_representation.repository_snapshot_cache import (
+        RepositorySnapshotCache,
+    )
     from dagster._core.snap import JobSnap
     from dagster._grpc.client import DagsterGrpcClient
 
 
 def sync_get_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation", defer_snapshots: bool
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool,
+    snapshot_ids: Mapping[str, str] | None = None,
+    snapshot_cache: Optional["RepositorySnapshotCache"] = None,
 ) -> Mapping[str, tuple[RepositorySnap, Mapping[str, "JobSnap"]]]:
+    """Fetches the snapshot of each repository in the code location, along with the job snapshots
+    of the repository if they are deferred.
+
+    If the code server reported a snapshot id for a repository and a snapshot cache is given, the
+    snapshots are loaded from the cache when possible, and added to it after they are fetched.
+    """
     from dagster._core.remote_origin import RemoteRepositoryOrigin
     from dagster._core.remote_representation.code_location import CodeLocation
     from dagster._core.remote_representation.external_data import (
         extract_serialized_job_snap_from_serialized_job_data_snap,
     )
+    from dagster._core.remote_representation.repository_snapshot_cache import (
+        get_repository_snapshot_id,
+    )
     from dagster._core.snap import JobSnap
 
     check.inst_param(code_location, "code_location", CodeLocation)
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        # snapshot ids identify the snapshot with deferred job snapshots
+        snapshot_id = (
+            snapshot_ids.get(repository_name)
+            if snapshot_ids and snapshot_cache and defer_snapshots
+            else None
+        )
+        if snapshot_cache and snapshot_id:
+            cache_entry = snapshot_cache.get(snapshot_id)
+            if cache_entry:
+                repo_datas[repository_name] = cache_entry.repository_snap, cache_entry.job_snaps
+                continue
+
         repo_origin = RemoteRepositoryOrigin(
             code_location.origin,
             repository_name,
         )
-        result = deserialize_value(
-            api_client.external_repository(
-                remote_repository_origin=RemoteRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                ),
-                defer_snapshots=defer_snapshots,
+        serialized_result = api_client.external_repository(
+            remote_repository_origin=RemoteRepositoryOrigin(
+                code_location.origin,
+                repository_name,
             ),
-            (RepositorySnap, RepositoryErrorSnap),
+            defer_snapshots=defer_snapshots,
         )
+        result = deserialize_value(serialized_result, (RepositorySnap, RepositoryErrorSnap))
 
         if isinstance(result, RepositoryErrorSnap):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
@@ -84,5 +110,14 @@ def sync_get_external_repositories_data_grpc(
 
                 job_snaps[job_ref.name] = job_snap
 
+        # only cache the snapshot if it is the one the id was reported for, since the code server
+        # may have reloaded its definitions in the meantime
+        if (
+            snapshot_cache
+            and snapshot_id
+            and get_repository_snapshot_id(serialized_result) == snapshot_id
+        ):
+            snapshot_cache.set(snapshot_id, result, job_snaps)
+
         repo_datas[repository_name] = result, job_snaps
     return repo_datas
@@ -66,6 +66,12 @@ def partitions_def(self) -> PartitionsDefinition | None:
     def convert_to_serializable_subset(self) -> SerializableEntitySubset[T_EntityKey]:
         return SerializableEntitySubset(key=self._key, value=self._value)
 
+    def get_summary_str(self, max_items: int = 5) -> str:
+        """Returns a compact description of the subset for logging, without computing every
+        partition key in the subset. See `PartitionsSubset.get_summary_str`.
+        """
+        return self.convert_to_serializable_subset().get_summary_str(max_items)
+
     def expensively_compute_partition_keys(self) -> AbstractSet[str]:
         internal_value = self.get_internal_value()
         if isinstance(internal_value, PartitionsSubset):
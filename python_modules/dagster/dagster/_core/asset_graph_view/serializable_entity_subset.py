@@ -135,6 +135,14 @@ def is_empty(self) -> bool:
         else:
             return not self.bool_value
 
+    def get_summary_str(self, max_items: int = 5) -> str:
+        """Returns a compact description of the subset for logging. See
+        `PartitionsSubset.get_summary_str`.
+        """
+        if self.is_partitioned:
+            return self.subset_value.get_summary_str(max_items)
+        return "(no partition)" if self.bool_value else "(empty)"
+
     def is_compatible_with_partitions_def(
         self, partitions_def: PartitionsDefinition | None
     ) -> bool:
@@ -1,3 +1,5 @@
+import functools
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.error.ErrorListener import ErrorListener
 
@@ -253,3 +255,26 @@ def tree_str(self) -> str:
     @property
     def asset_selection(self) -> AssetSelection:
         return self._asset_selection
+
+
+# Bounds the number of selection strings whose parsed selections are kept in memory. Sensors,
+# schedules and the webserver resolve the same strings repeatedly, and parsing them with the
+# pure-Python ANTLR runtime is much slower than resolving them.
+ASSET_SELECTION_PARSE_CACHE_SIZE = 2048
+
+
+def parse_asset_selection_string(
+    selection_str: str, include_sources: bool = False
+) -> AssetSelection:
+    """Parses a selection string into an AssetSelection, reusing the result for repeated strings.
+
+    Asset selections are immutable, so the same instance can be shared by every caller. Strings
+    that fail to parse are not cached.
+    """
+    return _parse_asset_selection_string(selection_str, include_sources)
+
+
+# the arguments are always passed positionally, as lru_cache keys keyword arguments separately
+@functools.lru_cache(maxsize=ASSET_SELECTION_PARSE_CACHE_SIZE)
+def _parse_asset_selection_string(selection_str: str, include_sources: bool) -> AssetSelection:
+    return AntlrAssetSelectionParser(selection_str, include_sources).asset_selection
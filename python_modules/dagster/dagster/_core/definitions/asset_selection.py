@@ -25,13 +25,7 @@
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.definitions.source_asset import SourceAsset
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
-from dagster._core.storage.tags import KIND_PREFIX
+from dagster._core.selector.subset_selector import fetch_sinks, fetch_sources, parse_clause
 from dagster._record import copy, record
 
 CoercibleToAssetSelection: TypeAlias = Union[
@@ -528,11 +522,11 @@ def resolve_checks_inner(
     @beta_param(param="include_sources")
     def from_string(cls, string: str, include_sources=False) -> "AssetSelection":
         from dagster._core.definitions.antlr_asset_selection.antlr_asset_selection import (
-            AntlrAssetSelectionParser,
+            parse_asset_selection_string,
         )
 
         try:
-            return AntlrAssetSelectionParser(string, include_sources).asset_selection
+            return parse_asset_selection_string(string, include_sources)
         except:
             pass
         if string == "*":
@@ -914,12 +908,7 @@ def resolve_inner(
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
         return operator.sub(
-            (
-                selection
-                | fetch_connected(
-                    selection, asset_graph.asset_dep_graph, direction="downstream", depth=self.depth
-                )
-            ),
+            asset_graph.fetch_connected_asset_keys(selection, "downstream", depth=self.depth),
             selection if not self.include_self else set(),
         )
 
@@ -984,11 +973,12 @@ def resolve_inner(
     ) -> AbstractSet[AssetKey]:
         regex = _wildcard_to_regex(self.selected_group_wildcard)
         return {
-            node.key
-            for node in asset_graph.asset_nodes
-            if node.group_name is not None
-            and regex.match(node.group_name)
-            and (self.include_sources or node.is_materializable)
+            key
+            for group_name in asset_graph.all_group_names
+            if regex.match(group_name)
+            for key in asset_graph.asset_keys_for_group(
+                group_name, require_materializable=not self.include_sources
+            )
         }
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
@@ -1009,24 +999,12 @@ def resolve_inner(
         asset_graph: BaseAssetGraph,
         allow_missing: bool,
     ) -> AbstractSet[AssetKey]:
-        base_nodes = {
-            node.key: node
-            for node in asset_graph.asset_nodes
-            if self.include_sources or node.is_materializable
-        }
-
         if self.kind_str is None:
-            return {
-                node.key
-                for node in base_nodes.values()
-                if (not any(tag_key.startswith(KIND_PREFIX) for tag_key in (node.tags or {})))
-            }
+            keys = asset_graph.asset_keys_without_kinds
         else:
-            return {
-                key
-                for key, node in base_nodes.items()
-                if node.tags.get(f"{KIND_PREFIX}{self.kind_str}") is not None
-            }
+            keys = asset_graph.asset_keys_by_kind.get(self.kind_str, frozenset())
+
+        return keys if self.include_sources else keys & asset_graph.materializable_asset_keys
 
     def to_selection_str(self) -> str:
         if self.kind_str is None:
@@ -1054,10 +1032,11 @@ class IsAttributeAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
+        # copied, since the graph's cached key sets are shared by every caller
         if self.attribute == "external":
-            return {node.key for node in asset_graph.asset_nodes if node.is_external}
+            return set(asset_graph.external_asset_keys)
         if self.attribute == "materializable":
-            return {node.key for node in asset_graph.asset_nodes if node.is_materializable}
+            return set(asset_graph.materializable_asset_keys)
         raise DagsterInvalidSubsetError(
             f"Unsupported 'is:' attribute value {self.attribute!r}. "
             f"Supported values are: {sorted(IS_ATTRIBUTE_VALUES)}."
@@ -1077,13 +1056,8 @@ class TagAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        base_nodes = {
-            node.key: node
-            for node in asset_graph.asset_nodes
-            if self.include_sources or node.is_materializable
-        }
-
-        return {key for key, node in base_nodes.items() if node.tags.get(self.key) == self.value}
+        keys = asset_graph.get_asset_keys_for_tag(self.key, self.value)
+        return keys if self.include_sources else keys & asset_graph.materializable_asset_keys
 
     def to_selection_str(self) -> str:
         if self.value:
@@ -1100,7 +1074,9 @@ class OwnerAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        return {node.key for node in asset_graph.asset_nodes if self.selected_owner in node.owners}
+        if self.selected_owner is None:
+            return set()
+        return asset_graph.asset_keys_by_owner.get(self.selected_owner, frozenset())
 
     def to_selection_str(self) -> str:
         if self.selected_owner is None:
@@ -1129,29 +1105,11 @@ def resolve_inner(
 
         asset_graph = cast("RemoteAssetGraph", asset_graph)
 
-        location_name = self.selected_code_location
-
-        # If the code location is in the form of "repo_name@location_name", we need to
-        # split the string and filter the asset keys based on the repository and location name.
-        if location_name and "@" in location_name:
-            asset_keys = set()
-            location = location_name.split("@")[1]
-            name = location_name.split("@")[0]
-            for asset_key, node in asset_graph.remote_asset_nodes_by_key.items():
-                repo_handle = node.resolve_to_singular_repo_scoped_node().repository_handle
-                if repo_handle.location_name == location and repo_handle.repository_name == name:
-                    asset_keys.add(asset_key)
-            return asset_keys
-
-        # Otherwise, filter only by location name
-        return {
-            key
-            for key, node in asset_graph.remote_asset_nodes_by_key.items()
-            if (
-                node.resolve_to_singular_repo_scoped_node().repository_handle.location_name
-                == self.selected_code_location
-            )
-        }
+        # the code location may be either a location name or of the form
+        # "repo_name@location_name", both of which are indexed on the graph
+        if self.selected_code_location is None:
+            return set()
+        return asset_graph.asset_keys_by_code_location.get(self.selected_code_location, frozenset())
 
     def to_selection_str(self) -> str:
         if self.selected_code_location is None:
@@ -1555,9 +1513,17 @@ class KeyWildCardAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
+        if "*" not in self.selected_key_wildcard:
+            return asset_graph.asset_keys_by_user_string.get(
+                self.selected_key_wildcard, frozenset()
+            )
+
         regex = _wildcard_to_regex(self.selected_key_wildcard)
         return {
-            key for key in asset_graph.get_all_asset_keys() if regex.match(key.to_user_string())
+            key
+            for user_string, keys in asset_graph.asset_keys_by_user_string.items()
+            if regex.match(user_string)
+            for key in keys
         }
 
     def to_selection_str(self) -> str:
@@ -1571,12 +1537,7 @@ def _fetch_all_upstream(
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
     return operator.sub(
-        (
-            selection
-            | fetch_connected(
-                selection, asset_graph.asset_dep_graph, direction="upstream", depth=depth
-            )
-        ),
+        asset_graph.fetch_connected_asset_keys(selection, "upstream", depth=depth),
         selection if not include_self else set(),
     )
 
@@ -23,6 +23,10 @@
     EntityKey,
     T_EntityKey,
 )
+from dagster._core.definitions.assets.graph.reachability import (
+    ReachabilityIndex,
+    use_asset_graph_reachability_index,
+)
 from dagster._core.definitions.backfill_policy import BackfillPolicy
 from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.freshness import FreshnessPolicy
@@ -38,7 +42,13 @@
     infer_partition_mapping,
 )
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvalidInvocationError
-from dagster._core.selector.subset_selector import DependencyGraph, fetch_sources
+from dagster._core.selector.subset_selector import (
+    DependencyGraph,
+    Direction,
+    fetch_connected,
+    fetch_sources,
+)
+from dagster._core.storage.tags import KIND_PREFIX
 from dagster._core.utils import toposort
 from dagster._utils.cached_method import cached_method
 
@@ -461,6 +471,23 @@ def toposorted_asset_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
         """
         return [set(level) for level in toposort(self.asset_dep_graph["upstream"])]
 
+    @property
+    @cached_method
+    def reachability_index(self) -> ReachabilityIndex[AssetKey]:
+        return ReachabilityIndex(self.asset_dep_graph, self.toposorted_asset_keys)
+
+    def fetch_connected_asset_keys(
+        self, asset_keys: AbstractSet[AssetKey], direction: Direction, depth: int | None = None
+    ) -> AbstractSet[AssetKey]:
+        """Returns the given asset keys and all asset keys upstream or downstream of them, up to the
+        given depth.
+        """
+        if use_asset_graph_reachability_index():
+            return self.reachability_index.fetch_connected(asset_keys, direction, depth)
+        return asset_keys | fetch_connected(
+            asset_keys, self.asset_dep_graph, direction=direction, depth=depth
+        )
+
     @cached_property
     def unpartitioned_asset_keys(self) -> AbstractSet[AssetKey]:
         return {node.key for node in self.asset_nodes if not node.is_partitioned}
@@ -469,14 +496,77 @@ def unpartitioned_asset_keys(self) -> AbstractSet[AssetKey]:
     def asset_keys_for_group(
         self, group_name: str, require_materializable: bool = False
     ) -> AbstractSet[AssetKey]:
+        keys = self.asset_keys_by_group.get(group_name, frozenset())
         if require_materializable:
-            return {
-                node.key
-                for node in self.asset_nodes
-                if node.group_name == group_name and node.is_materializable
-            }
+            return keys & self.materializable_asset_keys
         else:
-            return {node.key for node in self.asset_nodes if node.group_name == group_name}
+            return set(keys)
+
+    # Inverted indexes from asset attributes to asset keys, used to resolve attribute-based
+    # asset selections without scanning every node. They are built lazily on first access and
+    # live as long as the graph, which is rebuilt whenever its definitions change, and hold
+    # frozensets so that callers cannot mutate them.
+
+    @property
+    @cached_method
+    def asset_keys_by_user_string(self) -> Mapping[str, AbstractSet[AssetKey]]:
+        # distinct keys can share a user string, e.g. AssetKey(["a", "b"]) and AssetKey("a/b")
+        by_user_string = defaultdict(set)
+        for key in self._asset_nodes_by_key:
+            by_user_string[key.to_user_string()].add(key)
+        return {user_string: frozenset(keys) for user_string, keys in by_user_string.items()}
+
+    @property
+    @cached_method
+    def asset_keys_by_group(self) -> Mapping[str, AbstractSet[AssetKey]]:
+        by_group = defaultdict(set)
+        for node in self.asset_nodes:
+            if node.group_name is not None:
+                by_group[node.group_name].add(node.key)
+        return {group_name: frozenset(keys) for group_name, keys in by_group.items()}
+
+    @property
+    @cached_method
+    def asset_keys_by_tag(self) -> Mapping[str, Mapping[str, AbstractSet[AssetKey]]]:
+        """Asset keys indexed by tag key, then by tag value."""
+        by_tag = defaultdict(lambda: defaultdict(set))
+        for node in self.asset_nodes:
+            for tag_key, tag_value in node.tags.items():
+                by_tag[tag_key][tag_value].add(node.key)
+        return {
+            tag_key: {tag_value: frozenset(keys) for tag_value, keys in by_value.items()}
+            for tag_key, by_value in by_tag.items()
+        }
+
+    def get_asset_keys_for_tag(self, key: str, value: str | None = None) -> AbstractSet[AssetKey]:
+        """Returns the keys of assets with the given tag. If value is None, matches any value."""
+        by_value = self.asset_keys_by_tag.get(key, {})
+        if value is None:
+            return frozenset().union(*by_value.values())
+        return by_value.get(value, frozenset())
+
+    @property
+    @cached_method
+    def asset_keys_by_kind(self) -> Mapping[str, AbstractSet[AssetKey]]:
+        return {
+            tag_key[len(KIND_PREFIX) :]: frozenset().union(*by_value.values())
+            for tag_key, by_value in self.asset_keys_by_tag.items()
+            if tag_key.startswith(KIND_PREFIX)
+        }
+
+    @property
+    @cached_method
+    def asset_keys_without_kinds(self) -> AbstractSet[AssetKey]:
+        return frozenset(self._asset_nodes_by_key).difference(*self.asset_keys_by_kind.values())
+
+    @property
+    @cached_method
+    def asset_keys_by_owner(self) -> Mapping[str, AbstractSet[AssetKey]]:
+        by_owner = defaultdict(set)
+        for node in self.asset_nodes:
+            for owner in node.owners:
+                by_owner[owner].add(node.key)
+        return {owner: frozenset(keys) for owner, keys in by_owner.items()}
 
     @cached_method
     def asset_keys_for_partitions_def(
@@ -565,18 +655,8 @@ def get_ancestor_asset_keys(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = set()
-        next_parents = self.get(asset_key).parent_keys - {asset_key}  # remove self-dependencies
-        while next_parents:
-            pending_next_parents = set()
-            for node_key in next_parents:
-                if node_key in ancestors:
-                    continue
-                ancestors.add(node_key)
-                pending_next_parents.update(self.get(node_key).parent_keys)
-
-            next_parents = pending_next_parents
-
+        ancestors = set(self.fetch_connected_asset_keys({asset_key}, "upstream"))
+        ancestors.discard(asset_key)  # remove self-dependencies
         if include_self:
             ancestors.add(asset_key)
         return ancestors
@@ -0,0 +1,154 @@
+import os
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from typing import AbstractSet, Generic  # noqa: UP035
+
+from dagster._core.selector.subset_selector import (
+    MAX_NUM,
+    DependencyGraph,
+    Direction,
+    T_Hashable,
+    fetch_connected,
+)
+
+# A set of nodes, represented as sorted, disjoint, non-adjacent inclusive ranges of postorder
+# numbers
+Intervals = Sequence[tuple[int, int]]
+
+
+def use_asset_graph_reachability_index() -> bool:
+    """Asset graphs answer upstream and downstream queries with a ReachabilityIndex instead of
+    traversing the graph when the DAGSTER_ASSET_GRAPH_REACHABILITY_INDEX environment variable is
+    set.
+    """
+    return os.getenv("DAGSTER_ASSET_GRAPH_REACHABILITY_INDEX", "").lower() in ("1", "true")
+
+
+def _merge_intervals(intervals: Iterable[tuple[int, int]]) -> Intervals:
+    merged: list[tuple[int, int]] = []
+    for low, high in sorted(intervals):
+        if merged and low <= merged[-1][1] + 1:
+            if high > merged[-1][1]:
+                merged[-1] = (merged[-1][0], high)
+        else:
+            merged.append((low, high))
+    return merged
+
+
+class _DirectionalIndex(Generic[T_Hashable]):
+    """Interval labels for the nodes reachable from each node of a DAG in one direction.
+
+    The nodes are numbered in the postorder of a spanning forest of the DAG, so that the nodes in
+    the tree below each node have contiguous numbers. The nodes reachable from a node are the union
+    of its own tree range and the nodes reachable from each of its neighbors, which are merged into
+    as few ranges as possible. For the tree-like graphs that are common in practice, most nodes
+    need only a handful of ranges, so the labels take far less space than a full transitive
+    closure.
+    """
+
+    def __init__(
+        self,
+        neighbors: Mapping[T_Hashable, AbstractSet[T_Hashable]],
+        toposorted_nodes: Sequence[T_Hashable],
+    ):
+        self._nodes_by_number: list[T_Hashable] = []
+        self._number_by_node: dict[T_Hashable, int] = {}
+        tree_low: dict[T_Hashable, int] = {}
+
+        # iterative depth-first search over a spanning forest, visiting nodes in topological order
+        # so that every node is reached through one of its neighbors before it is used as a root
+        visited: set[T_Hashable] = set()
+        for root in toposorted_nodes:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(neighbors.get(root, ())))]
+            tree_low[root] = len(self._nodes_by_number)
+            while stack:
+                node, remaining = stack[-1]
+                for neighbor in remaining:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        tree_low[neighbor] = len(self._nodes_by_number)
+                        stack.append((neighbor, iter(neighbors.get(neighbor, ()))))
+                        break
+                else:
+                    stack.pop()
+                    self._number_by_node[node] = len(self._nodes_by_number)
+                    self._nodes_by_number.append(node)
+
+        # the nodes reachable from each node are known once those of all of its neighbors are, so
+        # label the nodes in the reverse of the order in which the search reaches them
+        self._intervals_by_node: dict[T_Hashable, Intervals] = {}
+        self._height_by_node: dict[T_Hashable, int] = {}
+        for node in reversed(toposorted_nodes):
+            node_neighbors = [neighbor for neighbor in neighbors.get(node, ()) if neighbor != node]
+            self._intervals_by_node[node] = _merge_intervals(
+                [
+                    (tree_low[node], self._number_by_node[node]),
+                    *(
+                        interval
+                        for neighbor in node_neighbors
+                        for interval in self._intervals_by_node[neighbor]
+                    ),
+                ]
+            )
+            self._height_by_node[node] = max(
+                (self._height_by_node[neighbor] + 1 for neighbor in node_neighbors), default=0
+            )
+
+    def height(self, node: T_Hashable) -> int:
+        """The length of the longest path starting at the given node."""
+        return self._height_by_node.get(node, 0)
+
+    def reachable(self, nodes: Iterable[T_Hashable]) -> AbstractSet[T_Hashable]:
+        """Returns all nodes reachable from the given nodes, including the nodes themselves unless
+        they are not in the graph.
+        """
+        intervals = _merge_intervals(
+            interval for node in nodes for interval in self._intervals_by_node.get(node, ())
+        )
+        return {
+            reachable_node
+            for low, high in intervals
+            for reachable_node in self._nodes_by_number[low : high + 1]
+        }
+
+    def is_reachable(self, source: T_Hashable, target: T_Hashable) -> bool:
+        """Returns whether there is a path from source to target, or source is target."""
+        intervals = self._intervals_by_node[source]
+        number = self._number_by_node[target]
+        i = bisect_right(intervals, (number, MAX_NUM)) - 1
+        return i >= 0 and intervals[i][0] <= number <= intervals[i][1]
+
+
+class ReachabilityIndex(Generic[T_Hashable]):
+    """Answers upstream and downstream reachability queries on a DAG without traversing it.
+
+    Queries with a depth limit that may stop short of the full set of reachable nodes fall back to
+    a breadth-first traversal, which only visits the nodes within that depth.
+    """
+
+    def __init__(self, graph: DependencyGraph[T_Hashable], toposorted_nodes: Sequence[T_Hashable]):
+        self._graph = graph
+        self._indexes: dict[Direction, _DirectionalIndex[T_Hashable]] = {
+            "upstream": _DirectionalIndex(graph["upstream"], list(reversed(toposorted_nodes))),
+            "downstream": _DirectionalIndex(graph["downstream"], toposorted_nodes),
+        }
+
+    def fetch_connected(
+        self, nodes: AbstractSet[T_Hashable], direction: Direction, depth: int | None = None
+    ) -> AbstractSet[T_Hashable]:
+        """Returns the given nodes and all nodes connected to them in the given direction, up to
+        the given depth.
+        """
+        if not nodes:
+            return set()
+        index = self._indexes[direction]
+        if depth is not None and depth < max(index.height(node) for node in nodes):
+            return nodes | fetch_connected(nodes, self._graph, direction=direction, depth=depth)
+        return nodes | index.reachable(nodes)
+
+    def is_upstream(self, node: T_Hashable, other: T_Hashable) -> bool:
+        """Returns whether node is upstream of other, or is other."""
+        return self._indexes["downstream"].is_reachable(node, other)
@@ -589,6 +589,16 @@ def _asset_keys_by_normalized_table_name(self) -> Mapping[str, AbstractSet[Asset
 
         return by_table_name
 
+    @cached_property
+    def asset_keys_by_code_location(self) -> Mapping[str, AbstractSet[AssetKey]]:
+        """Asset keys indexed both by location name and by "repository_name@location_name"."""
+        by_code_location = defaultdict(set)
+        for key, node in self.remote_asset_nodes_by_key.items():
+            repo_handle = node.resolve_to_singular_repo_scoped_node().repository_handle
+            by_code_location[repo_handle.location_name].add(key)
+            by_code_location[f"{repo_handle.repository_name}@{repo_handle.location_name}"].add(key)
+        return {location: frozenset(keys) for location, keys in by_code_location.items()}
+
     def get_assets_for_same_storage_address(
         self, asset_key: AssetKey
     ) -> AbstractSet[TRemoteAssetNode]:
@@ -160,7 +160,7 @@ def _get_updated_cursor(
     ) -> AssetDaemonCursor:
         return self.cursor.with_updates(
             evaluation_id=self._evaluation_id,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=self._evaluator.get_new_condition_cursors(results),
             newly_observe_requested_asset_keys=[
                 asset_key
                 for run_request in observe_run_requests
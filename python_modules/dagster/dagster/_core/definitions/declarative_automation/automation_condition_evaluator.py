@@ -2,10 +2,11 @@
 import datetime
 import logging
 import os
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, AbstractSet  # noqa: UP035
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -17,6 +18,15 @@
     AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.incremental_evaluation import (
+    IncrementalEvaluationTracker,
+    get_condition_inputs,
+    is_incremental_evaluation_enabled,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+)
+from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.partitions.context import partition_loading_context
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
@@ -36,6 +46,24 @@ def get_automation_tick_settle_delay_seconds() -> float:
     return float(os.environ.get(AUTOMATION_TICK_SETTLE_SECONDS_ENV_VAR, "0.0"))
 
 
+# Maximum number of entities whose conditions are evaluated concurrently on a tick, which bounds the
+# number of concurrent storage queries issued by the evaluation.
+AUTOMATION_EVALUATION_CONCURRENCY_ENV_VAR = "DAGSTER_AUTOMATION_EVALUATION_CONCURRENCY"
+
+
+def get_automation_evaluation_concurrency() -> int:
+    return max(int(os.environ.get(AUTOMATION_EVALUATION_CONCURRENCY_ENV_VAR, "32")), 1)
+
+
+# Maximum number of partition keys or ranges of partition keys that are logged for each entity's
+# requested subset. The total number of requested partitions is always logged.
+AUTOMATION_LOG_MAX_PARTITION_ITEMS_ENV_VAR = "DAGSTER_AUTOMATION_LOG_MAX_PARTITION_ITEMS"
+
+
+def get_automation_log_max_partition_items() -> int:
+    return max(int(os.environ.get(AUTOMATION_LOG_MAX_PARTITION_ITEMS_ENV_VAR, "5")), 0)
+
+
 class AutomationConditionEvaluator:
     def __init__(
         self,
@@ -49,6 +77,7 @@ def __init__(
         default_condition: AutomationCondition | None = None,
         evaluation_time: datetime.datetime | None = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        incremental: bool | None = None,
     ):
         self.entity_keys: AbstractSet[EntityKey] = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -83,6 +112,16 @@ def __init__(
         self.request_subsets_by_key: dict[EntityKey, EntitySubset] = {}
         self.evaluation_id = evaluation_id
 
+        # when incremental evaluation is enabled, entities whose conditions could not have a
+        # different result than on the previous tick are not evaluated, and their previous cursors
+        # are carried forward
+        self._incremental_tracker = (
+            IncrementalEvaluationTracker(self)
+            if (is_incremental_evaluation_enabled() if incremental is None else incremental)
+            else None
+        )
+        self.reused_cursors_by_key: dict[EntityKey, AutomationConditionCursor] = {}
+
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
         return self.asset_graph_view.get_inner_queryer_for_back_compat()
@@ -116,6 +155,9 @@ def prefetch(self) -> None:
             f"Prefetching asset records for {len(self.asset_records_to_prefetch)} records."
         )
         self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
+        self.instance_queryer.prefetch_latest_materialization_or_observation_records(
+            [AssetKeyPartitionKey(key) for key in self.asset_records_to_prefetch]
+        )
         self.logger.info("Done prefetching asset records.")
 
     def evaluate(
@@ -136,44 +178,161 @@ async def _async_evaluate(
     ) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         self.prefetch()
         num_conditions = len(self.entity_keys)
-        num_evaluated = 0
-
-        async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
-            self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated + offset}/{num_conditions})"
-            )
+        num_started = 0
+        semaphore = asyncio.Semaphore(get_automation_evaluation_concurrency())
+        log_max_partition_items = get_automation_log_max_partition_items()
+
+        async def _evaluate_entity_async(entity_key: EntityKey):
+            nonlocal num_started
+            async with semaphore:
+                num_started += 1
+                self.logger.debug(
+                    f"Evaluating {entity_key.to_user_string()} ({num_started}/{num_conditions})"
+                )
 
-            try:
-                await self.evaluate_entity(entity_key)
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
-                ) from e
+                try:
+                    await self.evaluate_entity(entity_key)
+                except Exception as e:
+                    raise Exception(
+                        f"Error while evaluating conditions for {entity_key.to_user_string()}"
+                    ) from e
 
             result = self.current_results_by_key[entity_key]
             num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
-            else:
-                requested_str = "(no partition)"
             log_fn = self.logger.info if num_requested > 0 else self.logger.debug
             log_fn(
                 f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
+                f"requested ({result.true_subset.get_summary_str(log_max_partition_items)}) "
                 f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
             )
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
-            coroutines = [
-                _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
-            ]
-            await asyncio.gather(*coroutines)
-            num_evaluated += len(coroutines)
-
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
+        # each entity is evaluated as soon as the entities it depends on have been evaluated,
+        # rather than waiting for every entity in the previous topological level
+        dependencies_by_key = self._get_evaluation_dependencies_by_key()
+        num_pending_dependencies = {key: len(deps) for key, deps in dependencies_by_key.items()}
+        dependents_by_key: dict[EntityKey, list[EntityKey]] = defaultdict(list)
+        for key, deps in dependencies_by_key.items():
+            for dep in deps:
+                dependents_by_key[dep].append(key)
+
+        def _complete(key: EntityKey) -> Sequence[EntityKey]:
+            newly_ready = []
+            for dependent in dependents_by_key[key]:
+                num_pending_dependencies[dependent] -= 1
+                if num_pending_dependencies[dependent] == 0:
+                    newly_ready.append(dependent)
+            return newly_ready
+
+        ready = deque(key for key, num in num_pending_dependencies.items() if num == 0)
+        tasks: dict[asyncio.Task, EntityKey] = {}
+        try:
+            while ready or tasks:
+                while ready:
+                    key = ready.popleft()
+                    if self._try_reuse_cursor(key):
+                        ready.extend(_complete(key))
+                    else:
+                        tasks[asyncio.create_task(_evaluate_entity_async(key))] = key
+                if not tasks:
+                    break
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = tasks.pop(task)
+                    # raises if the evaluation failed
+                    task.result()
+                    ready.extend(_complete(key))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        check.invariant(
+            not any(num_pending_dependencies.values()),
+            "Automation condition evaluation dependencies contain a cycle",
+        )
+
+        if self._incremental_tracker is not None:
+            num_skipped = len(self.reused_cursors_by_key)
+            self.logger.info(
+                f"Reused previous evaluations for {num_skipped}/{num_conditions} entities "
+                f"(skip ratio {num_skipped / num_conditions if num_conditions else 0:.2f})."
+            )
+
+        # return results in topological order regardless of the order in which they completed
+        return [
+            self.current_results_by_key[key]
+            for key in dependencies_by_key
+            if key in self.current_results_by_key
+        ], [v for v in self.request_subsets_by_key.values() if not v.is_empty]
+
+    def _get_evaluation_dependencies_by_key(self) -> Mapping[EntityKey, AbstractSet[EntityKey]]:
+        """Returns a mapping from each entity to evaluate to the entities to evaluate that must be
+        evaluated before it, in topological order.
+
+        An entity depends on its nearest evaluated ancestors, so that it sees their requests on this
+        tick. It also depends on the entities in earlier topological levels that it is evaluated
+        alongside (e.g. other assets in a non-subsettable multi-asset) or that its condition refers
+        to directly, which it would always see the results of if entities were evaluated level by
+        level.
+        """
+        level_by_key = {
+            key: level
+            for level, keys in enumerate(self.asset_graph.toposorted_entity_keys_by_level)
+            for key in keys
+        }
+        # the evaluated entities that each entity, evaluated or not, depends on through its parents
+        frontier_by_key: dict[EntityKey, AbstractSet[EntityKey]] = {}
+        dependencies_by_key: dict[EntityKey, AbstractSet[EntityKey]] = {}
+        for key in sorted(level_by_key, key=level_by_key.__getitem__):
+            node = self.asset_graph.get(key)
+            ancestors = set()
+            for parent_key in node.parent_entity_keys:
+                if parent_key == key:
+                    # self-dependent assets read their own previous results, not this tick's
+                    continue
+                elif parent_key in self.entity_keys:
+                    ancestors.add(parent_key)
+                else:
+                    ancestors |= frontier_by_key.get(parent_key, set())
+            frontier_by_key[key] = ancestors
+            if key not in self.entity_keys:
+                continue
+
+            related_keys = (
+                set(node.execution_set_entity_keys) if isinstance(key, AssetKey) else set()
+            )
+            condition = node.automation_condition or self.default_condition
+            if condition is not None:
+                related_keys |= get_condition_inputs(condition).matched_keys
+            dependencies_by_key[key] = ancestors | {
+                related_key
+                for related_key in related_keys
+                if related_key in self.entity_keys
+                and level_by_key.get(related_key, level_by_key[key]) < level_by_key[key]
+            }
+        return dependencies_by_key
+
+    def _try_reuse_cursor(self, key: EntityKey) -> bool:
+        if self._incremental_tracker is None:
+            return False
+        cursor = self._incremental_tracker.get_reusable_cursor(
+            key, self.current_results_by_key, self.request_subsets_by_key
+        )
+        if cursor is None:
+            return False
+        self.reused_cursors_by_key[key] = cursor
+        return True
+
+    def get_new_condition_cursors(
+        self, results: Iterable[AutomationResult]
+    ) -> Sequence[AutomationConditionCursor]:
+        """Returns the cursors to store for the provided results of this evaluation, along with the
+        cursors carried forward for entities that were not evaluated.
+        """
+        if self._incremental_tracker is None:
+            return [result.get_new_cursor() for result in results]
+        return [
+            *(self._incremental_tracker.get_new_cursor(result.key, result) for result in results),
+            *self.reused_cursors_by_key.values(),
         ]
 
     async def evaluate_entity(self, key: EntityKey) -> None:
@@ -226,7 +226,7 @@ def test_cross_location_condition():
             evaluation_timestamp=(evaluation_time or datetime.datetime.now()).timestamp(),
             newly_observe_requested_asset_keys=[],
             evaluation_id=cursor.evaluation_id + 1,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=evaluator.get_new_condition_cursors(results),
             asset_graph=asset_graph,
         )
 
@@ -0,0 +1,319 @@
+"""Support for evaluating only the entities whose automation conditions could have a different
+result than on their previous evaluation.
+
+The result of an automation condition depends on the condition itself, the events for the entity
+and its dependencies, the current time (through cron ticks and time partitions), the partitions of
+the entity and its dependencies, active backfills, and what was requested on the previous tick and
+earlier on the current tick. For an entity whose condition only depends on these inputs in ways that
+we know how to track, we hash the inputs that are not captured by event storage ids into the
+condition cursor. On the next tick, if that hash is unchanged, no relevant events were stored since
+the previous evaluation, and nothing upstream was requested or changed its result, the previous
+evaluation is reused instead of evaluating the condition again.
+
+Conditions whose inputs cannot be tracked this way (legacy rules, conditions on downstream assets or
+asset checks, freshness results, job conditions, and virtual asset dependencies) are always
+evaluated.
+"""
+
+import dataclasses
+import os
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, AbstractSet, NamedTuple  # noqa: UP035
+
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.definitions.asset_key import AssetKey, EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+    AutomationResult,
+)
+from dagster._core.definitions.declarative_automation.legacy.rule_condition import RuleCondition
+from dagster._core.definitions.declarative_automation.operands.operands import (
+    CronTickPassedCondition,
+    FreshnessResultCondition,
+)
+from dagster._core.definitions.declarative_automation.operators.any_downstream_conditions_operator import (
+    AnyDownstreamConditionsCondition,
+    DownstreamConditionWrapperCondition,
+)
+from dagster._core.definitions.declarative_automation.operators.check_operators import (
+    ChecksAutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.operators.dep_operators import (
+    DepsAutomationCondition,
+    EntityMatchesCondition,
+)
+from dagster._core.definitions.declarative_automation.operators.job_operators import (
+    JobRootAssetsAutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+)
+from dagster._core.definitions.partitions.definition import PartitionsDefinition
+from dagster._core.definitions.partitions.utils.multi import get_time_partitions_def
+from dagster._utils.security import non_secure_md5_hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+# Set to "1" to only evaluate the entities whose automation conditions could have a different
+# result than on their previous evaluation, reusing the previous evaluation for the rest.
+AUTOMATION_INCREMENTAL_EVALUATION_ENV_VAR = "DAGSTER_AUTOMATION_INCREMENTAL_EVALUATION"
+
+_UNTRACKABLE_CONDITION_TYPES = (
+    RuleCondition,
+    AnyDownstreamConditionsCondition,
+    DownstreamConditionWrapperCondition,
+    ChecksAutomationCondition,
+    FreshnessResultCondition,
+    JobRootAssetsAutomationCondition,
+)
+
+
+def is_incremental_evaluation_enabled() -> bool:
+    return os.environ.get(AUTOMATION_INCREMENTAL_EVALUATION_ENV_VAR, "0") == "1"
+
+
+class ConditionInputs(NamedTuple):
+    """The inputs of an automation condition that are determined by its structure."""
+
+    # False if the condition depends on inputs that are not tracked
+    is_trackable: bool
+    # the maximum number of nested dependency operators, i.e. how many levels of upstream entities
+    # the condition can look at
+    deps_depth: int
+    # entities that the condition explicitly looks at, e.g. with `asset_matches`
+    matched_keys: AbstractSet[EntityKey]
+    cron_schedules: AbstractSet[tuple[str, str]]
+
+
+def _iter_condition_nodes(
+    condition: AutomationCondition, deps_depth: int = 0
+) -> Iterator[tuple[AutomationCondition, int]]:
+    yield condition, deps_depth
+    if isinstance(condition, DepsAutomationCondition):
+        deps_depth += 1
+    for child in condition.children:
+        yield from _iter_condition_nodes(child, deps_depth)
+
+
+def get_condition_inputs(condition: AutomationCondition) -> ConditionInputs:
+    is_trackable = True
+    max_deps_depth = 0
+    matched_keys = set()
+    cron_schedules = set()
+    for node, deps_depth in _iter_condition_nodes(condition):
+        if isinstance(node, _UNTRACKABLE_CONDITION_TYPES) or (
+            isinstance(node, DepsAutomationCondition) and node.resolves_virtual_deps
+        ):
+            is_trackable = False
+        elif isinstance(node, DepsAutomationCondition):
+            max_deps_depth = max(max_deps_depth, deps_depth + 1)
+        elif isinstance(node, EntityMatchesCondition):
+            matched_keys.add(node.key)
+        elif isinstance(node, CronTickPassedCondition):
+            cron_schedules.add((node.cron_schedule, node.cron_timezone))
+
+    return ConditionInputs(
+        is_trackable=is_trackable,
+        deps_depth=max_deps_depth,
+        matched_keys=matched_keys,
+        cron_schedules=cron_schedules,
+    )
+
+
+class IncrementalEvaluationTracker:
+    """Decides which entities need to be evaluated on a tick, and computes the input hashes stored
+    in the condition cursors of the entities that are evaluated.
+
+    A previous evaluation is only reused if it was a fixed point, i.e. it was evaluated with the
+    same inputs as the evaluation before it and produced the same state. Otherwise, conditions that
+    are true on the first tick after their inputs change (e.g. `newly_updated` or `cron_tick_passed`)
+    would keep their value on the ticks after that.
+    """
+
+    def __init__(self, evaluator: "AutomationConditionEvaluator"):
+        self._evaluator = evaluator
+        self._condition_inputs_by_key: dict[EntityKey, ConditionInputs] = {}
+        self._input_keys_by_key: dict[EntityKey, AbstractSet[EntityKey]] = {}
+        self._input_hashes_by_key: dict[EntityKey, str | None] = {}
+        self._partitions_ids: dict[PartitionsDefinition, str] = {}
+
+    @property
+    def _asset_graph(self):
+        return self._evaluator.asset_graph
+
+    def _get_condition(self, key: EntityKey) -> AutomationCondition | None:
+        return self._asset_graph.get(key).automation_condition or self._evaluator.default_condition
+
+    def _get_condition_inputs(self, key: EntityKey) -> ConditionInputs:
+        if key not in self._condition_inputs_by_key:
+            condition = self._get_condition(key)
+            self._condition_inputs_by_key[key] = (
+                get_condition_inputs(condition)
+                if condition
+                else ConditionInputs(False, 0, frozenset(), frozenset())
+            )
+        return self._condition_inputs_by_key[key]
+
+    def _get_input_keys(self, key: EntityKey) -> AbstractSet[EntityKey]:
+        """The entity itself and the entities that its condition can look at."""
+        if key not in self._input_keys_by_key:
+            condition_inputs = self._get_condition_inputs(key)
+            input_keys = {key, *condition_inputs.matched_keys}
+            frontier = set(input_keys)
+            for _ in range(condition_inputs.deps_depth):
+                frontier = {
+                    parent_key
+                    for frontier_key in frontier
+                    if self._asset_graph.has(frontier_key)
+                    for parent_key in self._asset_graph.get(frontier_key).parent_entity_keys
+                } - input_keys
+                input_keys |= frontier
+            self._input_keys_by_key[key] = input_keys
+        return self._input_keys_by_key[key]
+
+    def _get_partitions_id(self, partitions_def: PartitionsDefinition) -> str:
+        if partitions_def not in self._partitions_ids:
+            # dynamic partitions definitions are identified by their current partitions (loaded
+            # from the evaluation's partition loading context), so this also captures partitions
+            # being added or removed
+            self._partitions_ids[partitions_def] = (
+                partitions_def.get_serializable_unique_identifier()
+            )
+        return self._partitions_ids[partitions_def]
+
+    def get_input_hash(self, key: EntityKey) -> str | None:
+        """A hash of the inputs of the entity's condition that are not captured by event storage
+        ids, or None if its condition cannot be evaluated incrementally.
+        """
+        if key not in self._input_hashes_by_key:
+            self._input_hashes_by_key[key] = self._compute_input_hash(key)
+        return self._input_hashes_by_key[key]
+
+    def _compute_input_hash(self, key: EntityKey) -> str | None:
+        condition = self._get_condition(key)
+        condition_inputs = self._get_condition_inputs(key)
+        if (
+            condition is None
+            or not condition_inputs.is_trackable
+            or not isinstance(key, AssetKey)
+            # entities that must be executed together are evaluated together
+            or len(self._asset_graph.get(key).execution_set_entity_keys) > 1
+        ):
+            return None
+
+        asset_graph_view = self._evaluator.asset_graph_view
+        backfill_keys = self._evaluator.instance_queryer.get_active_backfill_in_progress_asset_graph_subset().asset_keys
+        components = [condition.get_unique_id()]
+        for input_key in sorted(self._get_input_keys(key), key=lambda k: k.to_user_string()):
+            if not isinstance(input_key, AssetKey):
+                # asset check results are not tracked
+                return None
+            components.append(input_key.to_user_string())
+            if not self._asset_graph.has(input_key):
+                continue
+            node = self._asset_graph.get(input_key)
+            components.append(str(node.code_version))
+            components.append(str(input_key in backfill_keys))
+            if node.partitions_def:
+                components.append(self._get_partitions_id(node.partitions_def))
+                time_partitions_def = get_time_partitions_def(node.partitions_def)
+                if time_partitions_def:
+                    # new time partitions change the candidate subset
+                    last_window = time_partitions_def.get_last_partition_window()
+                    components.append(
+                        str((last_window.start.timestamp(), last_window.end.timestamp()))
+                        if last_window
+                        else ""
+                    )
+        for cron_schedule, cron_timezone in sorted(condition_inputs.cron_schedules):
+            previous_tick = asset_graph_view.compute_previous_cron_tick(
+                cron_schedule=cron_schedule, cron_timezone=cron_timezone
+            )
+            components.append(str(previous_tick.timestamp()))
+
+        return non_secure_md5_hash_str("".join(components).encode())
+
+    def _has_new_events(self, key: EntityKey, last_event_id: int) -> bool:
+        for input_key in self._get_input_keys(key):
+            if not isinstance(input_key, AssetKey) or not self._asset_graph.has(input_key):
+                continue
+            record = self._evaluator.instance_queryer.get_asset_record(input_key)
+            if record is None:
+                continue
+            entry = record.asset_entry
+            if (entry.last_event_storage_id or 0) > last_event_id:
+                return True
+            # a planned materialization that has not completed or failed may be in progress, and
+            # its run can finish without storing an event for this asset
+            planned_storage_id = entry.last_planned_materialization_storage_id
+            if planned_storage_id is not None and planned_storage_id > max(
+                entry.last_materialization_storage_id or 0,
+                entry.last_failed_to_materialize_storage_id or 0,
+            ):
+                return True
+        return False
+
+    def get_reusable_cursor(
+        self,
+        key: EntityKey,
+        current_results_by_key: Mapping[EntityKey, AutomationResult],
+        request_subsets_by_key: Mapping[EntityKey, EntitySubset],
+    ) -> AutomationConditionCursor | None:
+        """Returns the cursor from the previous evaluation of the entity if evaluating its condition
+        again would produce the same result, and None otherwise.
+
+        Must be called after the entities upstream of this entity have been evaluated.
+        """
+        previous_cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        input_hash = self.get_input_hash(key)
+        if (
+            previous_cursor is None
+            or input_hash is None
+            or previous_cursor.input_hash != input_hash
+        ):
+            return None
+
+        for input_key in self._get_input_keys(key):
+            # requests on the previous tick change conditions such as `newly_requested`, and
+            # requests on this tick change conditions such as `will_be_requested`
+            input_previous_cursor = self._evaluator.cursor.get_previous_condition_cursor(input_key)
+            if input_previous_cursor and (
+                not input_previous_cursor.previous_requested_subset.is_empty
+            ):
+                return None
+            request_subset = request_subsets_by_key.get(input_key)
+            if request_subset is not None and not request_subset.is_empty:
+                return None
+            # upstream results that were computed on this tick and changed
+            result = current_results_by_key.get(input_key) if input_key != key else None
+            if result is not None and (
+                input_previous_cursor is None
+                or input_previous_cursor.result_value_hash != result.value_hash
+            ):
+                return None
+
+        if self._has_new_events(key, previous_cursor.last_event_id or 0):
+            return None
+
+        return previous_cursor
+
+    def get_new_cursor(self, key: EntityKey, result: AutomationResult) -> AutomationConditionCursor:
+        """Returns the cursor for an evaluated entity, with an input hash if the evaluation reached
+        a fixed point and can be reused on the next tick.
+        """
+        cursor = result.get_new_cursor()
+        previous_cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        input_hash = self.get_input_hash(key)
+        if (
+            input_hash is None
+            or previous_cursor is None
+            or not previous_cursor.previous_requested_subset.is_empty
+            or not cursor.previous_requested_subset.is_empty
+            or previous_cursor.result_value_hash != cursor.result_value_hash
+            or previous_cursor.node_cursors_by_unique_id != cursor.node_cursors_by_unique_id
+        ):
+            return cursor
+        return dataclasses.replace(cursor, input_hash=input_hash)
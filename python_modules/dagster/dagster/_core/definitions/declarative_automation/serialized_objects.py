@@ -23,6 +23,7 @@
 from dagster._core.definitions.partitions.definition.dynamic import DynamicPartitionsDefinition
 from dagster._core.definitions.partitions.snap.snap import PartitionsSnap
 from dagster._core.definitions.partitions.subset import AllPartitionsSubset
+from dagster._core.definitions.partitions.subset.bitmap import BitmapPartitionsSubset
 from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
 from dagster._core.definitions.partitions.subset.key_ranges import KeyRangesPartitionsSubset
 from dagster._record import record
@@ -58,9 +59,9 @@ def _get_maybe_compressed_dynamic_partitions_subset(
     # is not necessary given the space savings here.
 
     internal_value = subset.get_internal_value()
-    if isinstance(internal_value, (DefaultPartitionsSubset, AllPartitionsSubset)) and isinstance(
-        subset.partitions_def, DynamicPartitionsDefinition
-    ):
+    if isinstance(
+        internal_value, (DefaultPartitionsSubset, BitmapPartitionsSubset, AllPartitionsSubset)
+    ) and isinstance(subset.partitions_def, DynamicPartitionsDefinition):
         snap = PartitionsSnap.from_def(subset.partitions_def)
         value = KeyRangesPartitionsSubset(
             partitions_snap=snap,
@@ -217,6 +218,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        input_hash: A hash of the inputs to the evaluation that are not captured by event storage
+            ids, set if the evaluation can be reused on the next tick when those inputs have not
+            changed. Only set when incremental evaluation is enabled.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -225,6 +229,7 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
 
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
+    input_hash: str | None = None
 
     @staticmethod
     def backcompat_from_evaluation_state(
@@ -336,6 +336,8 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
@@ -345,6 +347,12 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         step_dependency_config=StepDependencyConfig.from_config(
             check.opt_nullable_dict_elem(config, "step_dependency_config")
         ),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker")
+            if worker_pool_cfg is not None
+            else None
+        ),
     )
 
 
@@ -397,6 +405,24 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process may execute before it is replaced "
+                        "with a fresh process. By default, workers are reused for the whole run."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new "
+                "process for each step. Each worker loads the job once and then executes steps "
+                "one at a time, which avoids paying process startup and import costs per step."
+            ),
+        ),
         "retries": get_retries_config(),
         "step_dependency_config": get_step_dependency_config_field(),
     },
@@ -427,6 +453,10 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``worker_pool`` executes steps in a pool of reusable worker processes rather than a
+    fresh process per step. ``max_steps_per_worker`` bounds how many steps each worker executes
+    before being replaced.
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
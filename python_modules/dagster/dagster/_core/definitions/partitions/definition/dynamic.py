@@ -20,6 +20,7 @@
 from dagster._core.types.pagination import PaginatedResults
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.partitions.subset import PartitionsSubset
     from dagster._core.instance import DynamicPartitionsStore
 
 
@@ -103,6 +104,18 @@ def _validated_name(self) -> str:
             )
         return self.name
 
+    @property
+    def partitions_subset_class(self) -> type["PartitionsSubset"]:
+        from dagster._core.definitions.partitions.subset.bitmap import (
+            BitmapPartitionsSubset,
+            use_bitmap_partitions_subsets,
+        )
+        from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
+
+        if use_bitmap_partitions_subsets():
+            return BitmapPartitionsSubset
+        return DefaultPartitionsSubset
+
     def __eq__(self, other):
         return (
             isinstance(other, DynamicPartitionsDefinition)
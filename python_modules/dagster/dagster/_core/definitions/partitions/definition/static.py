@@ -18,6 +18,7 @@
 from dagster._core.types.pagination import PaginatedResults
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.partitions.subset import PartitionsSubset
     from dagster._core.instance import DynamicPartitionsStore
 
 
@@ -54,6 +55,18 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> type["PartitionsSubset"]:
+        from dagster._core.definitions.partitions.subset.bitmap import (
+            BitmapPartitionsSubset,
+            use_bitmap_partitions_subsets,
+        )
+        from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
+
+        if use_bitmap_partitions_subsets():
+            return BitmapPartitionsSubset
+        return DefaultPartitionsSubset
+
     @public
     def get_partition_keys(
         self,
@@ -1,3 +1,4 @@
+import bisect
 import functools
 import hashlib
 import heapq
@@ -5,7 +6,7 @@
 from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime
 from functools import cached_property
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, cast
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
@@ -31,10 +32,12 @@
     datetime_from_timestamp,
     dst_safe_strftime,
     dst_safe_strptime,
+    get_current_timestamp,
     get_timezone,
 )
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.schedules import (
+    apply_fold_and_post_transition,
     cron_string_iterator,
     is_valid_cron_schedule,
     reverse_cron_string_iterator,
@@ -47,6 +50,106 @@
     from dagster._core.instance import DynamicPartitionsStore
 
 
+class _ClosedFormTickIndex:
+    """Maps between the ticks of a regular cron schedule and their integer indexes, without
+    iterating over the schedule.
+
+    Tick 0 is the first tick at or after the start of the partitions definition. Two kinds of
+    schedule are supported:
+
+    * Schedules with a fixed number of minutes between ticks (e.g. hourly or "*/15"). In UTC,
+      their ticks are evenly spaced, as long as the timezone's UTC offset is the same modulo the
+      interval across DST transitions, which the caller checks. DST only affects how ticks are
+      formatted as partition keys.
+    * Basic daily schedules, whose ticks are local midnights. Their index is the number of local
+      calendar days since the first tick, and the tz database supplies each day's UTC offset.
+
+    Excluded ticks (only datetime exclusions are supported) are kept as a sorted list of tick
+    indexes. A partition's index is its tick index minus the number of excluded ticks before it.
+    """
+
+    def __init__(
+        self,
+        first_tick_timestamp: float,
+        timezone: str,
+        interval_seconds: int | None,
+        excluded_timestamps: Sequence[float],
+    ):
+        self._first_tick_timestamp = first_tick_timestamp
+        self._tzinfo = get_timezone(timezone)
+        # None for basic daily schedules
+        self._interval_seconds = interval_seconds
+        self._first_date = datetime.fromtimestamp(first_tick_timestamp, tz=self._tzinfo).date()
+        self._excluded_tick_indexes = sorted(
+            {
+                self.tick_index(timestamp)
+                for timestamp in excluded_timestamps
+                if self.is_tick(timestamp)
+            }
+        )
+        self._excluded_tick_index_set = frozenset(self._excluded_tick_indexes)
+
+    def tick_index(self, timestamp: float) -> int:
+        """The index of the last tick at or before the given timestamp."""
+        if self._interval_seconds is not None:
+            return int((timestamp - self._first_tick_timestamp) // self._interval_seconds)
+        return (datetime.fromtimestamp(timestamp, tz=self._tzinfo).date() - self._first_date).days
+
+    def tick_timestamp(self, tick_index: int) -> float:
+        if self._interval_seconds is not None:
+            return self._first_tick_timestamp + tick_index * self._interval_seconds
+        tick_date = date.fromordinal(self._first_date.toordinal() + tick_index)
+        return apply_fold_and_post_transition(
+            datetime(tick_date.year, tick_date.month, tick_date.day, tzinfo=self._tzinfo)
+        ).timestamp()
+
+    def is_tick(self, timestamp: float) -> bool:
+        return self.tick_timestamp(self.tick_index(timestamp)) == timestamp
+
+    def is_excluded(self, tick_index: int) -> bool:
+        return tick_index in self._excluded_tick_index_set
+
+    def is_skipped_midnight(self, tick_index: int) -> bool:
+        """Whether the tick falls on a day whose local midnight is skipped by a DST transition.
+        Iterating the cron schedule represents such ticks as nonexistent local times.
+        """
+        if self._interval_seconds is not None:
+            return False
+        return datetime.fromtimestamp(self.tick_timestamp(tick_index), tz=self._tzinfo).hour != 0
+
+    def partition_index(self, tick_index: int) -> int:
+        """The index of the partition for the given (non-excluded) tick."""
+        return tick_index - bisect.bisect_left(self._excluded_tick_indexes, tick_index)
+
+    def tick_index_for_partition_index(self, partition_index: int) -> int:
+        tick_index = partition_index
+        # each pass accounts for the excluded ticks skipped over by the previous pass
+        while True:
+            next_tick_index = partition_index + bisect.bisect_right(
+                self._excluded_tick_indexes, tick_index
+            )
+            if next_tick_index == tick_index:
+                return tick_index
+            tick_index = next_tick_index
+
+
+def _has_fixed_utc_offset_phase(
+    timezone: str, interval_seconds: int, start_timestamp: float, end_timestamp: float
+) -> bool:
+    """Whether the UTC offset of the timezone is the same modulo the interval at the start and in
+    the middle (i.e. on both sides of any DST transition) of every year between the timestamps.
+    """
+    tzinfo = get_timezone(timezone)
+    phases = set()
+    start_year = datetime.fromtimestamp(start_timestamp, tz=tzinfo).year
+    end_year = datetime.fromtimestamp(end_timestamp, tz=tzinfo).year
+    for year in range(start_year, end_year + 2):
+        for month in (1, 7):
+            offset = check.not_none(datetime(year, month, 1, tzinfo=tzinfo).utcoffset())
+            phases.add(int(offset.total_seconds()) % interval_seconds)
+    return len(phases) == 1
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -242,6 +345,73 @@ def end(self) -> datetime | None:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _closed_form_tick_index(self) -> _ClosedFormTickIndex | None:
+        """Returns an index that maps partition keys to and from their positions in closed form,
+        or None if the cron schedule is irregular and must be iterated.
+        """
+        if self.exclusions and any(isinstance(excl, str) for excl in self.exclusions):
+            return None
+
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if fixed_minute_interval:
+            interval_seconds = fixed_minute_interval * 60
+            if not _has_fixed_utc_offset_phase(
+                self.timezone,
+                interval_seconds,
+                self.start_timestamp,
+                self.end_timestamp or get_current_timestamp(),
+            ):
+                return None
+        elif is_basic_daily(self.cron_schedule):
+            interval_seconds = None
+        else:
+            return None
+
+        first_tick = next(iter(self._iterate_time_windows(self.start_timestamp, True))).start
+        tick_index = _ClosedFormTickIndex(
+            first_tick_timestamp=first_tick.timestamp(),
+            timezone=self.timezone,
+            interval_seconds=interval_seconds,
+            excluded_timestamps=[
+                excl.timestamp
+                for excl in self.exclusions or []
+                if isinstance(excl, TimestampWithTimezone)
+            ],
+        )
+        # guard against schedules whose first tick does not line up with the closed form, e.g. a
+        # daily schedule in a timezone where midnight does not exist on some days
+        if tick_index.tick_timestamp(0) != first_tick.timestamp():
+            return None
+        return tick_index
+
+    def _closed_form_time_window_for_partition_key(self, partition_key: str) -> TimeWindow | None:
+        """Returns the time window for the partition key if it can be computed in closed form and
+        the key's start time is a non-excluded tick of the cron schedule, and None otherwise.
+        """
+        tick_index = self._closed_form_tick_index
+        if tick_index is None:
+            return None
+
+        try:
+            start_timestamp = dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+        except ValueError:
+            return None
+
+        index = tick_index.tick_index(start_timestamp)
+        if (
+            tick_index.tick_timestamp(index) != start_timestamp
+            or tick_index.is_excluded(index)
+            or tick_index.is_skipped_midnight(index)
+            or tick_index.is_skipped_midnight(index + 1)
+        ):
+            return None
+
+        return TimeWindow(
+            datetime_from_timestamp(start_timestamp, self.timezone),
+            datetime_from_timestamp(tick_index.tick_timestamp(index + 1), self.timezone),
+        )
+
     def _get_current_timestamp(self) -> float:
         with partition_loading_context() as ctx:
             current_time = ctx.effective_dt
@@ -308,6 +478,30 @@ def get_partition_keys_between_indexes(self, start_idx: int, end_idx: int) -> li
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        tick_index = self._closed_form_tick_index
+        if tick_index is not None:
+            last_partition_window = self.get_last_partition_window()
+            if last_partition_window is None:
+                return []
+            num_partitions = (
+                tick_index.partition_index(
+                    tick_index.tick_index(last_partition_window.start.timestamp())
+                )
+                + 1
+            )
+            return [
+                dst_safe_strftime(
+                    datetime_from_timestamp(
+                        tick_index.tick_timestamp(tick_index.tick_index_for_partition_index(idx)),
+                        self.timezone,
+                    ),
+                    self.timezone,
+                    self.fmt,
+                    self.cron_schedule,
+                )
+                for idx in range(max(start_idx, 0), min(end_idx, num_partitions))
+            ]
+
         current_timestamp = self._get_current_timestamp()
 
         partitions_past_current_time = 0
@@ -551,6 +745,10 @@ def __hash__(self):
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        closed_form_time_window = self._closed_form_time_window_for_partition_key(partition_key)
+        if closed_form_time_window is not None:
+            return closed_form_time_window
+
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
@@ -561,6 +759,21 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        closed_form_time_windows = [
+            self._closed_form_time_window_for_partition_key(partition_key)
+            for partition_key in partition_keys
+        ]
+        if all(closed_form_time_windows):
+            partition_key_time_windows = sorted(
+                cast("list[TimeWindow]", closed_form_time_windows),
+                key=lambda tw: tw.start.timestamp(),
+            )
+            return (
+                self._time_windows_within_bounds(partition_key_time_windows)
+                if validate
+                else partition_key_time_windows
+            )
+
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -587,26 +800,34 @@ def time_windows_for_partition_keys(
                 partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
+            partition_key_time_windows = self._time_windows_within_bounds(
+                partition_key_time_windows
+            )
+        return partition_key_time_windows
 
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
+    def _time_windows_within_bounds(self, time_windows: Sequence[TimeWindow]) -> list[TimeWindow]:
+        start_time_window = self.get_first_partition_window()
+        end_time_window = self.get_last_partition_window()
 
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
+        if start_time_window is None or end_time_window is None:
+            check.failed("No partitions in the PartitionsDefinition")
 
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
-        return partition_key_time_windows
+        start_timestamp = start_time_window.start.timestamp()
+        end_timestamp = end_time_window.end.timestamp()
+
+        return [
+            tw
+            for tw in time_windows
+            if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+        ]
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         if self.is_basic_hourly or self.is_basic_daily:
             return partition_key_dt
+        closed_form_time_window = self._closed_form_time_window_for_partition_key(partition_key)
+        if closed_form_time_window is not None:
+            return closed_form_time_window.start
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
@@ -1195,15 +1416,21 @@ def get_serializable_unique_identifier(
 
     def has_partition_key(self, partition_key: str) -> bool:
         """Returns a boolean representing if the given partition key is valid."""
-        try:
-            partition_start_time = self.start_time_for_partition_key(partition_key)
+        closed_form_time_window = self._closed_form_time_window_for_partition_key(partition_key)
+        if closed_form_time_window is not None:
+            # the closed form only returns windows for non-excluded ticks
+            partition_start_time = closed_form_time_window.start
             partition_start_timestamp = partition_start_time.timestamp()
-        except ValueError:
-            # unparseable partition key
-            return False
-
-        if self.is_window_start_excluded(partition_start_time):
-            return False
+        else:
+            try:
+                partition_start_time = self.start_time_for_partition_key(partition_key)
+                partition_start_timestamp = partition_start_time.timestamp()
+            except ValueError:
+                # unparseable partition key
+                return False
+
+            if self.is_window_start_excluded(partition_start_time):
+                return False
 
         first_partition_window = self.get_first_partition_window()
         last_partition_window = self.get_last_partition_window()
@@ -1,6 +1,9 @@
 from dagster._core.definitions.partitions.subset.all import (
     AllPartitionsSubset as AllPartitionsSubset,
 )
+from dagster._core.definitions.partitions.subset.bitmap import (
+    BitmapPartitionsSubset as BitmapPartitionsSubset,
+)
 from dagster._core.definitions.partitions.subset.default import (
     DefaultPartitionsSubset as DefaultPartitionsSubset,
 )
@@ -10,7 +10,10 @@
     PartitionsDefinition,
 )
 from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
-from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
+from dagster._core.definitions.partitions.subset.partitions_subset import (
+    PartitionsSubset,
+    format_partitions_summary,
+)
 
 
 class AllPartitionsSubset(PartitionsSubset):
@@ -91,6 +94,14 @@ def __len__(self) -> int:
     def __contains__(self, value) -> bool:
         return self.partitions_def.has_partition_key(partition_key=value)
 
+    @use_partition_loading_context
+    def get_summary_str(self, max_items: int = 5) -> str:
+        return format_partitions_summary(
+            self.get_partition_key_ranges(self.partitions_def)[:max_items],
+            0,
+            self.partitions_def.get_num_partitions(),
+        )
+
     def __repr__(self) -> str:
         return f"AllPartitionsSubset(partitions_def={self.partitions_def})"
 
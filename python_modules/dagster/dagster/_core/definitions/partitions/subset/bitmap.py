@@ -0,0 +1,366 @@
+import base64
+import json
+import os
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import cached_property
+from typing import Any, cast
+
+import dagster._check as check
+from dagster._core.definitions.partitions.definition.partitions_definition import (
+    PartitionsDefinition,
+)
+from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
+from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
+from dagster._core.definitions.partitions.utils.base import (
+    generate_partition_key_based_definition_id,
+)
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+    DagsterUnknownPartitionError,
+)
+
+_MAX_CACHED_ORDINALS = 32
+
+# the positions of the set bits in each possible byte value, used to map a bitmap back to keys
+_SET_BITS_BY_BYTE = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def use_bitmap_partitions_subsets() -> bool:
+    """Static and dynamic partitions definitions create BitmapPartitionsSubsets instead of
+    DefaultPartitionsSubsets when the DAGSTER_BITMAP_PARTITIONS_SUBSETS environment variable is set.
+    """
+    return os.getenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "").lower() in ("1", "true")
+
+
+class PartitionKeyOrdinals:
+    """The ordinal position of each partition key of a partitions definition. Shared between all of
+    the BitmapPartitionsSubsets that are created against the same list of keys, so that set
+    operations between them can be done directly on their bitmaps.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self.partition_keys = partition_keys
+        self._partition_keys_ids: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.partition_keys)
+
+    @cached_property
+    def ordinals_by_key(self) -> Mapping[str, int]:
+        return {key: ordinal for ordinal, key in enumerate(self.partition_keys)}
+
+    def get_partition_keys_id(self, num_keys: int) -> str:
+        """Returns an identifier for the first `num_keys` partition keys. Dynamic partitions are
+        appended to the end of the list, so a bitmap serialized against a shorter list of keys is
+        still valid as long as that list is a prefix of the current one.
+        """
+        if num_keys not in self._partition_keys_ids:
+            self._partition_keys_ids[num_keys] = generate_partition_key_based_definition_id(
+                list(self.partition_keys[:num_keys])
+            )
+        return self._partition_keys_ids[num_keys]
+
+    def get_bitmap(self, partition_keys: Iterable[str]) -> int:
+        buffer = bytearray((len(self) + 7) // 8)
+        ordinals_by_key = self.ordinals_by_key
+        for partition_key in partition_keys:
+            ordinal = ordinals_by_key.get(partition_key)
+            if ordinal is None:
+                raise DagsterUnknownPartitionError(
+                    f"Could not find a partition with key `{partition_key}`."
+                )
+            buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(buffer, "little")
+
+    def iter_ordinals(self, bitmap: int) -> Iterator[int]:
+        for byte_index, byte in enumerate(
+            bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        ):
+            if byte:
+                for bit in _SET_BITS_BY_BYTE[byte]:
+                    yield (byte_index << 3) | bit
+
+
+_ordinals_by_partitions_def: dict[PartitionsDefinition, PartitionKeyOrdinals] = {}
+
+
+def get_partition_key_ordinals(partitions_def: PartitionsDefinition) -> PartitionKeyOrdinals:
+    """Returns the PartitionKeyOrdinals for the current keys of the given partitions definition,
+    reusing the previously built ordinals if the keys have not changed.
+    """
+    partition_keys = partitions_def.get_partition_keys()
+    ordinals = _ordinals_by_partitions_def.get(partitions_def)
+    if ordinals is not None and (
+        ordinals.partition_keys is partition_keys or ordinals.partition_keys == partition_keys
+    ):
+        return ordinals
+
+    ordinals = PartitionKeyOrdinals(partition_keys)
+    if len(_ordinals_by_partitions_def) >= _MAX_CACHED_ORDINALS:
+        _ordinals_by_partitions_def.pop(next(iter(_ordinals_by_partitions_def)), None)
+    _ordinals_by_partitions_def[partitions_def] = ordinals
+    return ordinals
+
+
+class BitmapPartitionsSubset(PartitionsSubset):
+    """A PartitionsSubset for a static or dynamic PartitionsDefinition, which internally represents
+    the included partitions as a bitmap over the ordinal positions of the definition's keys.
+    Partition keys are only materialized when they are requested.
+    """
+
+    # Version 1 is the DefaultPartitionsSubset format, which can still be deserialized.
+    SERIALIZATION_VERSION = 2
+
+    def __init__(
+        self,
+        partitions_def: PartitionsDefinition,
+        ordinals: PartitionKeyOrdinals,
+        bitmap: int = 0,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", PartitionsDefinition
+        )
+        self._ordinals = check.inst_param(ordinals, "ordinals", PartitionKeyOrdinals)
+        self._bitmap = check.int_param(bitmap, "bitmap")
+
+    @property
+    def partitions_def(self) -> PartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def ordinals(self) -> PartitionKeyOrdinals:
+        return self._ordinals
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    @cached_property
+    def _bitmap_bytes(self) -> bytes:
+        return self._bitmap.to_bytes((len(self._ordinals) + 7) // 8, "little")
+
+    @property
+    def is_empty(self) -> bool:
+        return self._bitmap == 0
+
+    def _with_bitmap(self, bitmap: int) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self._partitions_def, self._ordinals, bitmap)
+
+    def _get_comparable_bitmap(self, other: PartitionsSubset) -> int | None:
+        """Returns the bitmap of the other subset if it uses the same ordinal positions."""
+        if not isinstance(other, BitmapPartitionsSubset):
+            return None
+        if other.ordinals is self._ordinals:
+            return other.bitmap
+        # dynamic partitions are appended, so the shorter list of keys may be a prefix of the other
+        num_keys = min(len(self._ordinals), len(other.ordinals))
+        if self._ordinals.get_partition_keys_id(num_keys) == other.ordinals.get_partition_keys_id(
+            num_keys
+        ):
+            return other.bitmap
+        return None
+
+    def get_partition_keys_not_in_subset(
+        self, partitions_def: PartitionsDefinition
+    ) -> Iterable[str]:
+        ordinals = get_partition_key_ordinals(partitions_def)
+        if ordinals is self._ordinals:
+            complement = ((1 << len(ordinals)) - 1) & ~self._bitmap
+            return [
+                ordinals.partition_keys[ordinal] for ordinal in ordinals.iter_ordinals(complement)
+            ]
+        return [key for key in ordinals.partition_keys if key not in self]
+
+    def get_partition_keys(self) -> Iterable[str]:
+        partition_keys = self._ordinals.partition_keys
+        return [partition_keys[ordinal] for ordinal in self._ordinals.iter_ordinals(self._bitmap)]
+
+    def get_partition_key_ranges(
+        self, partitions_def: PartitionsDefinition
+    ) -> Sequence[PartitionKeyRange]:
+        ordinals = get_partition_key_ordinals(partitions_def)
+        if ordinals is not self._ordinals:
+            return DefaultPartitionsSubset(set(self.get_partition_keys())).get_ranges_for_keys(
+                ordinals.partition_keys
+            )
+
+        partition_keys = ordinals.partition_keys
+        result = []
+        range_start = range_end = None
+        for ordinal in ordinals.iter_ordinals(self._bitmap):
+            if range_end is not None and ordinal == range_end + 1:
+                range_end = ordinal
+                continue
+            if range_start is not None and range_end is not None:
+                result.append(
+                    PartitionKeyRange(partition_keys[range_start], partition_keys[range_end])
+                )
+            range_start = range_end = ordinal
+
+        if range_start is not None and range_end is not None:
+            result.append(PartitionKeyRange(partition_keys[range_start], partition_keys[range_end]))
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "BitmapPartitionsSubset":
+        partition_keys = list(partition_keys)
+        ordinals_by_key = self._ordinals.ordinals_by_key
+        if any(partition_key not in ordinals_by_key for partition_key in partition_keys):
+            # dynamic partitions may have been added since this subset was created
+            ordinals = get_partition_key_ordinals(self._partitions_def)
+            return BitmapPartitionsSubset(
+                self._partitions_def,
+                ordinals,
+                ordinals.get_bitmap([*self.get_partition_keys(), *partition_keys]),
+            )
+        return self._with_bitmap(self._bitmap | self._ordinals.get_bitmap(partition_keys))
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        other_bitmap = self._get_comparable_bitmap(other)
+        if other_bitmap is None:
+            return super().__or__(other)
+        other = cast("BitmapPartitionsSubset", other)
+        if len(other.ordinals) > len(self._ordinals):
+            # use the ordinals that include any dynamic partitions added since this subset was created
+            return BitmapPartitionsSubset(
+                other.partitions_def, other.ordinals, self._bitmap | other_bitmap
+            )
+        return self._with_bitmap(self._bitmap | other_bitmap)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        other_bitmap = self._get_comparable_bitmap(other)
+        if other_bitmap is None:
+            return super().__sub__(other)
+        return self._with_bitmap(self._bitmap & ~other_bitmap)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        other_bitmap = self._get_comparable_bitmap(other)
+        if other_bitmap is None:
+            return super().__and__(other)
+        return self._with_bitmap(self._bitmap & other_bitmap)
+
+    def serialize(self) -> str:
+        # The bitmap is only valid for the same ordering of partition keys, so store an identifier
+        # for the keys that it was built against.
+        num_keys = len(self._ordinals)
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "num_partitions": num_keys,
+                "partition_keys_id": self._ordinals.get_partition_keys_id(num_keys),
+                "bitmap": base64.b64encode(zlib.compress(self._bitmap_bytes)).decode("ascii"),
+            }
+        )
+
+    @staticmethod
+    def _get_serialized_bitmap(
+        ordinals: PartitionKeyOrdinals, data: Mapping[str, Any]
+    ) -> int | None:
+        num_keys = data.get("num_partitions")
+        if not isinstance(num_keys, int) or num_keys > len(ordinals):
+            return None
+        if ordinals.get_partition_keys_id(num_keys) != data.get("partition_keys_id"):
+            return None
+        return int.from_bytes(zlib.decompress(base64.b64decode(data["bitmap"])), "little")
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "BitmapPartitionsSubset":
+        data = json.loads(serialized)
+        ordinals = get_partition_key_ordinals(partitions_def)
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            partition_keys = DefaultPartitionsSubset.from_serialized(
+                partitions_def, serialized
+            ).get_partition_keys()
+            # keys that have been removed from the definition are dropped
+            ordinals_by_key = ordinals.ordinals_by_key
+            return cls(
+                partitions_def,
+                ordinals,
+                ordinals.get_bitmap(key for key in partition_keys if key in ordinals_by_key),
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        bitmap = cls._get_serialized_bitmap(ordinals, data)
+        if bitmap is None:
+            raise DagsterDefinitionChangedDeserializationError(
+                "Cannot deserialize partitions subset because the partition keys of the"
+                " partitions definition have changed since it was serialized."
+            )
+        return cls(partitions_def, ordinals, bitmap)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: str | None,
+        serialized_partitions_def_class_name: str | None,
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            return DefaultPartitionsSubset.can_deserialize(partitions_def, serialized, None, None)
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and cls._get_serialized_bitmap(get_partition_key_ordinals(partitions_def), data)
+            is not None
+        )
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # serdes-serialized values, such as backfill data, can be deserialized without access to
+        # the partitions definition, so they store the keys
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, BitmapPartitionsSubset)
+            and self._get_comparable_bitmap(other) == self._bitmap
+        )
+
+    __hash__ = None  # ty: ignore[invalid-assignment]
+
+    def __len__(self) -> int:
+        return self._bitmap.bit_count()
+
+    def __contains__(self, value) -> bool:
+        ordinal = self._ordinals.ordinals_by_key.get(value)
+        if ordinal is None:
+            return False
+        return bool(self._bitmap_bytes[ordinal >> 3] >> (ordinal & 7) & 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"BitmapPartitionsSubset(num_partitions={len(self._ordinals)},"
+            f" num_partitions_in_subset={len(self)})"
+        )
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: PartitionsDefinition | None = None
+    ) -> "BitmapPartitionsSubset":
+        partitions_def = check.not_none(partitions_def)
+        return cls(partitions_def, get_partition_key_ordinals(partitions_def))
+
+    def empty_subset(self) -> "BitmapPartitionsSubset":
+        return self._with_bitmap(0)
@@ -1,3 +1,4 @@
+import heapq
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Sequence
 from typing import Generic
@@ -121,3 +122,35 @@ def create_empty_subset(
 
     def to_serializable_subset(self) -> "PartitionsSubset":
         return self
+
+    def get_summary_str(self, max_items: int = 5) -> str:
+        """Returns a compact description of the subset for logging, e.g.
+        "2024-01-01-00:00..2024-03-01-00:00 (1440 keys)", which lists at most `max_items` keys or
+        ranges of keys rather than every key in the subset.
+        """
+        num_keys = len(self)
+        return format_partitions_summary(
+            heapq.nsmallest(max_items, self.get_partition_keys()), num_keys - max_items, num_keys
+        )
+
+
+def format_partitions_summary(
+    items: Sequence[str | PartitionKeyRange], num_omitted_items: int, num_keys: int
+) -> str:
+    """Renders partition keys and ranges of partition keys, followed by the number of items that
+    were omitted and the total number of keys.
+    """
+    num_keys_str = f"{num_keys} key{'s' if num_keys != 1 else ''}"
+    parts = [
+        item
+        if isinstance(item, str)
+        else item.start
+        if item.start == item.end
+        else f"{item.start}..{item.end}"
+        for item in items
+    ]
+    if not parts:
+        return num_keys_str
+    if num_omitted_items > 0:
+        parts.append(f"... (+{num_omitted_items} more)")
+    return f"{', '.join(parts)} ({num_keys_str})"
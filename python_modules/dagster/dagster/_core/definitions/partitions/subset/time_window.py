@@ -1,10 +1,12 @@
+import heapq
 import json
-from collections.abc import Iterable, Iterator, Sequence
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeAlias
 
 from dagster_shared.serdes import NamedTupleSerializer
 
@@ -18,7 +20,10 @@
     TimeWindowPartitionsDefinition,
 )
 from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
-from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
+from dagster._core.definitions.partitions.subset.partitions_subset import (
+    PartitionsSubset,
+    format_partitions_summary,
+)
 from dagster._core.definitions.partitions.utils.time_window import PersistedTimeWindow, TimeWindow
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
@@ -67,6 +72,80 @@ def _attempt_coerce_to_time_window_subset(subset: "PartitionsSubset") -> "Partit
         return subset
 
 
+# A time range is a (start_timestamp, end_timestamp) pair that is closed at the start and open at
+# the end. The set operations on TimeWindowPartitionsSubset work on sorted lists of disjoint time
+# ranges, and only convert the result back to PersistedTimeWindows once at the end.
+TimeRange: TypeAlias = tuple[float, float]
+
+
+def _union_time_ranges(
+    time_ranges: Sequence[TimeRange],
+    other_time_ranges: Sequence[TimeRange],
+    can_merge: Callable[[float, float], bool] | None = None,
+) -> list[TimeRange]:
+    """Merges two sorted lists of time ranges. Ranges that overlap or touch are combined, as are
+    ranges separated by a gap for which `can_merge(gap_start, gap_end)` returns True.
+    """
+    result: list[TimeRange] = []
+    for start, end in heapq.merge(time_ranges, other_time_ranges):
+        if result:
+            last_start, last_end = result[-1]
+            if start <= last_end or (can_merge is not None and can_merge(last_end, start)):
+                if end > last_end:
+                    result[-1] = (last_start, end)
+                continue
+        result.append((start, end))
+    return result
+
+
+def _intersect_time_ranges(
+    time_ranges: Sequence[TimeRange], other_time_ranges: Sequence[TimeRange]
+) -> list[TimeRange]:
+    result: list[TimeRange] = []
+    i = j = 0
+    while i < len(time_ranges) and j < len(other_time_ranges):
+        start, end = time_ranges[i]
+        other_start, other_end = other_time_ranges[j]
+        intersection_start = max(start, other_start)
+        intersection_end = min(end, other_end)
+        if intersection_start < intersection_end:
+            result.append((intersection_start, intersection_end))
+
+        # advance past the range with the earliest end to find the next potential intersection
+        if end < other_end:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_time_ranges(
+    time_ranges: Sequence[TimeRange], other_time_ranges: Sequence[TimeRange]
+) -> list[TimeRange]:
+    result: list[TimeRange] = []
+    j = 0
+    for start, end in time_ranges:
+        # skip the ranges to subtract that end before this range starts. they also end before all
+        # later ranges start, since the ranges are sorted and disjoint
+        while j < len(other_time_ranges) and other_time_ranges[j][1] <= start:
+            j += 1
+
+        remaining_start = start
+        k = j
+        while k < len(other_time_ranges) and other_time_ranges[k][0] < end:
+            other_start, other_end = other_time_ranges[k]
+            if other_start > remaining_start:
+                result.append((remaining_start, other_start))
+            remaining_start = max(remaining_start, other_end)
+            if remaining_start >= end:
+                break
+            k += 1
+
+        if remaining_start < end:
+            result.append((remaining_start, end))
+    return result
+
+
 class TimeWindowPartitionsSubsetSerializer(NamedTupleSerializer):
     # TimeWindowPartitionsSubsets have custom logic to delay calculating num_partitions until it
     # is needed to improve performance. When serializing, we want to serialize the number of
@@ -163,6 +242,28 @@ def from_all_partitions_subset(subset: "AllPartitionsSubset") -> "TimeWindowPart
     def included_time_windows(self) -> Sequence[PersistedTimeWindow]:  # ty: ignore[invalid-named-tuple-override]
         return self._asdict()["included_time_windows"]
 
+    @cached_property
+    def _time_ranges(self) -> Sequence[TimeRange]:
+        return sorted(
+            (time_window.start_timestamp, time_window.end_timestamp)
+            for time_window in self.included_time_windows
+        )
+
+    @cached_property
+    def _time_range_starts(self) -> Sequence[float]:
+        return [start for start, _ in self._time_ranges]
+
+    def _time_windows_from_time_ranges(
+        self, time_ranges: Sequence[TimeRange]
+    ) -> Sequence[PersistedTimeWindow]:
+        timezone = self.partitions_def.timezone
+        return [
+            PersistedTimeWindow(
+                TimestampWithTimezone(start, timezone), TimestampWithTimezone(end, timezone)
+            )
+            for start, end in time_ranges
+        ]
+
     @property
     def first_start(self) -> datetime:
         """The start datetime of the earliest partition in the subset."""
@@ -323,83 +424,27 @@ def _add_partitions_to_time_windows(
         """Merges a set of partition keys into an existing set of time windows, returning the
         minimized set of time windows and the number of partitions added.
         """
-        result_windows = [*initial_windows]
-        time_windows = self.partitions_def.time_windows_for_partition_keys(
-            frozenset(partition_keys), validate=validate
+        initial_time_ranges = sorted(
+            (window.start_timestamp, window.end_timestamp) for window in initial_windows
+        )
+        initial_starts = [start for start, _ in initial_time_ranges]
+        new_time_ranges = sorted(
+            (window.start.timestamp(), window.end.timestamp())
+            for window in self.partitions_def.time_windows_for_partition_keys(
+                frozenset(partition_keys), validate=validate
+            )
         )
 
         num_added_partitions = 0
-        for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
-            window_start_timestamp = window.start.timestamp()
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window_start_timestamp < included_window.end_timestamp
-                gte_start_of_range = window_start_timestamp >= included_window.start_timestamp
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = self._can_merge_windows(
-                        included_window.end_timestamp, window_start_timestamp
-                    )
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        self._can_merge_windows(
-                            window.end.timestamp(), result_windows[i + 1].start_timestamp
-                        )
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, window.end),
-                            self.partitions_def.timezone,
-                        )
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                    else:
-                        result_windows.insert(
-                            i + 1,
-                            PersistedTimeWindow.from_public_time_window(
-                                window, self.partitions_def.timezone
-                            ),
-                        )
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window_start_timestamp == result_windows[0].start_timestamp:
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end),
-                        self.partitions_def.timezone,
-                    )
-                elif result_windows and window.end.timestamp() == result_windows[0].start_timestamp:
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end),
-                        self.partitions_def.timezone,
-                    )
-                else:
-                    result_windows.insert(
-                        0,
-                        PersistedTimeWindow.from_public_time_window(
-                            window,
-                            self.partitions_def.timezone,
-                        ),
-                    )
-
+        for start, _ in new_time_ranges:
+            i = bisect_right(initial_starts, start) - 1
+            if i < 0 or start >= initial_time_ranges[i][1]:
                 num_added_partitions += 1
 
-        return result_windows, num_added_partitions
+        result_time_ranges = _union_time_ranges(
+            initial_time_ranges, new_time_ranges, can_merge=self._can_merge_windows
+        )
+        return self._time_windows_from_time_ranges(result_time_ranges), num_added_partitions
 
     @public
     def get_partition_keys(self) -> Iterable[str]:
@@ -448,6 +493,20 @@ def with_partitions_def(
             included_time_windows=self_as_dict["included_time_windows"],
         )
 
+    def get_summary_str(self, max_items: int = 5) -> str:
+        # each included time window is a contiguous range of keys, so only the first and last key
+        # of each rendered window need to be computed
+        return format_partitions_summary(
+            [
+                self.partitions_def.get_partition_key_range_for_time_window(
+                    time_window.to_public_time_window(), respect_bounds=False
+                )
+                for time_window in self.included_time_windows[:max_items]
+            ],
+            len(self.included_time_windows) - max_items,
+            len(self),
+        )
+
     def __repr__(self) -> str:
         return f"TimeWindowPartitionsSubset({self.get_partition_key_ranges(self.partitions_def, respect_bounds=False)})"
 
@@ -478,36 +537,9 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
-        self_time_windows_iter = iter(
-            sorted(self.included_time_windows, key=lambda tw: tw.start_timestamp)
-        )
-        other_time_windows_iter = iter(
-            sorted(other.included_time_windows, key=lambda tw: tw.start_timestamp)
+        result_windows = self._time_windows_from_time_ranges(
+            _intersect_time_ranges(self._time_ranges, other._time_ranges)
         )
-
-        result_windows = []
-        self_window = next(self_time_windows_iter, None)
-        other_window = next(other_time_windows_iter, None)
-        while self_window and other_window:
-            # find the intersection between the current two windows
-            start_timestamp = max(self_window.start_timestamp, other_window.start_timestamp)
-            end_timestamp = min(self_window.end_timestamp, other_window.end_timestamp)
-
-            # these windows intersect
-            if start_timestamp < end_timestamp:
-                result_windows.append(
-                    PersistedTimeWindow(
-                        TimestampWithTimezone(start_timestamp, self.partitions_def.timezone),
-                        TimestampWithTimezone(end_timestamp, self.partitions_def.timezone),
-                    )
-                )
-
-            # advance the iterator with the earliest end time to find the next potential intersection
-            if self_window.end_timestamp < other_window.end_timestamp:
-                self_window = next(self_time_windows_iter, None)
-            else:
-                other_window = next(other_time_windows_iter, None)
-
         return TimeWindowPartitionsSubset(
             partitions_def=self.partitions_def,
             num_partitions=None,  # lazily calculated
@@ -519,33 +551,9 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
-        input_time_windows = sorted(
-            [*self.included_time_windows, *other.included_time_windows],
-            key=lambda tw: tw.start_timestamp,
+        result_windows = self._time_windows_from_time_ranges(
+            _union_time_ranges(self._time_ranges, other._time_ranges)
         )
-
-        result_windows = [input_time_windows[0]] if len(input_time_windows) > 0 else []
-
-        for window in input_time_windows[1:]:
-            latest_window = result_windows[-1]
-            if window.start_timestamp <= latest_window.end_timestamp:
-                # merge this window with the latest window
-                merged_window_end = (
-                    latest_window.end_timestamp_with_timezone
-                    if latest_window.end_timestamp >= window.end_timestamp
-                    else window.end_timestamp_with_timezone
-                )
-
-                merged_window = PersistedTimeWindow(
-                    latest_window.start_timestamp_with_timezone,
-                    merged_window_end,
-                )
-
-                # merge this window with the latest window
-                result_windows[-1] = merged_window
-            else:
-                result_windows.append(window)
-
         return TimeWindowPartitionsSubset(
             partitions_def=self.partitions_def,
             num_partitions=None,  # lazily calculated
@@ -557,50 +565,13 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
-        time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start_timestamp)
-        other_time_windows = sorted(other.included_time_windows, key=lambda tw: tw.start_timestamp)
-
-        next_time_window_index_to_process = 0
-        next_other_window_index_to_process = 0
-
-        # Slide through both sets of windows, moving to the next window once its start has passed
-        # the end of the window is it being compared to
-        while (next_time_window_index_to_process < len(time_windows)) and (
-            next_other_window_index_to_process < len(other_time_windows)
-        ):
-            time_window = time_windows[next_time_window_index_to_process]
-            other_time_window = other_time_windows[next_other_window_index_to_process]
-
-            # Perform the subtraction and splice the 0, 1, or 2 result windows
-            # back into the time_windows list
-
-            subtracted_time_windows = time_window.subtract(other_time_window)
-
-            time_windows[
-                next_time_window_index_to_process : next_time_window_index_to_process + 1
-            ] = subtracted_time_windows
-
-            if len(subtracted_time_windows) == 0:
-                # other_time_window fully consumed time_window
-                # next_time_window_index_to_process can stay the same since everything has shifted over one
-                pass
-            else:
-                updated_time_window = time_windows[next_time_window_index_to_process]
-                if updated_time_window.end_timestamp <= other_time_window.start_timestamp:
-                    # Current subtractor is too early to intersect, can advance
-                    next_time_window_index_to_process += 1
-                elif other_time_window.end_timestamp <= updated_time_window.start_timestamp:
-                    # current subtractee is too early to intersect, can advance
-                    next_other_window_index_to_process += 1
-                else:
-                    check.failed(
-                        "After subtraction, the new window should no longer intersect with the other window"
-                    )
-
+        result_windows = self._time_windows_from_time_ranges(
+            _subtract_time_ranges(self._time_ranges, other._time_ranges)
+        )
         return TimeWindowPartitionsSubset(
             partitions_def=self.partitions_def,
             num_partitions=None,
-            included_time_windows=self._without_empty_windows(time_windows),
+            included_time_windows=self._without_empty_windows(result_windows),
         )
 
     def __contains__(self, partition_key: str | None) -> bool:  # ty: ignore[invalid-method-override]
@@ -615,11 +586,8 @@ def __contains__(self, partition_key: str | None) -> bool:  # ty: ignore[invalid
 
         time_window_start_timestamp = time_window.start.timestamp()
 
-        return any(
-            time_window_start_timestamp >= included_time_window.start_timestamp
-            and time_window_start_timestamp < included_time_window.end_timestamp
-            for included_time_window in self.included_time_windows
-        )
+        i = bisect_right(self._time_range_starts, time_window_start_timestamp) - 1
+        return i >= 0 and time_window_start_timestamp < self._time_ranges[i][1]
 
     def __len__(self) -> int:
         return self.num_partitions
@@ -96,7 +96,9 @@ def __new__(
 
     @property
     def start_timestamp(self) -> float:
-        return self._asdict()["start"].timestamp
+        # index into the tuple directly rather than building a dict with _asdict(), since this is
+        # called in tight loops over many windows
+        return tuple.__getitem__(self, 0).timestamp
 
     @property
     def start_timestamp_with_timezone(self) -> TimestampWithTimezone:
@@ -108,7 +110,7 @@ def end_timestamp_with_timezone(self) -> TimestampWithTimezone:
 
     @property
     def end_timestamp(self) -> float:
-        return self._asdict()["end"].timestamp
+        return tuple.__getitem__(self, 1).timestamp
 
     @cached_property
     def start(self) -> datetime:  # ty: ignore[invalid-named-tuple-override]
@@ -5,14 +5,17 @@
 from typing import Literal, NamedTuple, TypeAlias
 
 from dagster_shared.record import record
-from dagster_shared.seven import json
+from dagster_shared.serdes import NamedTupleSerializer
+from dagster_shared.serdes.errors import DeserializationError
+from dagster_shared.seven import JSONDecodeError, json
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
+from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, whitelist_for_serdes
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
 
@@ -93,21 +96,104 @@ class RunShardedEventsCursor(NamedTuple):
 EventCursor: TypeAlias = int | RunShardedEventsCursor
 
 
-@whitelist_for_serdes
+class SerializedEventLogEntry:
+    """The serialized body of an EventLogEntry, as read from an event log storage row, which is only
+    deserialized the first time it is needed.
+
+    Holds the place of the EventLogEntry in the `event_log_entry` field of an EventLogRecord, so that
+    scans that only need the storage id or the indexed columns of each row never parse the event
+    body. It compares and hashes like the deserialized entry, so records read from storage compare
+    equal to the same records built with the deserialized entry.
+    """
+
+    __slots__ = ("_entry", "_event_json", "dagster_event_type", "run_id")
+
+    def __init__(self, event_json: str, run_id: str, dagster_event_type: str | None = None):
+        self._event_json = event_json
+        self._entry: EventLogEntry | None = None
+        self.run_id = run_id
+        self.dagster_event_type = dagster_event_type
+
+    @property
+    def entry(self) -> EventLogEntry:
+        if self._entry is None:
+            try:
+                self._entry = deserialize_value(self._event_json, EventLogEntry)
+            except (JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=self.run_id) from err
+        return self._entry
+
+    @property
+    def is_deserialized(self) -> bool:
+        return self._entry is not None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SerializedEventLogEntry):
+            other = other.entry
+        return self.entry == other
+
+    def __hash__(self) -> int:
+        return hash(self.entry)
+
+    def __repr__(self) -> str:
+        return repr(self.entry)
+
+    def __reduce__(self):
+        return SerializedEventLogEntry, (self._event_json, self.run_id, self.dagster_event_type)
+
+
+class EventLogRecordSerializer(NamedTupleSerializer["EventLogRecord"]):
+    def before_pack(self, value: "EventLogRecord") -> "EventLogRecord":
+        # records read from storage are written with their deserialized entry
+        return value._replace(event_log_entry=value.event_log_entry)
+
+
+@whitelist_for_serdes(serializer=EventLogRecordSerializer)
 @public
-class EventLogRecord(NamedTuple):
+class EventLogRecord(
+    NamedTuple(
+        "_EventLogRecord",
+        [
+            ("storage_id", PublicAttr[int]),
+            ("event_log_entry", PublicAttr[EventLogEntry]),
+        ],
+    )
+):
     """Internal representation of an event record, as stored in a
     :py:class:`~dagster._core.storage.event_log.EventLogStorage`.
 
     Users should not instantiate this class directly.
     """
 
-    storage_id: PublicAttr[int]
-    event_log_entry: PublicAttr[EventLogEntry]
+    @classmethod
+    def from_row(
+        cls,
+        storage_id: int,
+        event_json: str,
+        run_id: str,
+        dagster_event_type: str | None = None,
+    ) -> "EventLogRecord":
+        """Builds a record from an event log storage row, which only deserializes the event body
+        when `event_log_entry` is first accessed. `run_id` and `event_type` are read from the
+        indexed columns of the row instead.
+        """
+        return cls(
+            storage_id=storage_id,
+            event_log_entry=SerializedEventLogEntry(  # type: ignore
+                event_json, run_id, dagster_event_type
+            ),
+        )
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:  # type: ignore[override]
+        entry = super().event_log_entry
+        if isinstance(entry, SerializedEventLogEntry):
+            return entry.entry
+        return entry
 
     @property
     def run_id(self) -> str:
-        return self.event_log_entry.run_id
+        return super().event_log_entry.run_id
 
     @property
     def timestamp(self) -> float:
@@ -143,6 +229,9 @@ def asset_event(self) -> AssetMaterialization | AssetObservation | None:
 
     @property
     def event_type(self) -> DagsterEventType:
+        entry = super().event_log_entry
+        if isinstance(entry, SerializedEventLogEntry) and entry.dagster_event_type is not None:
+            return DagsterEventType(entry.dagster_event_type)
         return check.not_none(
             self.event_log_entry.dagster_event,
             "Expected dagster_event property to be present if calling the event_type property",
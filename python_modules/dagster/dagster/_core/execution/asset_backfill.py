@@ -3,6 +3,7 @@
 import os
 import sys
 import time
+from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
@@ -50,7 +51,6 @@
     DagsterDefinitionChangedDeserializationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import AssetRecordsFilter
 from dagster._core.execution.submit_asset_runs import submit_asset_run
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.dagster_run import NOT_FINISHED_STATUSES, DagsterRunStatus, RunsFilter
@@ -68,6 +68,7 @@
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 if TYPE_CHECKING:
+    from dagster._core.event_api import EventLogRecord
     from dagster._core.execution.backfill import PartitionBackfill
 
 
@@ -79,6 +80,9 @@ def get_asset_backfill_run_chunk_size():
     os.getenv("DAGSTER_ASSET_BACKFILL_MATERIALIZATION_CHUNK_SIZE", "1000")
 )
 
+# bounds the number of run ids in each query for the materializations of a backfill's runs
+BACKFILL_RUN_IDS_CHUNK_SIZE = int(os.getenv("DAGSTER_ASSET_BACKFILL_RUN_IDS_CHUNK_SIZE", "1000"))
+
 
 class AssetBackfillStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
@@ -1297,77 +1301,71 @@ def get_asset_backfill_iteration_materialized_subset(
     asset_graph: RemoteWorkspaceAssetGraph,
     instance_queryer: CachingInstanceQueryer,
 ) -> AssetGraphSubset:
-    """Returns the partitions that have been materialized by the backfill.
-
-    This function is a generator so we can return control to the daemon and let it heartbeat
-    during expensive operations.
-    """
+    """Returns the partitions that have been materialized by the backfill."""
     if asset_backfill_data.latest_storage_id is None:
         return asset_backfill_data.materialized_subset
 
-    recently_materialized_asset_partitions = AssetGraphSubset()
-    for asset_key in asset_backfill_data.target_subset.asset_keys:
+    # fetch the new materializations of all runs in the backfill at once, rather than fetching
+    # the new materializations of each target asset and then looking up the runs they came from
+    target_asset_keys = asset_backfill_data.target_subset.asset_keys
+    run_ids_in_backfill = instance_queryer.instance.get_run_ids(
+        filters=RunsFilter(tags={BACKFILL_ID_TAG: backfill_id})
+    )
+    materialization_records_by_asset_key: dict[AssetKey, list[EventLogRecord]] = defaultdict(list)
+    for i in range(0, len(run_ids_in_backfill), BACKFILL_RUN_IDS_CHUNK_SIZE):
+        run_ids = run_ids_in_backfill[i : i + BACKFILL_RUN_IDS_CHUNK_SIZE]
         cursor = None
         has_more = True
         while has_more:
-            materializations_result = instance_queryer.instance.fetch_materializations(
-                AssetRecordsFilter(
-                    asset_key=asset_key,
+            materializations_result = (
+                instance_queryer.instance.event_log_storage.fetch_materializations_for_runs(
+                    run_ids,
+                    limit=MATERIALIZATION_CHUNK_SIZE,
                     after_storage_id=asset_backfill_data.latest_storage_id,
-                ),
-                cursor=cursor,
-                limit=MATERIALIZATION_CHUNK_SIZE,
+                    cursor=cursor,
+                )
             )
-
             cursor = materializations_result.cursor
             has_more = materializations_result.has_more
 
-            run_ids = [record.run_id for record in materializations_result.records if record.run_id]
-            if run_ids:
-                run_records = instance_queryer.instance.get_run_records(
-                    filters=RunsFilter(run_ids=run_ids),
-                )
-                run_ids_in_backfill = {
-                    run_record.dagster_run.run_id
-                    for run_record in run_records
-                    if run_record.dagster_run.tags.get(BACKFILL_ID_TAG) == backfill_id
-                }
-
-                materialization_records_in_backfill = [
-                    record
-                    for record in materializations_result.records
-                    if record.run_id in run_ids_in_backfill
-                ]
+            for record in materializations_result.records:
+                if record.asset_key in target_asset_keys:
+                    materialization_records_by_asset_key[record.asset_key].append(record)
 
-                # Validate partition consistency for materializations in this backfill
-                asset_is_partitioned_in_target = (
-                    asset_key in asset_backfill_data.target_subset.partitions_subsets_by_asset_key
+    recently_materialized_asset_partitions = AssetGraphSubset()
+    for (
+        asset_key,
+        materialization_records_in_backfill,
+    ) in materialization_records_by_asset_key.items():
+        # Validate partition consistency for materializations in this backfill
+        asset_is_partitioned_in_target = (
+            asset_key in asset_backfill_data.target_subset.partitions_subsets_by_asset_key
+        )
+        asset_is_non_partitioned_in_target = (
+            asset_key in asset_backfill_data.target_subset.non_partitioned_asset_keys
+        )
+
+        for record in materialization_records_in_backfill:
+            if asset_is_partitioned_in_target and record.partition_key is None:
+                raise DagsterBackfillFailedError(
+                    f"Asset {asset_key.to_user_string()} is partitioned in the backfill target "
+                    f"subset, but received an unpartitioned materialization from run {record.run_id}. "
+                    f"All materializations for this asset in this backfill must be partitioned."
                 )
-                asset_is_non_partitioned_in_target = (
-                    asset_key in asset_backfill_data.target_subset.non_partitioned_asset_keys
+            elif asset_is_non_partitioned_in_target and record.partition_key is not None:
+                raise DagsterBackfillFailedError(
+                    f"Asset {asset_key.to_user_string()} is unpartitioned in the backfill target "
+                    f"subset, but received a partitioned materialization (partition_key={record.partition_key}) "
+                    f"from run {record.run_id}. All materializations for this asset in this backfill must be unpartitioned."
                 )
 
-                for record in materialization_records_in_backfill:
-                    if asset_is_partitioned_in_target and record.partition_key is None:
-                        raise DagsterBackfillFailedError(
-                            f"Asset {asset_key.to_user_string()} is partitioned in the backfill target "
-                            f"subset, but received an unpartitioned materialization from run {record.run_id}. "
-                            f"All materializations for this asset in this backfill must be partitioned."
-                        )
-                    elif asset_is_non_partitioned_in_target and record.partition_key is not None:
-                        raise DagsterBackfillFailedError(
-                            f"Asset {asset_key.to_user_string()} is unpartitioned in the backfill target "
-                            f"subset, but received a partitioned materialization (partition_key={record.partition_key}) "
-                            f"from run {record.run_id}. All materializations for this asset in this backfill must be unpartitioned."
-                        )
-
-                recently_materialized_asset_partitions |= AssetGraphSubset.from_asset_partition_set(
-                    {
-                        AssetKeyPartitionKey(asset_key, record.partition_key)
-                        for record in materialization_records_in_backfill
-                    },
-                    asset_graph,
-                )
+        recently_materialized_asset_partitions |= AssetGraphSubset.from_asset_partition_set(
+            {
+                AssetKeyPartitionKey(asset_key, record.partition_key)
+                for record in materialization_records_in_backfill
+            },
+            asset_graph,
+        )
 
     updated_materialized_subset = (
         asset_backfill_data.materialized_subset | recently_materialized_asset_partitions
@@ -1,5 +1,8 @@
+import heapq
+import itertools
 import logging
 import time
+from collections import defaultdict
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, cast
@@ -89,7 +92,15 @@ def __init__(
         self._step_outputs: set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: dict[str, set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: dict[str, set[str]] = {}
+
+        # With the default step dependency config, a pending step is ready once every step it
+        # depends on has resolved, so instead of rescanning all pending steps we count the
+        # unresolved upstream steps of each pending step and update the counts as steps resolve
+        self._resolved: set[str] = set()
+        self._num_unresolved_deps: dict[str, int] = {}
+        self._pending_downstream: dict[str, set[str]] = defaultdict(set)
+        self._ready_to_check: dict[str, None] = {}
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -103,8 +114,10 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: list[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by sort key, then by the order in which steps became executable
+        self._executable: list[tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: list[str] = []
         self._pending_retry: list[str] = []
         self._pending_abandon: list[str] = []
@@ -125,6 +138,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -178,7 +194,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in self._executable]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -200,8 +219,13 @@ def _pending_state_str(self) -> str:
             ),
         )
 
+    def _is_successful_or_skipped(self, step_key: str) -> bool:
+        return step_key in self._success or step_key in self._skipped
+
+    def _is_failed_or_abandoned(self, step_key: str) -> bool:
+        return step_key in self._failed or step_key in self._abandoned
+
     def _should_skip_step(self, step_key: str) -> bool:
-        successful_or_skipped_steps = self._success | self._skipped
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             # Blocking asset checks gate downstream on check failure (a yielded
@@ -221,12 +245,12 @@ def _should_skip_step(self, step_key: str) -> bool:
             missing_gating_handles = [
                 h
                 for h in gating_dep_handles
-                if h.step_key in successful_or_skipped_steps and h not in self._step_outputs
+                if self._is_successful_or_skipped(h.step_key) and h not in self._step_outputs
             ]
             missing_check_handles = [
                 h
                 for h in check_dep_handles
-                if h.step_key in successful_or_skipped_steps and h not in self._step_outputs
+                if self._is_successful_or_skipped(h.step_key) and h not in self._step_outputs
             ]
 
             for source_handle in missing_check_handles:
@@ -252,13 +276,12 @@ def _should_skip_step(self, step_key: str) -> bool:
         return False
 
     def _all_upstream_outputs_failed_or_abandoned(self, step_key: str) -> bool:
-        failed_or_abandoned_steps = self._failed | self._abandoned
         # check that all upstream outputs have failed or been abandoned
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             if any(
                 source_handle not in self._step_outputs
-                and source_handle.step_key in failed_or_abandoned_steps
+                and self._is_failed_or_abandoned(source_handle.step_key)
                 for source_handle in step_input.get_step_output_handle_dependencies()
             ):
                 return True
@@ -292,6 +315,43 @@ def _all_upstream_outputs_produced(self, step_key: str) -> bool:
                 return False
         return True
 
+    def _add_pending(self, step_key: str, depends_on_steps: set[str]) -> None:
+        self._pending[step_key] = depends_on_steps
+        if not self._step_dependency_config.require_upstream_step_success:
+            return
+
+        num_unresolved_deps = 0
+        for dep_key in depends_on_steps:
+            if dep_key not in self._resolved:
+                num_unresolved_deps += 1
+                self._pending_downstream[dep_key].add(step_key)
+        self._num_unresolved_deps[step_key] = num_unresolved_deps
+        if num_unresolved_deps == 0:
+            self._ready_to_check[step_key] = None
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Called once a step has succeeded, failed, been skipped or been abandoned. Only visits the
+        pending steps that depend on it.
+        """
+        self._resolved.add(step_key)
+        for downstream_key in self._pending_downstream.pop(step_key, ()):
+            depends_on_steps = self._pending.get(downstream_key)
+            if depends_on_steps is None or step_key not in depends_on_steps:
+                continue
+            self._num_unresolved_deps[downstream_key] -= 1
+            if self._num_unresolved_deps[downstream_key] == 0:
+                self._ready_to_check[downstream_key] = None
+
+    def _add_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
@@ -303,23 +363,27 @@ def _update(self) -> None:
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-        for step_key, depends_on_steps in self._pending.items():
-            # traditional behavior, wait for all upstream steps before executing
-            if self._step_dependency_config.require_upstream_step_success:
-                if depends_on_steps.issubset(resolved_steps):
-                    if self._should_skip_step(step_key):
-                        new_steps_to_skip.append(step_key)
-                    elif depends_on_steps.intersection(self._failed | self._abandoned):
-                        new_steps_to_abandon.append(step_key)
-                    else:
-                        new_steps_to_execute.append(step_key)
-            # optional behavior, executes as soon as all upstream outputs are available
-            else:
+        # traditional behavior, wait for all upstream steps before executing
+        if self._step_dependency_config.require_upstream_step_success:
+            ready_steps = list(self._ready_to_check)
+            self._ready_to_check.clear()
+            for step_key in ready_steps:
+                depends_on_steps = self._pending.get(step_key)
+                if depends_on_steps is None or self._num_unresolved_deps[step_key] != 0:
+                    continue
+                if self._should_skip_step(step_key):
+                    new_steps_to_skip.append(step_key)
+                elif any(self._is_failed_or_abandoned(dep_key) for dep_key in depends_on_steps):
+                    new_steps_to_abandon.append(step_key)
+                else:
+                    new_steps_to_execute.append(step_key)
+        # optional behavior, executes as soon as all upstream outputs are available
+        else:
+            for step_key in self._pending:
                 if self._should_skip_step(step_key):
                     new_steps_to_skip.append(step_key)
                 elif self._all_upstream_outputs_failed_or_abandoned(step_key):
@@ -328,16 +392,16 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._add_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -346,9 +410,13 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        self._num_unresolved_deps.pop(step_key, None)
+
     def sleep_interval(self):
         now = time.time()
         intervals = []
@@ -397,11 +465,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -411,8 +474,10 @@ def get_steps_to_execute(
             )
 
         batch: list[ExecutionStep] = []
+        # executable steps that are blocked by concurrency limits are returned to the heap
+        blocked: list[tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -422,8 +487,12 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
             if run_scoped_concurrency_limits_counter:
@@ -440,13 +509,16 @@ def get_steps_to_execute(
                 if not self._instance_concurrency_context.claim(
                     concurrency_key, step.key, step_priority
                 ):
+                    blocked.append(entry)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -455,13 +527,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -470,11 +541,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -526,20 +597,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -559,11 +634,12 @@ def mark_up_for_retry(self, step_key: str, at_time: float | None = None) -> None
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -1204,6 +1204,8 @@ def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, r
     - if there is at least one input, where none of the upstream steps have yielded an
       output, we should skip the step.
     """
+    from dagster._core.events import DagsterEventType
+
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(instance, "instance", DagsterInstance)
     check.str_param(run_id, "run_id")
@@ -1226,9 +1228,9 @@ def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, r
         return False
 
     # find all yielded step outputs
-    all_logs = instance.all_logs(run_id)
     yielded_step_output_handles = set()
-    for event_record in all_logs:
+    for record in instance.iter_records_for_run(run_id, of_type=DagsterEventType.STEP_OUTPUT):
+        event_record = record.event_log_entry
         if event_record.dagster_event and event_record.dagster_event.is_successful_output:
             yielded_step_output_handles.add(
                 event_record.dagster_event.event_specific_data.step_output_handle  # type: ignore
@@ -232,7 +232,7 @@ def _derive_state_of_past_run(
     check.opt_inst_param(parent_run, "parent_run", DagsterRun)
 
     parent_run_id = parent_run.run_id
-    parent_run_logs = instance.all_logs(
+    parent_run_records = instance.iter_records_for_run(
         parent_run_id,
         of_type={
             DagsterEventType.STEP_START,
@@ -269,7 +269,7 @@ def _derive_state_of_past_run(
     interrupted_steps_in_parent_run_logs: TrackingDict = defaultdict(set)
     skipped_steps_in_parent_run_logs: TrackingDict = defaultdict(set)
 
-    for record in parent_run_logs:
+    for record in (record.event_log_entry for record in parent_run_records):
         if record.dagster_event and record.dagster_event.step_handle:
             step_handle = record.dagster_event.step_handle
             _update_tracking_dict(all_steps_in_parent_run_logs, step_handle)
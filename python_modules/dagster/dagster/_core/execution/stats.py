@@ -37,6 +37,16 @@
     *MARKER_EVENTS,
 }
 
+# step events whose contribution to step stats depends only on their type and timestamp
+STEP_LIFECYCLE_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+}
+
 
 def build_run_stats_from_events(
     run_id: str,
@@ -49,8 +59,6 @@ def build_run_stats_from_events(
         raise check.ParameterCheckError(
             "Invariant violation for parameter 'records'. Description: Expected iterable."
         ) from exc
-    for i, entry in enumerate(entries):
-        check.inst_param(entry, f"entries[{i}]", EventLogEntry)
 
     if previous_stats:
         steps_succeeded = previous_stats.steps_succeeded
@@ -71,7 +79,9 @@ def build_run_stats_from_events(
         start_time = None
         end_time = None
 
-    for event in entries:
+    # entries may be a lazily streamed iterator, so they are checked as they are consumed
+    for i, event in enumerate(entries):
+        check.inst_param(event, f"entries[{i}]", EventLogEntry)
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
@@ -193,6 +203,17 @@ def __new__(
         )
 
 
+@record
+class StepLifecycleEvent:
+    """A step lifecycle event, as read from the indexed columns of an event log storage without
+    deserializing the full event.
+    """
+
+    step_key: str
+    event_type: DagsterEventType
+    timestamp: float
+
+
 @whitelist_for_serdes
 @record
 class RunStepStatsSnapshot:
@@ -203,7 +224,7 @@ class RunStepStatsSnapshot:
 
 def build_run_step_stats_from_events(
     run_id: str,
-    entries: Iterable[EventLogEntry],
+    entries: Iterable[EventLogEntry | StepLifecycleEvent],
 ) -> Sequence[RunStepKeyStatsSnapshot]:
     snapshot = build_run_step_stats_snapshot_from_events(run_id, entries)
     return snapshot.step_key_stats
@@ -211,9 +232,12 @@ def build_run_step_stats_from_events(
 
 def build_run_step_stats_snapshot_from_events(
     run_id: str,
-    entries: Iterable[EventLogEntry],
+    entries: Iterable[EventLogEntry | StepLifecycleEvent],
     previous_snapshot: Optional["RunStepStatsSnapshot"] = None,
 ) -> "RunStepStatsSnapshot":
+    """Folds a run's step events, in storage order, into per-step stats. Lifecycle events may be
+    passed as StepLifecycleEvents, so that storages can avoid deserializing them.
+    """
     by_step_key: dict[str, dict[str, Any]] = defaultdict(dict)
     attempts = defaultdict(list)
     markers: dict[str, dict[str, Any]] = defaultdict(dict)
@@ -252,27 +276,55 @@ def build_run_step_stats_snapshot_from_events(
                         "end": marker.end_time,
                     }
 
-    def _open_attempt(step_key: str, event: EventLogEntry) -> None:
+    def _open_attempt(step_key: str, timestamp: float) -> None:
         by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        by_step_key[step_key]["partial_attempt_start"] = event.timestamp
+        by_step_key[step_key]["partial_attempt_start"] = timestamp
 
-    def _close_attempt(step_key: str, event: EventLogEntry) -> None:
+    def _close_attempt(step_key: str, timestamp: float) -> None:
         start_time = by_step_key[step_key].get("partial_attempt_start")
 
         if start_time is None:
             # this should only happen if the step was retried before starting (weird)
             by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-            start_time = event.timestamp
+            start_time = timestamp
 
         attempts[step_key].append(
             RunStepMarker(
                 start_time=start_time,
-                end_time=event.timestamp,
+                end_time=timestamp,
             )
         )
         by_step_key[step_key]["partial_attempt_start"] = None
 
+    def _apply_lifecycle_event(
+        step_key: str, event_type: DagsterEventType, timestamp: float
+    ) -> None:
+        if event_type == DagsterEventType.STEP_START:
+            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
+            by_step_key[step_key]["start_time"] = timestamp
+            _open_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_RESTARTED:
+            _open_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_FAILURE:
+            by_step_key[step_key]["end_time"] = timestamp
+            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_SUCCESS:
+            by_step_key[step_key]["end_time"] = timestamp
+            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
+            _close_attempt(step_key, timestamp)
+        if event_type == DagsterEventType.STEP_SKIPPED:
+            by_step_key[step_key]["end_time"] = timestamp
+            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+            _close_attempt(step_key, timestamp)
+
     for event in entries:
+        if isinstance(event, StepLifecycleEvent):
+            _apply_lifecycle_event(event.step_key, event.event_type, event.timestamp)
+            continue
+
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
@@ -284,26 +336,8 @@ def _close_attempt(step_key: str, event: EventLogEntry) -> None:
         if dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-            by_step_key[step_key]["start_time"] = event.timestamp
-            _open_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            _open_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-            _close_attempt(step_key, event)
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-            _close_attempt(step_key, event)
+        if dagster_event.event_type in STEP_LIFECYCLE_EVENT_TYPES:
+            _apply_lifecycle_event(step_key, dagster_event.event_type, event.timestamp)
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materialization_events = by_step_key[step_key].get("materialization_events", [])
             materialization_events.append(event)
@@ -8,7 +8,7 @@
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Literal, NamedTuple, Union
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
@@ -56,6 +56,24 @@ def execute(self) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
         """
 
 
+class ChildProcessWorkerCommand(ABC):
+    """Inherit from this class in order to execute a command in a long-lived ChildProcessWorker.
+
+    The object must be picklable. Since multiprocessing events can only be shared with a child
+    process through inheritance, the worker's termination event is passed in at execution time
+    rather than stored on the command.
+    """
+
+    @abstractmethod
+    def execute_with_term_event(
+        self, term_event: Any
+    ) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the worker process.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute.
+        """
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -92,6 +110,42 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+def _execute_commands_in_worker_process(
+    command_queue: Queue, event_queue: Queue, term_event: Any
+) -> None:
+    """Executes ChildProcessWorkerCommands from the command queue one at a time until a None
+    sentinel is received.
+
+    Each command is wrapped the same way as in _execute_command_in_child_process, so the parent
+    process sees the same start / done / error events for every command.
+    """
+    while True:
+        command = command_queue.get()
+        if command is None:
+            return
+
+        check.inst(command, ChildProcessWorkerCommand)
+
+        with capture_interrupts():
+            pid = os.getpid()
+            event_queue.put(ChildProcessStartEvent(pid=pid))
+            try:
+                for step_event in command.execute_with_term_event(term_event):
+                    event_queue.put(step_event)
+                event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                event_queue.put(
+                    ChildProcessSystemErrorEvent(
+                        pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                )
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -174,3 +228,129 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+"""Seconds to wait for an idle worker to exit after being asked to shut down."""
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessWorkerCommands one at a time.
+
+    Anything the worker loads while executing a command (imported modules, cached definitions)
+    stays loaded for subsequent commands, which avoids paying process startup costs per command.
+    """
+
+    def __init__(self, multiprocessing_ctx: MultiprocessingBaseContext):
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, self.term_event),
+        )
+        self.process.start()
+        self.commands_executed = 0
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def execute(
+        self, command: ChildProcessWorkerCommand
+    ) -> Iterator[Union["DagsterEvent", ChildProcessEvent] | None]:
+        """Execute a ChildProcessWorkerCommand in this worker.
+
+        Yields the same objects as execute_child_process_command, except for the process object,
+        which is available as the ``process`` attribute of the worker. Raises a
+        ChildProcessCrashException if the worker dies before the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+        self.commands_executed += 1
+        # reset the termination event before dispatching the command rather than when the worker
+        # dequeues it, so that an interrupt sent in between still applies to this command
+        self.term_event.clear()
+        self._command_queue.put(command)
+
+        completed_properly = False
+
+        while not completed_properly:
+            event = _poll_for_event(self.process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException(pid=self.process.pid, exit_code=self.process.exitcode)
+
+    def shutdown(self) -> None:
+        if self.process.is_alive():
+            self._command_queue.put(None)
+            self.process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of reusable ChildProcessWorkers.
+
+    Workers are started on demand when no idle worker is available, so the pool never holds more
+    workers than the number of commands executing concurrently. A worker is retired once it has
+    executed ``max_commands_per_worker`` commands, or if its process has died.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: int | None = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._idle_workers: list[ChildProcessWorker] = []
+        self._workers: list[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.shutdown()
+
+    def acquire(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+            self._retire(worker)
+
+        worker = ChildProcessWorker(self._multiprocessing_ctx)
+        self._workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        if worker.is_alive() and (
+            self._max_commands_per_worker is None
+            or worker.commands_executed < self._max_commands_per_worker
+        ):
+            self._idle_workers.append(worker)
+        else:
+            self._retire(worker)
+
+    def _retire(self, worker: ChildProcessWorker) -> None:
+        worker.shutdown()
+        self._workers.remove(worker)
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
+        self._idle_workers = []
@@ -36,6 +36,9 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -50,7 +53,7 @@
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
 
-class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
+class MultiprocessExecutorChildProcessCommand(ChildProcessCommand, ChildProcessWorkerCommand):
     def __init__(
         self,
         run_config: Mapping[str, object],
@@ -74,10 +77,13 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
+        yield from self.execute_with_term_event(self.term_event)
+
+    def execute_with_term_event(self, term_event: Any) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            start_termination_thread(term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -108,7 +114,7 @@ def execute(self) -> Iterator[DagsterEvent]:
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -120,6 +126,8 @@ def __init__(
         start_method: str | None = None,
         explicit_forkserver_preload: Sequence[str] | None = None,
         step_dependency_config: StepDependencyConfig = StepDependencyConfig.default(),
+        use_worker_pool: bool = False,
+        max_steps_per_worker: int | None = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self._step_dependency_config = check.inst_param(
@@ -149,6 +157,14 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        if self._max_steps_per_worker is not None and self._max_steps_per_worker < 1:
+            raise DagsterUnmetExecutorRequirementsError(
+                f"max_steps_per_worker must be a positive integer, got {self._max_steps_per_worker}."
+            )
 
     @property
     def retries(self) -> RetryMode:
@@ -203,6 +219,16 @@ def execute(
         with ExitStack() as stack:
             timer_result = stack.enter_context(time_execution_scope())
 
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx, max_commands_per_worker=self._max_steps_per_worker
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
+
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.dagster_run)
             )
@@ -251,19 +277,35 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                processes,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
+                            if worker_pool:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -433,3 +475,50 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: dict[int, SerializableErrorInfo],
+    processes: dict[str, BaseProcess],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: RepositoryLoadData | None,
+) -> Iterator[DagsterEvent | None]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        # the worker process supplies its own termination event
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Dispatching "{step.key}" to worker process (pid: {worker.process.pid}).',
+        metadata={
+            "steps_executed_by_worker": MetadataValue.int(worker.commands_executed),
+        },
+    )
+
+    processes[step.key] = worker.process
+    try:
+        for ret in worker.execute(command):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed(f"Unexpected return value from worker process {type(ret)}")
+    finally:
+        worker_pool.release(worker)
@@ -574,6 +574,34 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "local_startup_timeout": Field(int, is_required=False),
                 "reload_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "snapshot_cache": Field(
+                    {
+                        "enabled": Field(
+                            Bool,
+                            is_required=False,
+                            default_value=False,
+                            description=(
+                                "Whether to cache the repository snapshots fetched from code "
+                                "servers on disk, so that the processes on a host share them "
+                                "instead of each fetching them over gRPC."
+                            ),
+                        ),
+                        "directory": Field(
+                            StringSource,
+                            is_required=False,
+                            description=(
+                                "The directory to store cached snapshots in. Defaults to the "
+                                "snapshot_cache directory in the instance's root directory."
+                            ),
+                        ),
+                        "max_entries": Field(
+                            int,
+                            is_required=False,
+                            description="The number of cached snapshots to keep.",
+                        ),
+                    },
+                    is_required=False,
+                ),
             },
             is_required=False,
         ),
@@ -609,6 +637,21 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
             }
         ),
         "freshness": Field({"enabled": Field(Bool)}, is_required=False),
+        "partition_status_cache": Field(
+            {
+                "enabled": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to run a daemon that keeps the cached partition status of each "
+                        "partitioned asset up to date with the event log, so that reads can use "
+                        "the cached values without rebuilding them."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
         "concurrency": get_concurrency_config(),
     }
 
@@ -0,0 +1,146 @@
+import atexit
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+# buffers with a running flush thread, flushed at exit. Held weakly, so that a buffer that is
+# never disposed can still be garbage collected.
+_live_buffers: "weakref.WeakSet[EventWriteBehindBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_buffers() -> None:
+    # daemon threads are stopped abruptly at exit, so flush whatever is left
+    for buffer in list(_live_buffers):
+        try:
+            buffer.flush()
+        except Exception as e:
+            sys.stderr.write(f"Exception while flushing buffered events at exit: {e}\n")
+
+
+class EventWriteBehindBuffer:
+    """Buffers events in memory and writes them to storage in batches, either from the thread that
+    reported them once `max_batch_size` events are buffered, or from a background thread every
+    `flush_interval_seconds`.
+
+    Each flush writes every buffered event in the order the events were reported, and flushes are
+    serialized, so events are stored in the order they were reported. Callers that need an event to
+    be stored before they continue (e.g. to write an event that must not be buffered after the
+    buffered events) call `flush` first.
+
+    The buffer is flushed when it is disposed and when the process exits.
+
+    Args:
+        store_events (Callable[[Sequence[EventLogEntry]], None]): Stores a batch of events.
+        on_events_stored (Callable[[Sequence[EventLogEntry]], None]): Called with each batch of
+            events after it is stored.
+        max_batch_size (int): The number of buffered events that triggers a flush.
+        flush_interval_seconds (float): The longest an event stays in the buffer before it is
+            flushed by the background thread.
+    """
+
+    def __init__(
+        self,
+        store_events: Callable[[Sequence["EventLogEntry"]], None],
+        on_events_stored: Callable[[Sequence["EventLogEntry"]], None],
+        max_batch_size: int,
+        flush_interval_seconds: float,
+    ):
+        self._store_events = check.callable_param(store_events, "store_events")
+        self._on_events_stored = check.callable_param(on_events_stored, "on_events_stored")
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+
+        self._events: list[EventLogEntry] = []
+        # guards self._events
+        self._buffer_lock = threading.Lock()
+        # held while a batch is written, so that batches are stored in order
+        self._flush_lock = threading.RLock()
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._disposed = False
+
+    def append(self, event: "EventLogEntry") -> None:
+        check.invariant(not self._disposed, "Cannot append events to a disposed buffer")
+        with self._buffer_lock:
+            self._events.append(event)
+            should_flush = len(self._events) >= self._max_batch_size
+            if self._flush_thread is None:
+                self._start_flush_thread()
+
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._buffer_lock:
+                events, self._events = self._events, []
+            if not events:
+                return
+
+            try:
+                self._store_events(events)
+            except Exception as e:
+                # fall back to storing events one at a time, so that an event that cannot be
+                # stored does not prevent the rest of the batch from being stored
+                sys.stderr.write(f"Exception while storing buffered events: {e}\n")
+                sys.stderr.write("Falling back to storing buffered events one at a time...\n")
+                stored_events = []
+                for event in events:
+                    try:
+                        self._store_events([event])
+                        stored_events.append(event)
+                    except Exception as event_exc:
+                        sys.stderr.write(f"Exception while storing buffered event: {event_exc}\n")
+                events = stored_events
+
+            self._on_events_stored(events)
+
+    def dispose(self) -> None:
+        if self._disposed:
+            return
+        self._disposed = True
+        self._shutdown_event.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            _live_buffers.discard(self)
+        self.flush()
+
+    def _start_flush_thread(self) -> None:
+        # the thread only holds a weak reference to the buffer, so that it does not keep a buffer
+        # that is never disposed alive
+        self._flush_thread = threading.Thread(
+            target=_flush_loop,
+            args=(weakref.ref(self), self._shutdown_event, self._flush_interval_seconds),
+            name="event-write-behind",
+            daemon=True,
+        )
+        self._flush_thread.start()
+        _live_buffers.add(self)
+
+
+def _flush_loop(
+    buffer_ref: "weakref.ref[EventWriteBehindBuffer]",
+    shutdown_event: threading.Event,
+    flush_interval_seconds: float,
+) -> None:
+    while not shutdown_event.wait(flush_interval_seconds):
+        buffer = buffer_ref()
+        if buffer is None:
+            return
+        try:
+            buffer.flush()
+        except Exception as e:
+            sys.stderr.write(f"Exception in event write-behind thread: {e}\n")
+        # drop the reference while waiting, so that the buffer can be garbage collected
+        del buffer
@@ -17,6 +17,7 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.instance.config import DAGSTER_CONFIG_YAML_FILENAME
+from dagster._core.instance.events.write_behind import EventWriteBehindBuffer
 from dagster._core.instance.methods.asset_methods import AssetMethods
 from dagster._core.instance.methods.daemon_methods import DaemonMethods
 from dagster._core.instance.methods.event_methods import EventMethods
@@ -27,6 +28,10 @@
 from dagster._core.instance.methods.storage_methods import StorageMethods
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.instance.types import DynamicPartitionsStore, InstanceType
+from dagster._core.instance.utils import (
+    _get_event_write_behind_batch_size,
+    _get_event_write_behind_interval_seconds,
+)
 from dagster._core.storage.dagster_run import DagsterRun, RunsFilter
 from dagster._serdes import ConfigurableClass
 from dagster._utils import PrintFn, traced
@@ -231,6 +236,18 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: dict[str, list[EventLogEntry]] = defaultdict(list)
 
+        # Used for write-behind event handling
+        self._event_write_behind_buffer: EventWriteBehindBuffer | None = (
+            EventWriteBehindBuffer(
+                store_events=self._event_storage.store_unindexed_event_batch,
+                on_events_stored=self._handle_stored_events,
+                max_batch_size=_get_event_write_behind_batch_size(),
+                flush_interval_seconds=_get_event_write_behind_interval_seconds(),
+            )
+            if _get_event_write_behind_batch_size() > 0
+            else None
+        )
+
     # =====================================================================================
     # PUBLIC API METHODS
     # =====================================================================================
@@ -875,6 +892,8 @@ def upgrade(self, print_fn: PrintFn | None = None) -> None:
             self._schedule_storage.migrate(print_fn)  # type: ignore  # (possible none)
 
     def dispose(self) -> None:
+        if self._event_write_behind_buffer:
+            self._event_write_behind_buffer.dispose()
         StorageMethods.dispose(self)
         if self._run_coordinator:
             self._run_coordinator.dispose()
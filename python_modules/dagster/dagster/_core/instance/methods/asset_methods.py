@@ -22,6 +22,7 @@
         AssetMaterializationHealthState,
         MinimalAssetMaterializationHealthState,
     )
+    from dagster._core.definitions.events import AssetKeyPartitionKey
     from dagster._core.definitions.freshness import FreshnessStateRecord
     from dagster._core.definitions.partitions.definition.partitions_definition import (
         PartitionsDefinition,
@@ -225,6 +226,35 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    @traced
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        """Fetch the latest materialization or observation storage id for each partition of each of
+        the given asset keys, in bulk.
+        """
+        return self._event_storage_impl.get_latest_storage_ids_by_partition_for_assets(
+            asset_keys, event_type
+        )
+
+    @traced
+    def get_latest_asset_partition_records(
+        self,
+        asset_partitions: Sequence["AssetKeyPartitionKey"],
+        event_type: "DagsterEventType",
+    ) -> Mapping["AssetKeyPartitionKey", "EventLogRecord"]:
+        """Fetch the latest materialization or observation record for each of the given asset
+        partitions, in bulk.
+
+        An asset partition with a `None` partition key maps to the latest event for the asset
+        across all of its partitions. Asset partitions without any such event are omitted.
+        """
+        return self._event_storage_impl.get_latest_asset_partition_records(
+            asset_partitions, event_type
+        )
+
     @deprecated(breaking_version="2.0")
     def fetch_planned_materializations(
         self,
@@ -54,6 +54,10 @@ def auto_materialize_use_sensors(self) -> bool: ...
     @abstractmethod
     def freshness_enabled(self) -> bool: ...
 
+    @property
+    @abstractmethod
+    def partition_status_cache_daemon_enabled(self) -> bool: ...
+
     def add_daemon_heartbeat(self, daemon_heartbeat: "DaemonHeartbeat") -> None:
         """Called on a regular interval by the daemon."""
         self.run_storage.add_daemon_heartbeat(daemon_heartbeat)
@@ -77,6 +81,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
             SensorDaemon,
         )
         from dagster._daemon.freshness import FreshnessDaemon
+        from dagster._daemon.partition_status_cache import PartitionStatusCacheDaemon
         from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
             QueuedRunCoordinatorDaemon,
         )
@@ -97,6 +102,8 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(AssetDaemon.daemon_type())
         if self.freshness_enabled:
             daemons.append(FreshnessDaemon.daemon_type())
+        if self.partition_status_cache_daemon_enabled:
+            daemons.append(PartitionStatusCacheDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
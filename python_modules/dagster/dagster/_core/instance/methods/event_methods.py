@@ -4,7 +4,7 @@
 import logging.config
 import sys
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Optional, Union
 
 import dagster._check as check
@@ -57,6 +57,11 @@ def _event_buffer_impl(self):
         """Access to event buffer."""
         return self._instance._event_buffer  # noqa: SLF001
 
+    @property
+    def _event_write_behind_buffer_impl(self):
+        """Access to the event write-behind buffer."""
+        return self._instance._event_write_behind_buffer  # noqa: SLF001
+
     @property
     def _run_storage_impl(self):
         """Access to run storage."""
@@ -108,6 +113,17 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Union["DagsterEventType", set["DagsterEventType"]] | None = None,
+        ascending: bool = True,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over all event records for run, without loading the full event log into memory."""
+        return self._event_storage_impl.iter_records_for_run(
+            run_id, of_type=of_type, ascending=ascending
+        )
+
     def watch_event_logs(self, run_id: str, cursor: str | None, cb: "EventHandlerFn") -> None:
         """Watch event logs."""
         return self._event_storage_impl.watch(run_id, cursor, cb)
@@ -206,13 +222,18 @@ def handle_new_event(
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        from dagster._core.events import RunFailureReason
-        from dagster._core.storage.tags import RUN_FAILURE_REASON_TAG, WILL_RETRY_TAG
-        from dagster._time import datetime_from_timestamp
-
         if not self.should_store_event(event):
             return
 
+        write_behind_buffer = self._event_write_behind_buffer_impl
+        if write_behind_buffer is not None:
+            if _is_write_behind_event(event):
+                write_behind_buffer.append(event)
+                return
+            # store the buffered events first, so that events are stored in the order in which they
+            # were reported
+            write_behind_buffer.flush()
+
         if batch_metadata is None or not self._is_batch_writing_enabled():
             events = [event]
         else:
@@ -245,6 +266,16 @@ def handle_new_event(
                 for event in events:
                     self._event_storage_impl.store_event(event)
 
+        self._handle_stored_events(events)
+
+    def _handle_stored_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Updates the run storage for run status events and notifies subscribers, once events have
+        been stored.
+        """
+        from dagster._core.events import RunFailureReason
+        from dagster._core.storage.tags import RUN_FAILURE_REASON_TAG, WILL_RETRY_TAG
+        from dagster._time import datetime_from_timestamp
+
         for event in events:
             run_id = event.run_id
             if (
@@ -485,3 +516,20 @@ def get_handlers(self) -> Sequence[logging.Handler]:
         handlers: list[logging.Handler] = [self.get_event_log_handler()]
         handlers.extend(self.get_yaml_python_handlers())
         return handlers
+
+
+def _is_write_behind_event(event: "EventLogEntry") -> bool:
+    """Whether the event can be buffered by the write-behind buffer, i.e. whether it is only stored
+    in the event log. Asset and asset check events are also indexed when they are stored, and run
+    status events update the run storage, so they are stored synchronously.
+    """
+    from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
+
+    if not event.is_dagster_event:
+        return True
+    dagster_event = event.get_dagster_event()
+    return not (
+        dagster_event.is_job_event
+        or dagster_event.event_type in ASSET_EVENTS
+        or dagster_event.event_type in ASSET_CHECK_EVENTS
+    )
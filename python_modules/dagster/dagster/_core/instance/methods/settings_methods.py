@@ -1,7 +1,9 @@
 """Settings methods for DagsterInstance."""
 
+import os
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional
 
 import dagster._check as check
 from dagster._core.instance.config import (
@@ -11,6 +13,9 @@
 
 if TYPE_CHECKING:
     from dagster._core.launcher import RunLauncher
+    from dagster._core.remote_representation.repository_snapshot_cache import (
+        RepositorySnapshotCache,
+    )
     from dagster._core.run_coordinator import RunCoordinator
 
 
@@ -30,6 +35,11 @@ def is_ephemeral(self) -> bool:
         """Property that should be implemented by the concrete class."""
         raise NotImplementedError
 
+    @property
+    def root_directory(self) -> str:
+        """Property that should be implemented by the concrete class."""
+        raise NotImplementedError
+
     @property
     def run_launcher(self) -> "RunLauncher":
         """Property that should be implemented by the concrete class."""
@@ -131,6 +141,24 @@ def code_server_reload_timeout(self) -> int:
     def wait_for_local_code_server_processes_on_shutdown(self) -> bool:
         return self.code_server_settings.get("wait_for_local_processes_on_shutdown", False)
 
+    @cached_property
+    def repository_snapshot_cache(self) -> Optional["RepositorySnapshotCache"]:
+        from dagster._core.remote_representation.repository_snapshot_cache import (
+            DEFAULT_MAX_SNAPSHOT_CACHE_ENTRIES,
+            RepositorySnapshotCache,
+        )
+
+        snapshot_cache_settings = self.code_server_settings.get("snapshot_cache", {})
+        if not snapshot_cache_settings.get("enabled", False):
+            return None
+        return RepositorySnapshotCache(
+            directory=snapshot_cache_settings.get("directory")
+            or os.path.join(self.root_directory, "snapshot_cache"),
+            max_entries=snapshot_cache_settings.get(
+                "max_entries", DEFAULT_MAX_SNAPSHOT_CACHE_ENTRIES
+            ),
+        )
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         return self.run_monitoring_settings.get("max_resume_run_attempts", 0)
@@ -165,6 +193,10 @@ def auto_materialize_enabled(self) -> bool:
     def freshness_enabled(self) -> bool:
         return self.get_settings("freshness").get("enabled", True)
 
+    @property
+    def partition_status_cache_daemon_enabled(self) -> bool:
+        return self.get_settings("partition_status_cache").get("enabled", False)
+
     @property
     def auto_materialize_minimum_interval_seconds(self) -> int:
         return self.get_settings("auto_materialize").get("minimum_interval_seconds")
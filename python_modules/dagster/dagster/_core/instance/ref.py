@@ -481,6 +481,7 @@ def from_dir(
             "auto_materialize",
             "concurrency",
             "freshness",
+            "partition_status_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
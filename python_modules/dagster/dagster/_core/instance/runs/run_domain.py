@@ -729,7 +729,7 @@ def get_keys_to_reexecute(
         )
 
         # figure out the set of assets that were materialized and checks that successfully executed
-        logs = self._instance.all_logs(
+        records = self._instance.iter_records_for_run(
             run_id=run_id,
             of_type={
                 DagsterEventType.ASSET_MATERIALIZATION,
@@ -738,7 +738,7 @@ def get_keys_to_reexecute(
         )
         executed_keys: set[AssetOrCheckKey] = set()
         blocking_failure_keys: set[AssetKey] = set()
-        for log in logs:
+        for log in (record.event_log_entry for record in records):
             event_data = log.dagster_event.event_specific_data if log.dagster_event else None
             if isinstance(event_data, StepMaterializationData):
                 executed_keys.add(event_data.materialization.asset_key)
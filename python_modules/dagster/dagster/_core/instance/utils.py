@@ -43,6 +43,23 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# The DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE env var makes an instance buffer the events that are
+# only stored in the event log (e.g. log messages, step events and engine events) and write them from
+# a background thread in multi-row inserts, instead of writing each one on the thread that reported
+# it. Buffered events are flushed once this many are buffered, every
+# DAGSTER_EVENT_WRITE_BEHIND_INTERVAL_SECONDS, before any event that is not buffered is stored, and
+# when the instance is disposed or the process exits. This is intended to be set for run worker
+# processes that report many events.
+#
+# When the batch size is set to 0, events are written synchronously, which makes write-behind opt-in.
+def _get_event_write_behind_batch_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE", "0"))
+
+
+def _get_event_write_behind_interval_seconds() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_INTERVAL_SECONDS", "0.5"))
+
+
 def _check_run_equality(
     pipeline_run: "DagsterRun", candidate_run: "DagsterRun"
 ) -> Mapping[str, tuple[Any, Any]]:
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextvars import ContextVar
 from functools import partial
-from typing import TYPE_CHECKING, Generic
+from typing import TYPE_CHECKING, Any, Generic
 
 from typing_extensions import Self, TypeVar
 
 import dagster._check as check
+from dagster._utils import Counter, traced_counter
 from dagster._utils.aiodataloader import BlockingDataLoader, DataLoader
 
 if TYPE_CHECKING:
@@ -39,6 +41,14 @@
 """
 
 
+# When set, the default `_batch_load` of Loadable types hands its blocking batch load to this
+# function instead of calling it inline, e.g. to run it on a thread pool so that it does not block
+# an event loop that is shared between requests.
+blocking_batch_load_runner: ContextVar[Callable[..., Awaitable[Any]] | None] = ContextVar(
+    "blocking_batch_load_runner", default=None
+)
+
+
 class LoadingContext(ABC):
     """A scoped object in which Loadable objects will be fetched in batches and cached.
 
@@ -60,8 +70,8 @@ def get_loaders_for(self, ttype: type) -> tuple[DataLoader, BlockingDataLoader]:
             if not issubclass(ttype, LoadableBy):
                 check.failed(f"{ttype} is not Loadable")
 
-            batch_load_fn = partial(ttype._batch_load, context=self)  # noqa
-            blocking_batch_load_fn = partial(ttype._blocking_batch_load, context=self)  # noqa
+            batch_load_fn = partial(_traced_batch_load, ttype, context=self)
+            blocking_batch_load_fn = partial(_traced_blocking_batch_load, ttype, context=self)
 
             self.loaders[ttype] = (
                 DataLoader(batch_load_fn=batch_load_fn),
@@ -70,11 +80,41 @@ def get_loaders_for(self, ttype: type) -> tuple[DataLoader, BlockingDataLoader]:
 
         return self.loaders[ttype]
 
+    def get_loader_batch_counts(self) -> Mapping[str, int]:
+        """Returns the number of batches loaded for each Loadable type in this context.
+
+        Each batch corresponds to a single call to `_batch_load` or `_blocking_batch_load`, so
+        these counts can be used to track the number of storage queries made through loaders for a
+        request, and to catch changes that reintroduce per-object fetching.
+        """
+        return {
+            ttype.__name__: loader.num_batches + blocking_loader.num_batches
+            for ttype, (loader, blocking_loader) in self.loaders.items()
+        }
+
     def clear_loaders(self) -> None:
         for ttype in self.loaders:
             del self.loaders[ttype]
 
 
+def _increment_traced_batch_count(ttype: type) -> None:
+    # batches are counted alongside traced instance calls, so that each batch of a request shows
+    # up in its call counts
+    counter = traced_counter.get()
+    if counter and isinstance(counter, Counter):
+        counter.increment(f"{ttype.__name__}.batch_load")
+
+
+async def _traced_batch_load(ttype: type["LoadableBy"], keys: Iterable, context: LoadingContext):
+    _increment_traced_batch_count(ttype)
+    return await ttype._batch_load(keys, context)  # noqa: SLF001
+
+
+def _traced_blocking_batch_load(ttype: type["LoadableBy"], keys: Iterable, context: LoadingContext):
+    _increment_traced_batch_count(ttype)
+    return ttype._blocking_batch_load(keys, context)  # noqa: SLF001
+
+
 TResult = TypeVar("TResult")
 TKey = TypeVar("TKey")
 TContext = TypeVar("TContext", bound=LoadingContext, default=LoadingContext)
@@ -85,6 +125,9 @@ class LoadableBy(ABC, Generic[TKey, TContext]):
 
     @classmethod
     async def _batch_load(cls, keys: Iterable[TKey], context: TContext) -> Iterable[Self | None]:
+        runner = blocking_batch_load_runner.get()
+        if runner is not None:
+            return await runner(cls._blocking_batch_load, keys, context)
         return cls._blocking_batch_load(keys, context)
 
     @classmethod
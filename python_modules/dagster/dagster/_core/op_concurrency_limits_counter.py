@@ -78,7 +78,7 @@ class GlobalOpConcurrencyLimitsCounter:
     def __init__(
         self,
         instance: DagsterInstance,
-        runs: Sequence[DagsterRun],
+        queued_pool_names: set[str],
         in_progress_run_records: Sequence[RunRecord],
         concurrency_keys: set[str],
         pool_limits: Sequence[PoolLimit],
@@ -98,7 +98,6 @@ def __init__(
             os.getenv("DAGSTER_OP_CONCURRENCY_KEYS_ALLOTTED_FOR_STARTED_RUN_SECONDS", "5")
         )
 
-        queued_pool_names = self._get_queued_pool_names(runs)
         # initialize all the pool limits to the default if necessary
         self._initialize_pool_limits(instance, queued_pool_names, pool_limits)
 
@@ -113,20 +112,6 @@ def __init__(
         # fetch all the outstanding pools for in-progress runs
         self._process_in_progress_runs(in_progress_run_records)
 
-    def _get_queued_pool_names(self, queued_runs: Sequence[DagsterRun]) -> set[str]:
-        queued_pool_names = set()
-        for run in queued_runs:
-            if run.run_op_concurrency:
-                # if using run granularity, consider all the concurrency keys required by the run
-                # if using op granularity, consider only the root keys
-                run_pools = (
-                    run.run_op_concurrency.root_key_counts.keys()
-                    if self._pool_granularity == PoolGranularity.OP
-                    else run.run_op_concurrency.all_pools or []
-                )
-                queued_pool_names.update(run_pools)
-        return queued_pool_names
-
     def _initialize_pool_limits(
         self, instance: DagsterInstance, pool_names: set[str], pool_limits: Sequence[PoolLimit]
     ):
@@ -705,7 +705,11 @@ def __init__(
                 metadata=grpc_metadata,
             )
 
-            list_repositories_response = sync_list_repositories_grpc(self.client)
+            # the code server only computes snapshot ids when they are used as cache keys
+            list_repositories_response = sync_list_repositories_grpc(
+                self.client,
+                include_repository_snapshot_ids=instance.repository_snapshot_cache is not None,
+            )
 
             self._server_id = sync_get_server_id(self.client)
             self.repository_names = set(
@@ -748,6 +752,8 @@ def __init__(
                 self.client,
                 self,
                 defer_snapshots=True,
+                snapshot_ids=list_repositories_response.repository_snapshot_ids,
+                snapshot_cache=instance.repository_snapshot_cache,
             ).items():
                 self.remote_repositories[repo_name] = RemoteRepository(
                     repo_data,
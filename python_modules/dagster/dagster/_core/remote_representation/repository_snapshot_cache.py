@@ -0,0 +1,164 @@
+"""An on-disk cache of the repository snapshots fetched from code servers.
+
+Every webserver and daemon process that loads a code location fetches and deserializes its own copy
+of each RepositorySnap over gRPC, which for large code locations is slow and puts load on the code
+server. Code servers report a content hash of each repository's serialized snapshot when listing
+their repositories, so processes on the same host can share snapshots through a directory keyed by
+that hash: the first process to fetch a snapshot writes it to the cache, and the others load it
+from disk instead of fetching it.
+
+Entries are written in the compact binary serdes format (falling back to JSON when msgpack is not
+installed) with an atomic rename, and are read through a memory map so that concurrent readers share
+the operating system's page cache rather than each reading the file into their own buffers.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import re
+import tempfile
+from collections.abc import Mapping
+
+from dagster_shared.serdes.binary import (
+    JSON_CODEC_NAME,
+    MSGPACK_CODEC_NAME,
+    deserialize_value_from_bytes,
+    serialize_value_to_bytes,
+)
+from dagster_shared.serdes.errors import SerdesUsageError
+
+import dagster._check as check
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._core.snap import JobSnap
+from dagster._record import record
+from dagster._serdes import whitelist_for_serdes
+
+DEFAULT_MAX_SNAPSHOT_CACHE_ENTRIES = 32
+
+_SNAPSHOT_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+_ENTRY_SUFFIX = ".snap"
+
+logger = logging.getLogger("dagster.repository_snapshot_cache")
+
+
+def get_repository_snapshot_id(serialized_repository_snap: str) -> str:
+    """The content hash that code servers report for a serialized RepositorySnap."""
+    return hashlib.sha256(serialized_repository_snap.encode("utf-8")).hexdigest()
+
+
+@whitelist_for_serdes
+@record
+class RepositorySnapshotCacheEntry:
+    snapshot_id: str
+    repository_snap: RepositorySnap
+    # job snapshots fetched separately when the repository snapshot defers them, keyed by job name
+    job_snaps: Mapping[str, JobSnap]
+
+
+class RepositorySnapshotCache:
+    """A content-addressed cache of repository snapshots in a directory shared by the processes on
+    a host.
+
+    Args:
+        directory (str): The directory to store entries in. Created if it does not exist.
+        max_entries (int): The number of entries to keep. When a new entry is written, the least
+            recently used entries beyond this limit are removed.
+    """
+
+    def __init__(self, directory: str, max_entries: int = DEFAULT_MAX_SNAPSHOT_CACHE_ENTRIES):
+        self._directory = check.str_param(directory, "directory")
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        check.invariant(self._max_entries > 0, "max_entries must be positive")
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _path(self, snapshot_id: str) -> str | None:
+        # snapshot ids are reported by code servers, so only use ones that are safe file names
+        if not _SNAPSHOT_ID_RE.match(snapshot_id):
+            return None
+        return os.path.join(self._directory, f"{snapshot_id}{_ENTRY_SUFFIX}")
+
+    def get(self, snapshot_id: str) -> RepositorySnapshotCacheEntry | None:
+        """Returns the cached entry for the snapshot id, or None if it is not cached or cannot be
+        read.
+        """
+        path = self._path(snapshot_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    entry = _deserialize_entry(mapped)
+            # mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Could not read repository snapshot cache entry {path}", exc_info=True)
+            return None
+
+        if not isinstance(entry, RepositorySnapshotCacheEntry) or entry.snapshot_id != snapshot_id:
+            logger.warning(f"Ignoring mismatched repository snapshot cache entry {path}")
+            return None
+        return entry
+
+    def set(
+        self,
+        snapshot_id: str,
+        repository_snap: RepositorySnap,
+        job_snaps: Mapping[str, JobSnap],
+    ) -> None:
+        path = self._path(snapshot_id)
+        if path is None:
+            return
+        entry = RepositorySnapshotCacheEntry(
+            snapshot_id=snapshot_id, repository_snap=repository_snap, job_snaps=job_snaps
+        )
+        try:
+            data = serialize_value_to_bytes(entry, codec=MSGPACK_CODEC_NAME)
+        except SerdesUsageError:
+            data = serialize_value_to_bytes(entry, codec=JSON_CODEC_NAME)
+
+        try:
+            # write to a temporary file in the same directory and rename it into place, so that
+            # readers in other processes never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            logger.warning(f"Could not write repository snapshot cache entry {path}", exc_info=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        for _, path in sorted(entries, reverse=True)[self._max_entries :]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+def _deserialize_entry(mapped: mmap.mmap) -> object:
+    # release the view before the map is closed, which fails while views of it are alive
+    with memoryview(mapped) as view:
+        return deserialize_value_from_bytes(view)
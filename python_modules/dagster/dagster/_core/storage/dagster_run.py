@@ -125,7 +125,7 @@ class DagsterRunStatus(Enum):
 
 @whitelist_for_serdes(storage_name="PipelineRunStatsSnapshot")
 @record
-class DagsterRunStatsSnapshot(IHaveNew):
+class DagsterRunStatsSnapshot(IHaveNew, LoadableBy[str]):
     run_id: str
     steps_succeeded: int
     steps_failed: int
@@ -136,6 +136,14 @@ class DagsterRunStatsSnapshot(IHaveNew):
     start_time: float | None
     end_time: float | None
 
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable["DagsterRunStatsSnapshot"]:
+        run_ids = list(keys)
+        stats_by_run_id = context.instance.event_log_storage.get_stats_for_runs(run_ids)
+        return [stats_by_run_id[run_id] for run_id in run_ids]
+
 
 @whitelist_for_serdes
 @record
@@ -1,15 +1,16 @@
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence, Set
+from collections.abc import Iterable, Iterator, Mapping, Sequence, Set
 from typing import TYPE_CHECKING, Annotated, NamedTuple, Optional
 
 from dagster_shared.record import ImportFrom, record
 
+import dagster._check as check
 from dagster._annotations import public
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.asset_checks.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
-from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.freshness import FreshnessStateRecord
 from dagster._core.definitions.partitions.definition import PartitionsDefinition
 from dagster._core.event_api import (
@@ -54,6 +55,10 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+# the number of records held in memory at a time when iterating over a run's event log
+DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -259,23 +264,134 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, str | None],
+        limit: int | None = None,
+    ) -> Mapping[str, EventLogConnection]:
+        """Get the event log records stored after each run's cursor, for a set of runs.
+
+        Storages that can fetch events for many runs at once should override this to do so in a
+        single query; by default, each run is fetched separately.
+
+        Args:
+            cursors_by_run_id (Mapping[str, Optional[str]]): Storage id cursors (as returned by
+                `get_records_for_run`) to read after, keyed by run id.
+            limit (Optional[int]): Max number of records to return per run.
+        """
+        return {
+            run_id: self.get_records_for_run(run_id, cursor=cursor, limit=limit)
+            for run_id, cursor in cursors_by_run_id.items()
+        }
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: DagsterEventType | set[DagsterEventType] | None = None,
+        ascending: bool = True,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over all of the event log records corresponding to a run, without holding more
+        than a single batch of records in memory at a time.
+
+        By default, records are fetched in pages of `batch_size` using storage id cursors. Storages
+        that can stream rows from the database should override this to do so.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            ascending (bool): Whether to iterate over records in storage id order.
+            batch_size (int): The number of records to fetch from the database at a time.
+        """
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        cursor = None
+        while True:
+            connection = self.get_records_for_run(
+                run_id, cursor=cursor, of_type=of_type, limit=batch_size, ascending=ascending
+            )
+            yield from connection.records
+            if not connection.has_more:
+                return
+            cursor = connection.cursor
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(
-            run_id, self.get_logs_for_run(run_id, of_type=RUN_STATS_EVENT_TYPES)
+            run_id,
+            (
+                record.event_log_entry
+                for record in self.iter_records_for_run(run_id, of_type=RUN_STATS_EVENT_TYPES)
+            ),
+        )
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        """Get a summary of events that have ocurred in each of a set of runs.
+
+        Storages that can summarize many runs at once should override this to do so in a single
+        query; by default, each run is summarized separately.
+        """
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def fetch_materializations_for_runs(
+        self,
+        run_ids: Sequence[str],
+        limit: int,
+        after_storage_id: int | None = None,
+        cursor: str | None = None,
+    ) -> EventRecordsResult:
+        """Get the asset materializations stored by any of a set of runs, in ascending storage id
+        order.
+
+        Storages that can filter asset events by run should override this to do so in the query;
+        by default, every materialization after the cursor is read, and those stored by other runs
+        are dropped, so a page may contain fewer than `limit` records even if more remain.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs to fetch materializations for.
+            limit (int): Max number of records to read per page.
+            after_storage_id (Optional[int]): Only return materializations stored after this id.
+            cursor (Optional[str]): Cursor returned by a previous call, to fetch the next page.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(limit, "limit")
+
+        storage_id = after_storage_id if after_storage_id is not None else -1
+        if cursor:
+            storage_id = max(storage_id, EventLogCursor.parse(cursor).storage_id())
+
+        records = self.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                after_cursor=storage_id,
+            ),
+            limit=limit,
+            ascending=True,
+        )
+        run_id_set = set(run_ids)
+        return EventRecordsResult(
+            records=[record for record in records if record.run_id in run_id_set],
+            cursor=EventLogCursor.from_storage_id(
+                records[-1].storage_id if records else storage_id
+            ).to_string(),
+            has_more=len(records) == limit,
         )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Sequence[str] | None = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id, of_type=STEP_STATS_EVENT_TYPES)
+        logs = (
+            record.event_log_entry
+            for record in self.iter_records_for_run(run_id, of_type=STEP_STATS_EVENT_TYPES)
+        )
         if step_keys:
-            logs = [
+            logs = (
                 event
                 for event in logs
                 if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
+            )
 
         return build_run_step_stats_from_events(run_id, logs)
 
@@ -291,6 +407,16 @@ def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             self.store_event(event)
 
+    def store_unindexed_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events that are not indexed outside of the event log, i.e. that are
+        not asset, asset check or run status events, in order.
+
+        Storages that can write these events in fewer round trips than one per event (e.g. with a
+        multi-row insert) should override this method.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -491,6 +617,64 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest materialization or observation storage id for each partition of each of
+        the given asset keys.
+
+        Storages that can do so should override this to fetch the storage ids for many assets in a
+        few queries; the default implementation issues one query per asset key.
+        """
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        return {
+            asset_key: self.get_latest_storage_id_by_partition(asset_key, event_type)
+            for asset_key in set(asset_keys)
+        }
+
+    def get_latest_asset_partition_records(
+        self,
+        asset_partitions: Sequence[AssetKeyPartitionKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        """Fetch the latest materialization or observation record for each of the given asset
+        partitions.
+
+        An asset partition with a `None` partition key stands for the asset as a whole, and maps to
+        the latest event for the asset across all of its partitions. Asset partitions without any
+        such event are omitted from the result.
+
+        Storages that can do so should override this to fetch all records in a few queries; the
+        default implementation issues one query per asset partition.
+        """
+        check.sequence_param(asset_partitions, "asset_partitions", of_type=AssetKeyPartitionKey)
+        check.invariant(
+            event_type
+            in {DagsterEventType.ASSET_MATERIALIZATION, DagsterEventType.ASSET_OBSERVATION},
+            "event_type must be ASSET_MATERIALIZATION or ASSET_OBSERVATION",
+        )
+        fetch_records = (
+            self.fetch_materializations
+            if event_type == DagsterEventType.ASSET_MATERIALIZATION
+            else self.fetch_observations
+        )
+        latest_records = {}
+        for asset_partition in set(asset_partitions):
+            records = fetch_records(
+                AssetRecordsFilter(
+                    asset_key=asset_partition.asset_key,
+                    asset_partitions=(
+                        [asset_partition.partition_key] if asset_partition.partition_key else None
+                    ),
+                ),
+                limit=1,
+            ).records
+            if records:
+                latest_records[asset_partition] = records[0]
+        return latest_records
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
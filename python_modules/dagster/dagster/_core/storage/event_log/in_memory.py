@@ -94,6 +94,11 @@ def store_event(self, event):
             except Exception:
                 logging.exception("Exception in callback for event watch on run %s.", event.run_id)
 
+    def store_unindexed_event_batch(self, events):
+        # store events one by one so that watchers are notified of each of them
+        for event in events:
+            self.store_event(event)
+
     def watch(self, run_id: str, cursor: str, callback: Callable[..., Any]):  # ty: ignore[invalid-method-override]
         self._handlers[run_id].add(callback)
 
@@ -1,3 +1,4 @@
+import logging
 import os
 import threading
 from collections.abc import Callable
@@ -10,8 +11,7 @@
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
-INIT_POLL_PERIOD = 0.250  # 250ms
-MAX_POLL_PERIOD = 16.0  # 16s
+DEFAULT_POLL_PERIOD = 0.250  # 250ms
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -26,30 +26,57 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class WatchedRun(NamedTuple):
+    """The callbacks registered for a watched run_id, and the cursor up to which new events have
+    already been dispatched to them.
+    """
+
+    cursor: str | None
+    callbacks: list[CallbackAfterCursor]
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a single polling thread to retrieve new events for all watched
+    run_ids.
+
+    On every tick, the polling thread fetches the new events for every watched run_id with a single
+    call to `EventLogStorage.get_records_for_runs`, then fans each event out to the callbacks that
+    were registered for its run_id. Each run_id is fetched in pages of at most
+    `DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE` events, so a newly watched run with a long history
+    does not hold up the new events of the others.
+
+    The poll period trades off latency against query load. It defaults to 250ms and can be
+    overridden with the `DAGSTER_POLLING_EVENT_WATCHER_POLL_PERIOD` environment variable (in
+    seconds).
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_watched_run and _poll_thread
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(self, event_log_storage: EventLogStorage, poll_period: float | None = None):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._poll_period = check.opt_numeric_param(
+            poll_period,
+            "poll_period",
+            default=float(
+                os.getenv("DAGSTER_POLLING_EVENT_WATCHER_POLL_PERIOD", str(DEFAULT_POLL_PERIOD))
+            ),
+        )
+        self._chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_watched_run and _poll_thread
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_watched_run: MutableMapping[str, WatchedRun] = {}
+        self._poll_thread: threading.Thread | None = None
+        self._should_thread_exit = threading.Event()
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_watched_run
         return _has_run_id
 
     def watch_run(
@@ -64,13 +91,23 @@ def watch_run(
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+            if run_id not in self._run_id_to_watched_run:
+                self._run_id_to_watched_run[run_id] = WatchedRun(cursor=None, callbacks=[])
+            self._run_id_to_watched_run[run_id].callbacks.append(
+                CallbackAfterCursor(cursor, callback)
+            )
+
+            if self._poll_thread is None:
+                self._start_poll_thread()
+
+    def _start_poll_thread(self) -> None:
+        # must be called with _dict_lock held
+        self._poll_thread = threading.Thread(
+            target=self._run_poll_loop,
+            name="sql-event-watch",
+            daemon=True,
+        )
+        self._poll_thread.start()
 
     def unwatch_run(
         self,
@@ -80,119 +117,99 @@ def unwatch_run(
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_watched_run:
+                watched_run = self._run_id_to_watched_run[run_id]
+                callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in watched_run.callbacks
+                    if callback_with_cursor.callback != handler
+                ]
+                if callbacks:
+                    self._run_id_to_watched_run[run_id] = watched_run._replace(callbacks=callbacks)
+                else:
+                    del self._run_id_to_watched_run[run_id]
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
+            self._should_thread_exit.set()
             with self._dict_lock:
-                watcher_threads = list(self._run_id_to_watcher_dict.values())
-                for watcher_thread in watcher_threads:
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                self._run_id_to_watcher_dict = {}
-            # Join outside _dict_lock — a watcher thread may be running a callback that
+                poll_thread = self._poll_thread
+                self._run_id_to_watched_run = {}
+            # Join outside _dict_lock — the polling thread may be running a callback that
             # re-enters unwatch_run() and tries to acquire _dict_lock; joining under the
             # lock would deadlock.
-            for watcher_thread in watcher_threads:
-                watcher_thread.join()
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
-    """
+            if poll_thread:
+                poll_thread.join()
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super().__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: list[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
-
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+    def _run_poll_loop(self) -> None:
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
+        Wakes every poll period & polls until there are no new events for any watched run_id.
+        """
+        try:
+            while not self._should_thread_exit.wait(self._poll_period):
+                try:
+                    while self._poll() and not self._should_thread_exit.is_set():
+                        pass
+                except Exception:
+                    # the thread is shared by every watched run, so a failed poll must not stop
+                    # the event stream for all of them; retry on the next poll period
+                    logging.exception("Exception while polling for events of watched runs.")
+        finally:
+            # if the thread exits unexpectedly, start a new one so that runs that are already
+            # watched keep receiving events
+            with self._dict_lock:
+                if self._poll_thread is threading.current_thread():
+                    if self._should_thread_exit.is_set():
+                        self._poll_thread = None
+                    else:
+                        self._start_poll_thread()
 
-    def add_callback(self, cursor: str | None, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+    def _poll(self) -> bool:
+        """Executes a single query for new events across all watched run_ids and fires each
+        callback (taking into account the callback.cursor) on the new events for its run_id.
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
+        Returns True if there may be more events to fetch immediately.
         """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+        with self._dict_lock:
+            cursors_by_run_id = {
+                run_id: watched_run.cursor
+                for run_id, watched_run in self._run_id_to_watched_run.items()
+            }
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        if not cursors_by_run_id:
+            return False
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def get_callbacks(self) -> list[CallbackAfterCursor]:
-        with self._callback_fn_list_lock:
-            return list(self._callback_fn_list)
-
-    def run(self) -> None:
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
+        conns_by_run_id = self._event_log_storage.get_records_for_runs(
+            cursors_by_run_id, limit=self._chunk_limit
+        )
 
-        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+        has_more = False
+        for run_id, conn in conns_by_run_id.items():
+            has_more = has_more or conn.has_more
+            with self._dict_lock:
+                watched_run = self._run_id_to_watched_run.get(run_id)
+                if watched_run is None:
+                    # the run was unwatched while we were querying
+                    continue
+                self._run_id_to_watched_run[run_id] = watched_run._replace(cursor=conn.cursor)
+                callbacks = list(watched_run.callbacks)
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
-            )
-            cursor = conn.cursor
             for event_record in conn.records:
-                for callback_with_cursor in self.get_callbacks():
+                for callback_with_cursor in callbacks:
                     if (
                         callback_with_cursor.cursor is None
                         or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
                         < event_record.storage_id
                     ):
-                        callback_with_cursor.callback(
-                            event_record.event_log_entry,
-                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                        )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+                        try:
+                            callback_with_cursor.callback(
+                                event_record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
+                            )
+
+        return has_more
@@ -1,3 +1,4 @@
+import heapq
 import logging
 import os
 from abc import abstractmethod
@@ -19,7 +20,6 @@
 import dagster_shared.seven as seven
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
-from dagster_shared.serdes import deserialize_values
 from dagster_shared.serdes.errors import DeserializationError
 from sqlalchemy.engine import Connection
 
@@ -27,7 +27,7 @@
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.asset_checks.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
-from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey, AssetMaterialization
 from dagster._core.definitions.freshness import FreshnessStateRecord
 from dagster._core.errors import (
     DagsterEventLogInvalidForRun,
@@ -49,8 +49,10 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.stats import (
     RUN_STATS_EVENT_TYPES,
+    STEP_LIFECYCLE_EVENT_TYPES,
     STEP_STATS_EVENT_TYPES,
     RunStepKeyStatsSnapshot,
+    StepLifecycleEvent,
     build_run_step_stats_from_events,
 )
 from dagster._core.storage.asset_check_execution_record import (
@@ -61,6 +63,7 @@
 )
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.event_log.base import (
+    DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetEntry,
     AssetRecord,
@@ -119,6 +122,8 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+# max number of asset keys that are filtered on in a single latest asset partition record query
+LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE = 500
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
 
 
@@ -140,6 +145,26 @@ def enforce_max_records_limit(limit: int):
         )
 
 
+# the columns read to build a lazily deserialized EventLogRecord, in the order expected by
+# _lazy_event_log_record
+_LAZY_RECORD_COLUMNS = [
+    SqlEventLogStorageTable.c.id,
+    SqlEventLogStorageTable.c.event,
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.dagster_event_type,
+]
+
+
+def _lazy_event_log_record(row: Sequence[Any]) -> EventLogRecord:
+    storage_id, event_json, run_id, dagster_event_type = row
+    return EventLogRecord.from_row(
+        storage_id=storage_id,
+        event_json=event_json,
+        run_id=run_id,
+        dagster_event_type=dagster_event_type,
+    )
+
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -417,6 +442,28 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_unindexed_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        check.invariant(
+            not any(
+                event.is_dagster_event
+                and (
+                    event.dagster_event_type in ASSET_EVENTS
+                    or event.dagster_event_type in ASSET_CHECK_EVENTS
+                )
+                for event in events
+            ),
+            "Asset and asset check events cannot be stored as unindexed events.",
+        )
+
+        # one multi-row insert per run, since runs may be stored in separate shards
+        events_by_run_id: dict[str, list[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                conn.execute(self.prepare_insert_event_batch(run_events))
+
     def get_records_for_run(
         self,
         run_id,
@@ -437,29 +484,7 @@ def get_records_for_run(
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
-        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
-
-        dagster_event_types = (
-            {of_type}
-            if isinstance(of_type, DagsterEventType)
-            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
-        )
-
-        query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .order_by(
-                SqlEventLogStorageTable.c.id.asc()
-                if ascending
-                else SqlEventLogStorageTable.c.id.desc()
-            )
-        )
-        if dagster_event_types:
-            query = query.where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
-                )
-            )
+        query = self._records_for_run_query(run_id, of_type, ascending)
 
         # adjust 0 based index cursor to SQL offset
         if cursor is not None:
@@ -478,22 +503,10 @@ def get_records_for_run(
         with self.run_connection(run_id) as conn, db_result(conn, query) as result:
             results = result.fetchall()
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        # event bodies are deserialized on access, which raises DagsterEventLogInvalidForRun if
+        # the stored event is malformed
+        records = [_lazy_event_log_record(row) for row in results]
+        last_record_id = records[-1].storage_id if records else None
 
         if last_record_id is not None:
             next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
@@ -510,6 +523,173 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def _records_for_run_query(
+        self,
+        run_id: str,
+        of_type: DagsterEventType | set[DagsterEventType] | None,
+        ascending: bool,
+    ):
+        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db_select(_LAZY_RECORD_COLUMNS)
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(
+                SqlEventLogStorageTable.c.id.asc()
+                if ascending
+                else SqlEventLogStorageTable.c.id.desc()
+            )
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+        return query
+
+    @property
+    def supports_server_side_cursors(self) -> bool:
+        """Indicates that the database can stream the rows of a query result with a server-side
+        cursor, so that `iter_records_for_run` can read a run's event log with a single query.
+        """
+        return False
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: DagsterEventType | set[DagsterEventType] | None = None,
+        ascending: bool = True,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        if not self.supports_server_side_cursors:
+            # fall back to keyset pagination, which holds a connection only while reading a batch
+            yield from super().iter_records_for_run(
+                run_id, of_type=of_type, ascending=ascending, batch_size=batch_size
+            )
+            return
+
+        check.str_param(run_id, "run_id")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        query = self._records_for_run_query(run_id, of_type, ascending)
+        with self.run_connection(run_id) as conn:
+            # stream_results asks the driver for a server-side cursor, so that rows are buffered
+            # batch_size at a time instead of the whole result set being loaded on execute
+            streaming_conn = conn.execution_options(stream_results=True, max_row_buffer=batch_size)
+            with db_result(streaming_conn, query) as result:
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    for row in rows:
+                        yield _lazy_event_log_record(row)
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, str | None],
+        limit: int | None = None,
+    ) -> Mapping[str, EventLogConnection]:
+        """Fetches new records for every run in a single query. Runs are grouped by cursor so that
+        the filter stays small when many runs are read from the same storage id, and rows are
+        returned in storage id order so that each run's cursor can be advanced independently.
+
+        As in `get_records_for_run`, `limit` bounds the number of records returned for each run, so
+        that a run with a long history does not hold up the new records of the others.
+        """
+        check.mapping_param(cursors_by_run_id, "cursors_by_run_id", key_type=str)
+        check.opt_int_param(limit, "limit")
+
+        if not cursors_by_run_id:
+            return {}
+
+        storage_id_by_run_id: dict[str, int] = {}
+        for run_id, cursor in cursors_by_run_id.items():
+            if cursor is None:
+                storage_id_by_run_id[run_id] = -1
+            else:
+                cursor_obj = EventLogCursor.parse(cursor)
+                check.invariant(
+                    cursor_obj.is_id_cursor(), "Cannot fetch records for runs with an offset cursor"
+                )
+                storage_id_by_run_id[run_id] = cursor_obj.storage_id()
+
+        run_ids_by_storage_id: dict[int, list[str]] = defaultdict(list)
+        for run_id, storage_id in storage_id_by_run_id.items():
+            run_ids_by_storage_id[storage_id].append(run_id)
+
+        new_records_filter = db.and_(
+            SqlEventLogStorageTable.c.id > min(run_ids_by_storage_id.keys()),
+            db.or_(
+                *[
+                    db.and_(
+                        SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                        SqlEventLogStorageTable.c.id > storage_id,
+                    )
+                    for storage_id, run_ids in run_ids_by_storage_id.items()
+                ]
+            ),
+        )
+        if limit:
+            ranked_subquery = db_subquery(
+                db_select(
+                    [
+                        *_LAZY_RECORD_COLUMNS,
+                        db.func.row_number()
+                        .over(
+                            order_by=SqlEventLogStorageTable.c.id.asc(),
+                            partition_by=SqlEventLogStorageTable.c.run_id,
+                        )
+                        .label("rank"),
+                    ]
+                ).where(new_records_filter),
+                "ranked_subquery",
+            )
+            query = (
+                db_select(
+                    [
+                        ranked_subquery.c.id,
+                        ranked_subquery.c.event,
+                        ranked_subquery.c.run_id,
+                        ranked_subquery.c.dagster_event_type,
+                    ]
+                )
+                .where(ranked_subquery.c.rank <= limit)
+                .order_by(ranked_subquery.c.id.asc())
+            )
+        else:
+            query = (
+                db_select(_LAZY_RECORD_COLUMNS)
+                .where(new_records_filter)
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+            )
+
+        with self.index_connection() as conn, db_result(conn, query) as result:
+            results = result.fetchall()
+
+        records_by_run_id: dict[str, list[EventLogRecord]] = defaultdict(list)
+        for row in results:
+            record = _lazy_event_log_record(row)
+            records_by_run_id[record.run_id].append(record)
+
+        connections = {}
+        for run_id, storage_id in storage_id_by_run_id.items():
+            records = records_by_run_id.get(run_id, [])
+            next_storage_id = records[-1].storage_id if records else storage_id
+            connections[run_id] = EventLogConnection(
+                records=records,
+                cursor=EventLogCursor.from_storage_id(next_storage_id).to_string(),
+                has_more=bool(limit and len(records) == limit),
+            )
+        return connections
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -535,11 +715,109 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         with self.run_connection(run_id) as conn, db_result(conn, query) as result:
             results = result.fetchall()
 
+        return self._build_run_stats_from_aggregate_rows(run_id, results)
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, DagsterRunStatsSnapshot]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        if self.is_run_sharded:
+            # the events for each run are stored in a separate shard
+            return super().get_stats_for_runs(run_ids)
+
+        if not run_ids:
+            return {}
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label("n_events_of_type"),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in RUN_STATS_EVENT_TYPES]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.dagster_event_type,
+            )
+        )
+
+        with self.index_connection() as conn, db_result(conn, query) as result:
+            results = result.fetchall()
+
+        rows_by_run_id = defaultdict(list)
+        for run_id, *row in results:
+            rows_by_run_id[run_id].append(row)
+
+        return {
+            run_id: self._build_run_stats_from_aggregate_rows(run_id, rows_by_run_id[run_id])
+            for run_id in run_ids
+        }
+
+    def fetch_materializations_for_runs(
+        self,
+        run_ids: Sequence[str],
+        limit: int,
+        after_storage_id: int | None = None,
+        cursor: str | None = None,
+    ) -> EventRecordsResult:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(limit, "limit")
+
+        # asset events are mirrored to the index shard of run-sharded storages, so this can always
+        # query the index shard
+        storage_id = after_storage_id if after_storage_id is not None else -1
+        if cursor:
+            storage_id = max(storage_id, EventLogCursor.parse(cursor).storage_id())
+
+        if not run_ids:
+            return EventRecordsResult(
+                records=[],
+                cursor=EventLogCursor.from_storage_id(storage_id).to_string(),
+                has_more=False,
+            )
+
+        query = (
+            db_select(_LAZY_RECORD_COLUMNS)
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.id > storage_id,
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(limit)
+        )
+
+        with self.index_connection() as conn, db_result(conn, query) as result:
+            records = [_lazy_event_log_record(row) for row in result.fetchall()]
+
+        return EventRecordsResult(
+            records=records,
+            cursor=EventLogCursor.from_storage_id(
+                records[-1].storage_id if records else storage_id
+            ).to_string(),
+            has_more=len(records) == limit,
+        )
+
+    def _build_run_stats_from_aggregate_rows(
+        self, run_id: str, rows: Iterable[Sequence[Any]]
+    ) -> DagsterRunStatsSnapshot:
         try:
             counts = {}
             times = {}
-            for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
+            for row in rows:
+                (dagster_event_type, n_events_of_type, last_event_timestamp) = row
                 check.invariant(dagster_event_type is not None)
                 counts[dagster_event_type] = n_events_of_type
                 times[dagster_event_type] = last_event_timestamp
@@ -581,42 +859,141 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        # Originally, this was two different queries:
-        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
-        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
-        # 2) one query which fetched all the raw events for a specific event type and then inspected
-        #    the deserialized event object to aggregate stats derived from sequences of events.
-        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
-        #
-        # For simplicity, we now just do the second type of query and derive the stats in Python
-        # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
+        # Step start / end times, statuses and attempts depend only on the type and timestamp of
+        # each lifecycle event, which are indexed columns. These are aggregated in SQL by step key
+        # and event type. Since the fold over a step's events only needs their relative order,
+        # every (step key, event type) group containing a single event can stand in for that event
+        # by its storage id, and only steps that repeat a lifecycle event (e.g. retried steps)
+        # need their lifecycle events read row by row. Event bodies are deserialized only for the
+        # events whose contents contribute to the stats (materializations, expectation results,
+        # and markers).
+        def _step_stats_query(columns, event_types):
+            query = (
+                db_select(columns)
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+                .where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    )
                 )
             )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+            if step_keys:
+                query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+            return query
+
+        aggregate_query = _step_stats_query(
+            [
+                SqlEventLogStorageTable.c.step_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                db.func.count().label("n_events_of_type"),
+                db.func.max(SqlEventLogStorageTable.c.id).label("last_storage_id"),
+                db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+            ],
+            STEP_STATS_EVENT_TYPES,
+        ).group_by(
+            SqlEventLogStorageTable.c.step_key,
+            SqlEventLogStorageTable.c.dagster_event_type,
         )
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+
+        with self.run_connection(run_id) as conn, db_result(conn, aggregate_query) as result:
+            aggregate_rows = result.fetchall()
+
+        lifecycle_event_type_values = {
+            event_type.value for event_type in STEP_LIFECYCLE_EVENT_TYPES
+        }
+        lifecycle_events: list[tuple[int, StepLifecycleEvent]] = []
+        repeated_lifecycle_step_keys = set()
+        has_deserialized_events = False
+        for (
+            step_key,
+            dagster_event_type,
+            n_events_of_type,
+            last_storage_id,
+            last_event_timestamp,
+        ) in aggregate_rows:
+            if dagster_event_type not in lifecycle_event_type_values:
+                has_deserialized_events = True
+            elif n_events_of_type > 1:
+                repeated_lifecycle_step_keys.add(step_key)
+            else:
+                lifecycle_events.append(
+                    (
+                        last_storage_id,
+                        StepLifecycleEvent(
+                            step_key=step_key,
+                            event_type=DagsterEventType(dagster_event_type),
+                            timestamp=utc_datetime_from_naive(last_event_timestamp).timestamp(),
+                        ),
+                    )
+                )
+
+        if repeated_lifecycle_step_keys:
+            lifecycle_events = [
+                (storage_id, event)
+                for storage_id, event in lifecycle_events
+                if event.step_key not in repeated_lifecycle_step_keys
+            ]
+            lifecycle_query = _step_stats_query(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.timestamp,
+                ],
+                STEP_LIFECYCLE_EVENT_TYPES,
+            ).where(SqlEventLogStorageTable.c.step_key.in_(repeated_lifecycle_step_keys))
+            with self.run_connection(run_id) as conn, db_result(conn, lifecycle_query) as result:
+                for storage_id, step_key, dagster_event_type, timestamp in result.fetchall():
+                    lifecycle_events.append(
+                        (
+                            storage_id,
+                            StepLifecycleEvent(
+                                step_key=step_key,
+                                event_type=DagsterEventType(dagster_event_type),
+                                timestamp=utc_datetime_from_naive(timestamp).timestamp(),
+                            ),
+                        )
+                    )
+
+        lifecycle_events.sort(key=lambda item: item[0])
+
+        if not has_deserialized_events:
+            return build_run_step_stats_from_events(
+                run_id, (event for _, event in lifecycle_events)
             )
 
-        with self.run_connection(run_id) as conn, db_result(conn, raw_event_query) as result:
-            results = result.fetchall()
+        raw_event_query = _step_stats_query(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            STEP_STATS_EVENT_TYPES - STEP_LIFECYCLE_EVENT_TYPES,
+        ).order_by(SqlEventLogStorageTable.c.id.asc())
 
-        try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
-            return build_run_step_stats_from_events(run_id, records)
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        with self.run_connection(run_id) as conn:
+            raw_event_conn = (
+                conn.execution_options(
+                    stream_results=True, max_row_buffer=DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE
+                )
+                if self.supports_server_side_cursors
+                else conn
+            )
+            with db_result(raw_event_conn, raw_event_query) as result:
+                # rows are consumed as the stats are built, so that events are deserialized one
+                # at a time, and interleaved with the lifecycle events in storage id order
+                entries = (
+                    event
+                    for _, event in heapq.merge(
+                        lifecycle_events,
+                        (
+                            (storage_id, deserialize_value(event_json, EventLogEntry))
+                            for storage_id, event_json in result
+                        ),
+                        key=lambda item: item[0],
+                    )
+                )
+                try:
+                    return build_run_step_stats_from_events(run_id, entries)
+                except (seven.JSONDecodeError, DeserializationError) as err:
+                    raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
@@ -915,11 +1292,17 @@ def _get_event_records(
         event_records_filter: EventRecordsFilter,
         limit: int | None = None,
         ascending: bool = False,
+        lazy: bool = False,
     ) -> Sequence[EventLogRecord]:
-        """Returns a list of (record_id, record)."""
+        """Returns a list of (record_id, record).
+
+        If `lazy` is set, the returned records only deserialize their event log entry when it is
+        accessed. Malformed events then raise on access instead of being skipped with a warning.
+        """
         check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
+        check.bool_param(lazy, "lazy")
 
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
@@ -927,7 +1310,9 @@ def _get_event_records(
             asset_details = None
 
         query = db_select(
-            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+            _LAZY_RECORD_COLUMNS
+            if lazy
+            else [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
         ).select_from(SqlEventLogStorageTable)
 
         query = self._apply_filter_to_query(
@@ -946,6 +1331,9 @@ def _get_event_records(
         with self.index_connection() as conn, db_result(conn, query) as result:
             results = result.fetchall()
 
+        if lazy:
+            return [_lazy_event_log_record(row) for row in results]
+
         event_records = []
         for row_id, json_str in results:
             try:
@@ -975,6 +1363,7 @@ def _get_event_records_result(
             event_records_filter=event_records_filter,
             limit=limit,
             ascending=ascending,
+            lazy=True,
         )
         if records:
             new_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
@@ -1956,6 +2345,196 @@ def get_latest_storage_id_by_partition(
             )
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest materialization or observation storage id for each partition of each of
+        the given asset keys, with a grouped query per batch of asset keys.
+        """
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        asset_keys = list(set(asset_keys))
+        if not asset_keys:
+            return {}
+        asset_keys_by_str = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        assets_details = self._get_assets_details(asset_keys)
+
+        storage_ids_by_partition_by_asset_key: dict[AssetKey, dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for i in range(0, len(asset_keys), LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE):
+            batch_asset_keys = asset_keys[i : i + LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE]
+            batch_assets_details = assets_details[i : i + LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE]
+            query = (
+                db_select(
+                    [
+                        SqlEventLogStorageTable.c.asset_key,
+                        SqlEventLogStorageTable.c.partition,
+                        db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                    ]
+                )
+                .where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string() for asset_key in batch_asset_keys]
+                        ),
+                        SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                        SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                    )
+                )
+                .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+            )
+            query = self._add_assets_wipe_filter_to_query(
+                query, batch_assets_details, batch_asset_keys
+            )
+            with self.index_connection() as conn, db_result(conn, query) as result:
+                rows = result.fetchall()
+
+            for asset_key_str, partition, storage_id in rows:
+                storage_ids_by_partition_by_asset_key[asset_keys_by_str[asset_key_str]][
+                    cast("str", partition)
+                ] = cast("int", storage_id)
+
+        return storage_ids_by_partition_by_asset_key
+
+    def get_latest_asset_partition_records(
+        self,
+        asset_partitions: Sequence[AssetKeyPartitionKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        """Fetch the latest materialization or observation record for each of the given asset
+        partitions.
+
+        The latest storage ids are located with grouped queries over batches of asset keys, and
+        the matching records are then fetched by id. Records are returned lazily, so the event
+        bodies are only deserialized for the records whose entries are accessed.
+        """
+        check.sequence_param(asset_partitions, "asset_partitions", of_type=AssetKeyPartitionKey)
+        check.invariant(
+            event_type
+            in {DagsterEventType.ASSET_MATERIALIZATION, DagsterEventType.ASSET_OBSERVATION},
+            "event_type must be ASSET_MATERIALIZATION or ASSET_OBSERVATION",
+        )
+
+        unpartitioned_asset_keys: set[AssetKey] = set()
+        partition_keys_by_asset_key: dict[AssetKey, set[str]] = defaultdict(set)
+        for asset_partition in asset_partitions:
+            if asset_partition.partition_key is None:
+                unpartitioned_asset_keys.add(asset_partition.asset_key)
+            else:
+                partition_keys_by_asset_key[asset_partition.asset_key].add(
+                    asset_partition.partition_key
+                )
+
+        asset_keys = list(unpartitioned_asset_keys | partition_keys_by_asset_key.keys())
+        if not asset_keys:
+            return {}
+        asset_keys_by_str = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        assets_details = self._get_assets_details(asset_keys)
+
+        queries = []
+        for i in range(0, len(asset_keys), LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE):
+            batch_asset_keys = asset_keys[i : i + LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE]
+            batch_assets_details = assets_details[i : i + LATEST_ASSET_PARTITION_RECORDS_BATCH_SIZE]
+            batch_unpartitioned_asset_keys = [
+                asset_key.to_string()
+                for asset_key in batch_asset_keys
+                if asset_key in unpartitioned_asset_keys
+            ]
+            batch_partitioned_asset_keys = [
+                asset_key
+                for asset_key in batch_asset_keys
+                if asset_key in partition_keys_by_asset_key
+            ]
+            if batch_unpartitioned_asset_keys:
+                query = (
+                    db_select(
+                        [
+                            SqlEventLogStorageTable.c.asset_key,
+                            db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                        ]
+                    )
+                    .where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                            SqlEventLogStorageTable.c.asset_key.in_(batch_unpartitioned_asset_keys),
+                        )
+                    )
+                    .group_by(SqlEventLogStorageTable.c.asset_key)
+                )
+                queries.append(
+                    self._add_assets_wipe_filter_to_query(
+                        query, batch_assets_details, batch_asset_keys
+                    )
+                )
+            if batch_partitioned_asset_keys:
+                query = (
+                    db_select(
+                        [
+                            SqlEventLogStorageTable.c.asset_key,
+                            SqlEventLogStorageTable.c.partition,
+                            db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                        ]
+                    )
+                    .where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                            db.or_(
+                                *[
+                                    db.and_(
+                                        SqlEventLogStorageTable.c.asset_key
+                                        == asset_key.to_string(),
+                                        SqlEventLogStorageTable.c.partition.in_(
+                                            sorted(partition_keys_by_asset_key[asset_key])
+                                        ),
+                                    )
+                                    for asset_key in batch_partitioned_asset_keys
+                                ]
+                            ),
+                        )
+                    )
+                    .group_by(
+                        SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition
+                    )
+                )
+                queries.append(
+                    self._add_assets_wipe_filter_to_query(
+                        query, batch_assets_details, batch_asset_keys
+                    )
+                )
+
+        # an asset's latest event may also be the latest event for one of its partitions
+        asset_partitions_by_storage_id: dict[int, list[AssetKeyPartitionKey]] = defaultdict(list)
+        with self.index_connection() as conn:
+            for query in queries:
+                with db_result(conn, query) as result:
+                    rows = result.fetchall()
+                for row in rows:
+                    # rows are (asset_key, id) or (asset_key, partition, id)
+                    asset_partitions_by_storage_id[cast("int", row[-1])].append(
+                        AssetKeyPartitionKey(
+                            asset_keys_by_str[cast("str", row[0])],
+                            cast("str", row[1]) if len(row) == 3 else None,
+                        )
+                    )
+
+            if not asset_partitions_by_storage_id:
+                return {}
+
+            records_query = db_select(_LAZY_RECORD_COLUMNS).where(
+                SqlEventLogStorageTable.c.id.in_(list(asset_partitions_by_storage_id.keys()))
+            )
+            with db_result(conn, records_query) as result:
+                rows = result.fetchall()
+
+        return {
+            asset_partition: record
+            for record in map(_lazy_event_log_record, rows)
+            for asset_partition in asset_partitions_by_storage_id[record.storage_id]
+        }
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
@@ -3440,6 +4019,7 @@ def get_latest_planned_materialization_info(
             ),
             limit=1,
             ascending=False,
+            lazy=True,
         )
         if not records:
             return None
@@ -7,7 +7,7 @@
 import threading
 import time
 from collections import defaultdict
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, ContextManager  # noqa: UP035
@@ -38,7 +38,13 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import RUNLESS_RUN_ID
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.storage.event_log.base import (
+    EventLogConnection,
+    EventLogCursor,
+    EventLogRecord,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from dagster._core.storage.event_log.schema import (
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
@@ -302,6 +308,18 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, str | None],
+        limit: int | None = None,
+    ) -> Mapping[str, EventLogConnection]:
+        """Overridden method to fetch the records for each run from its own shard.
+
+        The record id in sqlite does not auto increment cross runs, so the records for different
+        runs cannot be fetched with a single storage id filter.
+        """
+        return EventLogStorage.get_records_for_runs(self, cursors_by_run_id, limit=limit)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -442,6 +442,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_unindexed_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_unindexed_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
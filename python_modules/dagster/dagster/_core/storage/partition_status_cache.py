@@ -1,4 +1,5 @@
-from collections.abc import Iterable, Sequence
+import os
+from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, NamedTuple, Optional
 
@@ -31,6 +32,7 @@
     get_dimension_from_partition_tag,
 )
 from dagster._serdes import whitelist_for_serdes
+from dagster._time import get_current_timestamp
 
 if TYPE_CHECKING:
     from dagster._core.storage.event_log.base import AssetRecord
@@ -44,6 +46,17 @@
 )
 RUN_FETCH_BATCH_SIZE = 100
 
+# daemon cursor key for the time up to which the partition status cache daemon has applied every
+# event to the stored cache values
+PARTITION_STATUS_CACHE_UPDATED_TIMESTAMP_KEY = "PARTITION_STATUS_CACHE_UPDATED_TIMESTAMP"
+
+
+def get_partition_status_cache_max_staleness_seconds() -> float:
+    """How far behind the event log the partition status cache daemon can be before reads stop
+    using the stored cache values as-is and rebuild them instead.
+    """
+    return float(os.getenv("DAGSTER_PARTITION_STATUS_CACHE_MAX_STALENESS_SECONDS", "60"))
+
 
 class AssetPartitionStatus(Enum):
     """The status of asset partition."""
@@ -468,27 +481,117 @@ def get_and_update_asset_status_cache_value(
         else:
             stored_cache_value = asset_record.asset_entry.cached_status
 
-        use_cached_value = (
-            stored_cache_value
-            and partitions_def
-            and stored_cache_value.partitions_def_id
-            == partitions_def.get_serializable_unique_identifier()
-        )
-        updated_cache_value = _build_status_cache(
-            instance=instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            stored_cache_value=stored_cache_value if use_cached_value else None,
-            asset_record=asset_record,
-        )
         if (
-            updated_cache_value is not None
-            and instance.event_log_storage.can_write_asset_status_cache()
-            and updated_cache_value != stored_cache_value
+            instance.partition_status_cache_daemon_enabled
+            and _is_stored_cache_value_valid(stored_cache_value, partitions_def)
+            and _is_partition_status_cache_daemon_current(instance)
         ):
-            instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+            # the partition status cache daemon keeps the stored value up to date with the event
+            # log, so there is no need to rebuild it on read
+            return stored_cache_value
+
+        return _update_asset_status_cache_value(
+            instance, asset_key, partitions_def, stored_cache_value, asset_record
+        )
+
+
+def update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_key: Mapping[AssetKey, PartitionsDefinition | None],
+    dynamic_partitions_loader: DynamicPartitionsStore | None = None,
+) -> Sequence[AssetKey]:
+    """Applies any events stored since the cached status of each of the given assets was last
+    computed, and writes the updated values back to storage.
+
+    This is used to keep the cached status values current in the background, so that reads can
+    use the stored values as-is. Returns the keys of the assets whose cached status changed.
+    """
+    check.mapping_param(partitions_defs_by_key, "partitions_defs_by_key", key_type=AssetKey)
+
+    if not instance.event_log_storage.can_write_asset_status_cache():
+        return []
+
+    updated_keys = []
+    with partition_loading_context(None, dynamic_partitions_loader or instance):
+        asset_records_by_key = {
+            record.asset_entry.asset_key: record
+            for record in instance.get_asset_records(asset_keys=list(partitions_defs_by_key))
+        }
+        for asset_key, partitions_def in partitions_defs_by_key.items():
+            asset_record = asset_records_by_key.get(asset_key)
+            stored_cache_value = asset_record.asset_entry.cached_status if asset_record else None
+            updated_cache_value = _update_asset_status_cache_value(
+                instance, asset_key, partitions_def, stored_cache_value, asset_record
+            )
+            if updated_cache_value != stored_cache_value:
+                updated_keys.append(asset_key)
+
+    return updated_keys
+
+
+def set_partition_status_cache_updated_timestamp(
+    instance: DagsterInstance, timestamp: float
+) -> None:
+    """Records that every event stored before the given time has been applied to the stored cache
+    values.
+    """
+    instance.daemon_cursor_storage.set_cursor_values(
+        {PARTITION_STATUS_CACHE_UPDATED_TIMESTAMP_KEY: str(timestamp)}
+    )
+
+
+def _is_partition_status_cache_daemon_current(instance: DagsterInstance) -> bool:
+    # the daemon may not be running, or may be far behind the event log, in which case the stored
+    # cache values cannot be used as-is
+    updated_timestamp = instance.daemon_cursor_storage.get_cursor_values(
+        {PARTITION_STATUS_CACHE_UPDATED_TIMESTAMP_KEY}
+    ).get(PARTITION_STATUS_CACHE_UPDATED_TIMESTAMP_KEY)
+    if not updated_timestamp:
+        return False
+    return (
+        get_current_timestamp() - float(updated_timestamp)
+        <= get_partition_status_cache_max_staleness_seconds()
+    )
+
+
+def _is_stored_cache_value_valid(
+    stored_cache_value: AssetStatusCacheValue | None,
+    partitions_def: PartitionsDefinition | None,
+) -> bool:
+    return bool(
+        stored_cache_value
+        and partitions_def
+        and stored_cache_value.partitions_def_id
+        == partitions_def.get_serializable_unique_identifier()
+    )
+
+
+def _update_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition | None,
+    stored_cache_value: AssetStatusCacheValue | None,
+    asset_record: Optional["AssetRecord"],
+) -> AssetStatusCacheValue | None:
+    updated_cache_value = _build_status_cache(
+        instance=instance,
+        asset_key=asset_key,
+        partitions_def=partitions_def,
+        stored_cache_value=(
+            stored_cache_value
+            if _is_stored_cache_value_valid(stored_cache_value, partitions_def)
+            else None
+        ),
+        asset_record=asset_record,
+    )
+    if (
+        updated_cache_value is not None
+        and instance.event_log_storage.can_write_asset_status_cache()
+        and updated_cache_value != stored_cache_value
+    ):
+        instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
-        return updated_cache_value
+    return updated_cache_value
 
 
 async def get_partition_subsets(
@@ -34,6 +34,9 @@
 from dagster._core.definitions.automation_tick_evaluation_context import (
     AutomationTickEvaluationContext,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    get_automation_log_max_partition_items,
+)
 from dagster._core.definitions.declarative_automation.serialized_objects import (
     AutomationConditionEvaluationWithRunIds,
 )
@@ -1222,6 +1225,21 @@ async def _evaluate_auto_materialize_tick(
                 f" evaluation{'s' if len(evaluations_by_key) != 1 else ''} for evaluation ID"
                 f" {evaluation_id}{print_group_name}"
             )
+            requested_evaluations = [
+                evaluation
+                for evaluation in evaluations_by_key.values()
+                if evaluation.num_requested > 0
+            ]
+            if requested_evaluations:
+                log_max_partition_items = get_automation_log_max_partition_items()
+                requested_str = ", ".join(
+                    f"{evaluation.key.to_user_string()} "
+                    f"{evaluation.evaluation.true_subset.get_summary_str(log_max_partition_items)}"
+                    for evaluation in requested_evaluations
+                )
+                self._logger.info(
+                    f"Requested for evaluation ID {evaluation_id}{print_group_name}: {requested_str}"
+                )
 
             # Write the asset evaluations without run IDs first
             if schedule_storage.supports_auto_materialize_asset_evaluations:
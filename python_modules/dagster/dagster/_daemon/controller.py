@@ -25,6 +25,7 @@
     SensorDaemon,
 )
 from dagster._daemon.freshness import FreshnessDaemon
+from dagster._daemon.partition_status_cache import PartitionStatusCacheDaemon
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
 from dagster._grpc.constants import INCREASE_TIMEOUT_DAGSTER_YAML_MSG, GrpcServerCommand
@@ -380,6 +381,8 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
         )
     elif daemon_type == FreshnessDaemon.daemon_type():
         return FreshnessDaemon()
+    elif daemon_type == PartitionStatusCacheDaemon.daemon_type():
+        return PartitionStatusCacheDaemon()
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
@@ -0,0 +1,316 @@
+import json
+import os
+from collections.abc import Iterator, Mapping
+from typing import NamedTuple
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.partitions.definition import PartitionsDefinition
+from dagster._core.events import DagsterEventType
+from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
+from dagster._core.storage.partition_status_cache import (
+    is_cacheable_partition_type,
+    set_partition_status_cache_updated_timestamp,
+    update_asset_status_cache_values,
+)
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.daemon import IntervalDaemon
+from dagster._time import get_current_timestamp
+
+_INTERVAL_SECONDS = int(
+    os.environ.get("DAGSTER_PARTITION_STATUS_CACHE_DAEMON_INTERVAL_SECONDS", "15")
+)
+_EVENT_LOG_FETCH_LIMIT = int(
+    os.environ.get("DAGSTER_PARTITION_STATUS_CACHE_DAEMON_FETCH_LIMIT", "1000")
+)
+_REBUILD_CHUNK_SIZE = int(
+    os.environ.get("DAGSTER_PARTITION_STATUS_CACHE_DAEMON_REBUILD_CHUNK_SIZE", "50")
+)
+
+_REBUILD_CURSOR_KEY = "PARTITION_STATUS_CACHE_REBUILD_CURSOR"
+
+# events that change the status of the partitions of the asset they target
+ASSET_STATUS_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+    DagsterEventType.ASSET_FAILED_TO_MATERIALIZE,
+]
+# events that move the in progress partitions planned by a run to failed (or clear them)
+RUN_END_EVENT_TYPES = [
+    DagsterEventType.RUN_SUCCESS,
+    DagsterEventType.RUN_FAILURE,
+    DagsterEventType.RUN_CANCELED,
+]
+PARTITION_STATUS_CACHE_EVENT_TYPES = [*ASSET_STATUS_EVENT_TYPES, *RUN_END_EVENT_TYPES]
+
+
+class PartitionStatusCacheDaemon(IntervalDaemon):
+    """Keeps the cached partition status of each partitioned asset in the workspace up to date
+    with the event log, so that reads (e.g. from the UI) can use the stored cache values without
+    rebuilding them.
+
+    Every iteration tails the event log in batches from a persisted cursor per event type,
+    collects the assets targeted by new materializations, planned materializations and failures
+    (and the assets planned by runs that finished), and applies the new events to the stored
+    cache values of those assets. It then records the time up to which every event has been
+    applied, so that reads can tell whether the stored values are current enough to use as-is.
+
+    When there are no cursors to tail from (e.g. on the first iteration), every cached asset is
+    rebuilt instead, in chunks of assets whose progress is persisted, so that the rebuild can
+    span iterations without blocking the daemon heartbeat.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: int = _INTERVAL_SECONDS,
+        event_log_fetch_limit: int = _EVENT_LOG_FETCH_LIMIT,
+        rebuild_chunk_size: int = _REBUILD_CHUNK_SIZE,
+    ):
+        super().__init__(interval_seconds=interval_seconds)
+        self._event_log_fetch_limit = event_log_fetch_limit
+        self._rebuild_chunk_size = check.int_param(rebuild_chunk_size, "rebuild_chunk_size")
+
+    @classmethod
+    def daemon_type(cls) -> str:
+        return "PARTITION_STATUS_CACHE"
+
+    def instrument_lag(self, lag_seconds: float, num_events: int) -> None:
+        """Called at the end of every iteration.
+
+        Args:
+            lag_seconds (float): An upper bound on how far behind the event log the cache values
+                are after the iteration; 0 if every new event was applied.
+            num_events (int): The number of events applied in the iteration.
+        """
+
+    def run_iteration(self, workspace_process_context: IWorkspaceProcessContext):
+        instance = workspace_process_context.instance
+        if not instance.event_log_storage.can_write_asset_status_cache():
+            yield
+            return
+
+        request_context = workspace_process_context.create_request_context()
+        partitions_defs_by_key = {
+            node.key: node.partitions_def
+            for node in request_context.asset_graph.asset_nodes
+            if node.partitions_def and is_cacheable_partition_type(node.partitions_def)
+        }
+
+        persisted_cursors = _fetch_persisted_cursors(instance)
+        if any(cursor is None for cursor in persisted_cursors.values()):
+            # there is no cursor to tail from, so bring every cache value up to date and then start
+            # tailing from the end of the event log as of the start of the rebuild
+            yield from self._rebuild_cache_values(
+                instance, request_context.dynamic_partitions_loader, partitions_defs_by_key
+            )
+            return
+
+        # every event stored before now is applied by this iteration, unless there is a backlog
+        iteration_timestamp = get_current_timestamp()
+        asset_keys: set[AssetKey] = set()
+        new_cursors: dict[DagsterEventType, int] = {}
+        num_events = 0
+        # the timestamp of the last event applied for an event type that has more events to fetch
+        backlog_timestamp: float | None = None
+        finished_run_ids: set[str] = set()
+        for event_type in PARTITION_STATUS_CACHE_EVENT_TYPES:
+            yield
+
+            cursor = check.not_none(persisted_cursors[event_type])
+            events_by_log_id = instance.event_log_storage.get_logs_for_all_runs_by_log_id(
+                after_cursor=cursor,
+                dagster_event_type=event_type,
+                limit=self._event_log_fetch_limit,
+            )
+            for event in events_by_log_id.values():
+                if event_type in RUN_END_EVENT_TYPES:
+                    finished_run_ids.add(event.run_id)
+                elif event.dagster_event and event.dagster_event.asset_key:
+                    asset_keys.add(event.dagster_event.asset_key)
+
+            num_events += len(events_by_log_id)
+            new_cursors[event_type] = max(events_by_log_id.keys(), default=cursor)
+            if len(events_by_log_id) >= self._event_log_fetch_limit:
+                last_timestamp = events_by_log_id[new_cursors[event_type]].timestamp
+                backlog_timestamp = min(backlog_timestamp or last_timestamp, last_timestamp)
+
+        yield
+        asset_keys.update(_get_planned_asset_keys(instance, finished_run_ids))
+
+        yield
+        updated_keys = update_asset_status_cache_values(
+            instance,
+            {
+                key: partitions_defs_by_key[key]
+                for key in asset_keys
+                if key in partitions_defs_by_key
+            },
+            dynamic_partitions_loader=request_context.dynamic_partitions_loader,
+        )
+
+        # persist cursors now that the events have been applied
+        _persist_cursors(instance, new_cursors)
+        set_partition_status_cache_updated_timestamp(
+            instance, backlog_timestamp if backlog_timestamp else iteration_timestamp
+        )
+
+        lag_seconds = (
+            max(get_current_timestamp() - backlog_timestamp, 0.0) if backlog_timestamp else 0.0
+        )
+        self.instrument_lag(lag_seconds, num_events)
+        self._logger.debug(
+            f"Applied {num_events} events to the partition status cache, updating "
+            f"{len(updated_keys)} assets. Lag: {lag_seconds:.1f}s"
+        )
+
+    def _rebuild_cache_values(
+        self,
+        instance: DagsterInstance,
+        dynamic_partitions_loader: DynamicPartitionsStore,
+        partitions_defs_by_key: Mapping[AssetKey, PartitionsDefinition],
+    ) -> Iterator[None]:
+        rebuild_cursor = _fetch_rebuild_cursor(instance)
+        if rebuild_cursor is None:
+            self._logger.info("No partition status cache cursor, updating all cached statuses")
+            rebuild_cursor = RebuildCursor(
+                max_record_id=instance.event_log_storage.get_maximum_record_id() or 0,
+                last_asset_key=None,
+                start_timestamp=get_current_timestamp(),
+            )
+        else:
+            self._logger.info(
+                "Resuming update of all cached partition statuses after asset "
+                f"{rebuild_cursor.last_asset_key.to_user_string() if rebuild_cursor.last_asset_key else None}"
+            )
+
+        # assets are rebuilt in a stable order, so that a persisted rebuild cursor can be resumed
+        keys_to_rebuild = sorted(partitions_defs_by_key.keys(), key=lambda key: key.to_string())
+        if rebuild_cursor.last_asset_key:
+            last_asset_key_str = rebuild_cursor.last_asset_key.to_string()
+            keys_to_rebuild = [
+                key for key in keys_to_rebuild if key.to_string() > last_asset_key_str
+            ]
+
+        for i in range(0, len(keys_to_rebuild), self._rebuild_chunk_size):
+            yield
+
+            chunk = keys_to_rebuild[i : i + self._rebuild_chunk_size]
+            update_asset_status_cache_values(
+                instance,
+                {key: partitions_defs_by_key[key] for key in chunk},
+                dynamic_partitions_loader=dynamic_partitions_loader,
+            )
+            rebuild_cursor = rebuild_cursor._replace(last_asset_key=chunk[-1])
+            _persist_rebuild_cursor(instance, rebuild_cursor)
+            self._logger.debug(
+                f"Updated the cached partition statuses of {i + len(chunk)} of "
+                f"{len(keys_to_rebuild)} assets"
+            )
+
+        # every cache value is up to date as of the start of the rebuild, so tail from there
+        _persist_cursors(
+            instance,
+            {
+                event_type: rebuild_cursor.max_record_id
+                for event_type in PARTITION_STATUS_CACHE_EVENT_TYPES
+            },
+        )
+        _persist_rebuild_cursor(instance, None)
+        if rebuild_cursor.start_timestamp is not None:
+            set_partition_status_cache_updated_timestamp(instance, rebuild_cursor.start_timestamp)
+        self.instrument_lag(0.0, 0)
+
+
+class RebuildCursor(NamedTuple):
+    """Progress of a rebuild of every cached partition status.
+
+    max_record_id (int): The maximum event log record id when the rebuild started. Tailing the
+        event log resumes from this id once the rebuild is complete.
+    last_asset_key (Optional[AssetKey]): The last asset key whose cache value was rebuilt.
+    start_timestamp (Optional[float]): The time at which the rebuild started.
+    """
+
+    max_record_id: int
+    last_asset_key: AssetKey | None
+    start_timestamp: float | None = None
+
+
+def _fetch_rebuild_cursor(instance: DagsterInstance) -> RebuildCursor | None:
+    cursor_str = instance.daemon_cursor_storage.get_cursor_values({_REBUILD_CURSOR_KEY}).get(
+        _REBUILD_CURSOR_KEY
+    )
+    if not cursor_str:
+        return None
+
+    cursor = json.loads(cursor_str)
+    return RebuildCursor(
+        max_record_id=cursor["max_record_id"],
+        last_asset_key=(
+            AssetKey.from_db_string(cursor["last_asset_key"]) if cursor["last_asset_key"] else None
+        ),
+        start_timestamp=cursor.get("start_timestamp"),
+    )
+
+
+def _persist_rebuild_cursor(instance: DagsterInstance, cursor: RebuildCursor | None) -> None:
+    instance.daemon_cursor_storage.set_cursor_values(
+        {
+            _REBUILD_CURSOR_KEY: (
+                json.dumps(
+                    {
+                        "max_record_id": cursor.max_record_id,
+                        "last_asset_key": (
+                            cursor.last_asset_key.to_string() if cursor.last_asset_key else None
+                        ),
+                        "start_timestamp": cursor.start_timestamp,
+                    }
+                )
+                if cursor
+                else ""
+            )
+        }
+    )
+
+
+def _get_planned_asset_keys(instance: DagsterInstance, run_ids: set[str]) -> set[AssetKey]:
+    asset_keys = set()
+    for run_id in run_ids:
+        connection = instance.event_log_storage.get_records_for_run(
+            run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+        )
+        for record in connection.records:
+            if record.asset_key:
+                asset_keys.add(record.asset_key)
+    return asset_keys
+
+
+def _create_cursor_key(event_type: DagsterEventType) -> str:
+    check.inst_param(event_type, "event_type", DagsterEventType)
+
+    return f"PARTITION_STATUS_CACHE_CURSOR-{event_type.value}"
+
+
+def _fetch_persisted_cursors(instance: DagsterInstance) -> dict[DagsterEventType, int | None]:
+    persisted_cursors = instance.daemon_cursor_storage.get_cursor_values(
+        {_create_cursor_key(event_type) for event_type in PARTITION_STATUS_CACHE_EVENT_TYPES}
+    )
+    return {
+        event_type: (
+            int(persisted_cursors[_create_cursor_key(event_type)])
+            if _create_cursor_key(event_type) in persisted_cursors
+            else None
+        )
+        for event_type in PARTITION_STATUS_CACHE_EVENT_TYPES
+    }
+
+
+def _persist_cursors(instance: DagsterInstance, cursors: Mapping[DagsterEventType, int]) -> None:
+    check.mapping_param(cursors, "cursors", key_type=DagsterEventType, value_type=int)
+
+    if cursors:
+        instance.daemon_cursor_storage.set_cursor_values(
+            {
+                _create_cursor_key(event_type): str(cursor_value)
+                for event_type, cursor_value in cursors.items()
+            }
+        )
@@ -3,9 +3,10 @@
 import sys
 import threading
 import time
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
+from typing import Any
 
 from dagster import (
     DagsterEvent,
@@ -13,9 +14,9 @@
     _check as check,
 )
 from dagster._core.errors import DagsterCodeLocationLoadError, DagsterUserCodeUnreachableError
-from dagster._core.events import EngineEventData
+from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, EngineEventData
 from dagster._core.instance import DagsterInstance
-from dagster._core.instance.config import ConcurrencyConfig
+from dagster._core.instance.config import ConcurrencyConfig, PoolGranularity
 from dagster._core.launcher import LaunchRunContext
 from dagster._core.op_concurrency_limits_counter import GlobalOpConcurrencyLimitsCounter
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
@@ -26,14 +27,17 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.queued_run_index import QueuedRunIndex
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 PAGE_SIZE = int(os.getenv("DAGSTER_RUN_QUEUE_PAGE_SIZE", "100"))
+INDEX_REFRESH_INTERVAL_SECONDS = int(
+    os.getenv("DAGSTER_RUN_QUEUE_INDEX_REFRESH_INTERVAL_SECONDS", "300")
+)
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -41,7 +45,12 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
-    def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
+    def __init__(
+        self,
+        interval_seconds,
+        page_size=PAGE_SIZE,
+        index_refresh_interval_seconds=INDEX_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
         self._exit_stack = ExitStack()
         self._executor: ThreadPoolExecutor | None = None
         self._location_timeouts_lock = threading.Lock()
@@ -49,6 +58,10 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._page_size = page_size
         self._global_concurrency_blocked_runs_lock = threading.Lock()
         self._global_concurrency_blocked_runs = set()
+        self._index_refresh_interval_seconds = index_refresh_interval_seconds
+        self._queued_run_index: QueuedRunIndex | None = None
+        self._queued_run_index_cursors: dict[DagsterEventType, str | None] = {}
+        self._queued_run_index_loaded_at: float | None = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -216,10 +229,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: list[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -236,123 +245,173 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
+        queued_run_index = self._get_queued_run_index(instance, tag_concurrency_limits, now)
+        if not len(queued_run_index):
+            return []
 
-        concurrency_keys = None
-        pool_limits = None
-
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
+        self._logger.info(
+            "Priority sorting and checking tag concurrency limits for queued runs."
+            + locations_clause
+        )
 
-            if not queued_runs:
-                has_more = False
-                return batch
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits, in_progress_runs
+        )
 
-            if not logged_this_iteration:
-                logged_this_iteration = True
-                self._logger.info(
-                    "Priority sorting and checking tag concurrency limits for queued runs."
-                    + locations_clause
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            try:
+                global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                    instance,
+                    queued_run_index.get_pool_names(
+                        concurrency_config.pool_config.pool_granularity or PoolGranularity.OP
+                    ),
+                    in_progress_run_records,
+                    concurrency_keys=instance.event_log_storage.get_concurrency_keys(),
+                    pool_limits=instance.event_log_storage.get_pool_limits(),
+                    slot_count_offset=run_queue_config.op_concurrency_slot_buffer,
+                    pool_granularity=concurrency_config.pool_config.pool_granularity,
                 )
-
-            cursor = queued_runs[-1].run_id
-
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    # fetch global concurrency information at most once per iteration
-                    if concurrency_keys is None:
-                        concurrency_keys = instance.event_log_storage.get_concurrency_keys()
-
-                    if pool_limits is None:
-                        pool_limits = instance.event_log_storage.get_pool_limits()
-
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        concurrency_keys=concurrency_keys,
-                        pool_limits=pool_limits,
-                        slot_count_offset=run_queue_config.op_concurrency_slot_buffer,
-                        pool_granularity=concurrency_config.pool_config.pool_granularity,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
+            except:
+                self._logger.exception("Failed to initialize op concurrency counter")
+                # when we cannot initialize the global concurrency counter, we should fall back
+                # to not blocking any runs based on op concurrency limits
                 global_concurrency_limits_counter = None
+        else:
+            global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+        def try_select_run(run: DagsterRun) -> bool:
+            # whether a run is blocked only depends on the tags, pools, and location that the index
+            # buckets runs by, and the counters only grow as runs are selected, so returning False
+            # here skips the rest of the runs in this run's bucket
+            if tag_concurrency_limits_counter.is_blocked(run):
+                return False
 
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
-                ):
-                    to_remove.append(run)
-                    if run.run_id not in self._global_concurrency_blocked_runs:
-                        with self._global_concurrency_blocked_runs_lock:
-                            self._global_concurrency_blocked_runs.add(run.run_id)
-                        concurrency_blocked_info = json.dumps(
-                            global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                        )
-                        self._logger.info(
-                            f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                        )
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
+            if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(
+                run
+            ):
+                if run.run_id not in self._global_concurrency_blocked_runs:
+                    with self._global_concurrency_blocked_runs_lock:
+                        self._global_concurrency_blocked_runs.add(run.run_id)
+                    concurrency_blocked_info = json.dumps(
+                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+                    )
+                    self._logger.info(
+                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                    )
+                return False
 
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
+            location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+            if location_name and location_name in paused_location_names:
+                return False
 
-            for run in to_remove:
-                batch.remove(run)
+            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+            if global_concurrency_limits_counter:
+                global_concurrency_limits_counter.update_counters_with_launched_item(run)
+            return True
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+        return list(
+            queued_run_index.select_runs(
+                try_select_run,
+                limit=max_runs_to_launch if max_concurrent_runs_enabled else None,
+            )
+        )
 
-        return batch
+    def _get_queued_run_index(
+        self,
+        instance: DagsterInstance,
+        tag_concurrency_limits: Sequence[Mapping[str, Any]],
+        now: float,
+    ) -> QueuedRunIndex:
+        """Returns the index of queued runs, brought up to date with the run status changes since
+        the last iteration.
+
+        The index is loaded from the run storage on the first iteration and every
+        `index_refresh_interval_seconds` after that, which also drops any runs that were deleted
+        from the queue without a run status change. In between, it is updated from the run status
+        change events, so each iteration only reads the runs whose status has changed.
+        """
+        tag_concurrency_limit_keys = {limit["key"] for limit in tag_concurrency_limits or []}
+
+        if (
+            self._queued_run_index is None
+            or self._queued_run_index_loaded_at is None
+            or now - self._queued_run_index_loaded_at >= self._index_refresh_interval_seconds
+        ):
+            self._load_queued_run_index(instance, tag_concurrency_limit_keys, now)
+        else:
+            self._queued_run_index.set_tag_concurrency_limit_keys(tag_concurrency_limit_keys)
+            self._update_queued_run_index(instance)
+
+        return check.not_none(self._queued_run_index)
+
+    def _load_queued_run_index(
+        self, instance: DagsterInstance, tag_concurrency_limit_keys: set[str], now: float
+    ) -> None:
+        # read the cursors before the queued runs, so that no status change is missed between the
+        # two. Status changes that were already reflected in the loaded runs are applied again,
+        # which has no effect
+        cursors = {}
+        for event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            result = instance.fetch_run_status_changes(event_type, limit=1)
+            cursors[event_type] = result.cursor if result.records else None
+
+        queued_run_index = QueuedRunIndex(tag_concurrency_limit_keys)
+        cursor = None
+        while True:
+            queued_run_records = instance.get_run_records(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            queued_run_index.add_run_records(queued_run_records)
+            if len(queued_run_records) < self._page_size:
+                break
+            cursor = queued_run_records[-1].dagster_run.run_id
+
+        self._queued_run_index = queued_run_index
+        self._queued_run_index_cursors = cursors
+        self._queued_run_index_loaded_at = now
+
+    def _update_queued_run_index(self, instance: DagsterInstance) -> None:
+        queued_run_index = check.not_none(self._queued_run_index)
+
+        # the most recent status change for each run whose status changed since the last iteration
+        latest_status_changes: dict[str, tuple[int, DagsterEventType]] = {}
+        for event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            has_more = True
+            while has_more:
+                result = instance.fetch_run_status_changes(
+                    event_type,
+                    limit=self._page_size,
+                    cursor=self._queued_run_index_cursors.get(event_type),
+                    ascending=True,
+                )
+                for record in result.records:
+                    latest_status_change = latest_status_changes.get(record.run_id)
+                    if not latest_status_change or latest_status_change[0] < record.storage_id:
+                        latest_status_changes[record.run_id] = (record.storage_id, event_type)
+                self._queued_run_index_cursors[event_type] = result.cursor
+                has_more = result.has_more
+
+        # go by the event type rather than the status of the run, since the run status is updated
+        # after the status change event is stored. Runs that have been deleted are dropped.
+        enqueued_run_ids = [
+            run_id
+            for run_id, (_, event_type) in latest_status_changes.items()
+            if event_type == DagsterEventType.RUN_ENQUEUED
+        ]
+        queued_run_index.remove_runs(latest_status_changes.keys())
+        for i in range(0, len(enqueued_run_ids), self._page_size):
+            queued_run_index.add_run_records(
+                instance.get_run_records(
+                    filters=RunsFilter(run_ids=enqueued_run_ids[i : i + self._page_size])
+                )
+            )
 
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> list[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
-
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
             return (
@@ -370,10 +429,15 @@ def _dequeue_run(
     ) -> bool:
         assert concurrency_config.run_queue_config
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run_id = run.run_id
         with self._global_concurrency_blocked_runs_lock:
-            if run.run_id in self._global_concurrency_blocked_runs:
-                self._global_concurrency_blocked_runs.remove(run.run_id)
+            if run_id in self._global_concurrency_blocked_runs:
+                self._global_concurrency_blocked_runs.remove(run_id)
+
+        run = instance.get_run_by_id(run_id)
+        if run is None:
+            self._logger.info("Run %s no longer exists, skipping", run_id)
+            return False
 
         now = fixed_iteration_time or time.time()
 
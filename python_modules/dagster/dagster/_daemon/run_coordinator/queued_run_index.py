@@ -0,0 +1,217 @@
+import heapq
+import itertools
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable, Sequence, Set
+from typing import NamedTuple
+
+import dagster._check as check
+from dagster._core.instance.config import PoolGranularity
+from dagster._core.storage.dagster_run import DagsterRun, RunRecord
+from dagster._core.storage.tags import PRIORITY_TAG
+
+
+def get_run_priority(run: DagsterRun) -> int:
+    priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+class _QueuedRunEntry(NamedTuple):
+    run: DagsterRun
+    storage_id: int
+    bucket_key: Hashable
+
+
+class _QueuedRunBucket:
+    """A heap of the queued runs that share a bucket key, ordered by priority and then by the order
+    in which they were created.
+
+    Entries for runs that are removed from the index are left in the heap and skipped when they
+    reach the top, and the heap is rebuilt once they make up most of it.
+    """
+
+    def __init__(self):
+        self.heap: list[tuple[int, int, int, _QueuedRunEntry]] = []
+        self.size = 0
+
+
+class QueuedRunIndex:
+    """An in-memory index of the queued runs, used by the QueuedRunCoordinatorDaemon to find the
+    runs to launch without reading and sorting the whole queue on every iteration.
+
+    Queued runs are grouped into buckets of runs that are interchangeable as far as the run queue
+    limits are concerned: runs with the same values for the tags that have concurrency limits, the
+    same op concurrency pools, and the same code location are either all blocked or all unblocked
+    by the same set of in-progress runs. Each bucket holds its runs in a priority heap, so that
+    `select_runs` only has to look at the head of each bucket and at the runs that it selects,
+    rather than at every queued run.
+    """
+
+    def __init__(self, tag_concurrency_limit_keys: Set[str] = frozenset()):
+        self._tag_concurrency_limit_keys = frozenset(tag_concurrency_limit_keys)
+        self._entries: dict[str, _QueuedRunEntry] = {}
+        self._buckets: dict[Hashable, _QueuedRunBucket] = {}
+        # used to break ties between heap entries for the same run, which can be in a bucket heap
+        # more than once if the run was removed and added back to the index
+        self._counter = itertools.count()
+
+        self._root_pool_counts: dict[str, int] = defaultdict(int)
+        self._pool_counts: dict[str, int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self._entries
+
+    @property
+    def run_ids(self) -> Set[str]:
+        return self._entries.keys()
+
+    def get_pool_names(self, pool_granularity: PoolGranularity) -> set[str]:
+        """The op concurrency pools that the queued runs need slots for."""
+        if pool_granularity == PoolGranularity.RUN:
+            return set(self._pool_counts.keys())
+        return set(self._root_pool_counts.keys())
+
+    def set_tag_concurrency_limit_keys(self, tag_concurrency_limit_keys: Set[str]) -> None:
+        """Rebuckets the queued runs if the tag keys with concurrency limits have changed."""
+        tag_concurrency_limit_keys = frozenset(tag_concurrency_limit_keys)
+        if tag_concurrency_limit_keys == self._tag_concurrency_limit_keys:
+            return
+
+        self._tag_concurrency_limit_keys = tag_concurrency_limit_keys
+        entries = list(self._entries.values())
+        self._entries = {}
+        self._buckets = {}
+        self._root_pool_counts = defaultdict(int)
+        self._pool_counts = defaultdict(int)
+        for entry in entries:
+            self._add(entry.run, entry.storage_id)
+
+    def add_run_records(self, run_records: Iterable[RunRecord]) -> None:
+        for record in run_records:
+            self._add(record.dagster_run, record.storage_id)
+
+    def remove_runs(self, run_ids: Iterable[str]) -> None:
+        for run_id in run_ids:
+            self._remove(run_id)
+
+    def _get_bucket_key(self, run: DagsterRun) -> Hashable:
+        limited_tags = frozenset(
+            (key, value)
+            for key, value in run.tags.items()
+            if key in self._tag_concurrency_limit_keys
+        )
+        op_concurrency = run.run_op_concurrency
+        pools_key = (
+            (
+                frozenset(op_concurrency.root_key_counts.items()),
+                op_concurrency.has_unconstrained_root_nodes,
+                frozenset(op_concurrency.all_pools or []),
+            )
+            if op_concurrency
+            else None
+        )
+        location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+        return (limited_tags, pools_key, location_name)
+
+    def _add(self, run: DagsterRun, storage_id: int) -> None:
+        self._remove(run.run_id)
+
+        bucket_key = self._get_bucket_key(run)
+        entry = _QueuedRunEntry(run=run, storage_id=storage_id, bucket_key=bucket_key)
+        self._entries[run.run_id] = entry
+
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = _QueuedRunBucket()
+        heapq.heappush(
+            bucket.heap, (-get_run_priority(run), storage_id, next(self._counter), entry)
+        )
+        bucket.size += 1
+
+        if run.run_op_concurrency:
+            for pool in run.run_op_concurrency.root_key_counts.keys():
+                self._root_pool_counts[pool] += 1
+            for pool in run.run_op_concurrency.all_pools or []:
+                self._pool_counts[pool] += 1
+
+    def _remove(self, run_id: str) -> None:
+        entry = self._entries.pop(run_id, None)
+        if entry is None:
+            return
+
+        bucket = self._buckets[entry.bucket_key]
+        bucket.size -= 1
+        if bucket.size == 0:
+            del self._buckets[entry.bucket_key]
+        elif len(bucket.heap) > 2 * bucket.size:
+            bucket.heap = [item for item in bucket.heap if self._is_live(item[3])]
+            heapq.heapify(bucket.heap)
+
+        if entry.run.run_op_concurrency:
+            for pool in entry.run.run_op_concurrency.root_key_counts.keys():
+                _decrement(self._root_pool_counts, pool)
+            for pool in entry.run.run_op_concurrency.all_pools or []:
+                _decrement(self._pool_counts, pool)
+
+    def _is_live(self, entry: _QueuedRunEntry) -> bool:
+        return self._entries.get(entry.run.run_id) is entry
+
+    def _peek(self, bucket: _QueuedRunBucket) -> tuple[int, int, int, _QueuedRunEntry] | None:
+        while bucket.heap and not self._is_live(bucket.heap[0][3]):
+            heapq.heappop(bucket.heap)
+        return bucket.heap[0] if bucket.heap else None
+
+    def select_runs(
+        self,
+        try_select_run: Callable[[DagsterRun], bool],
+        limit: int | None = None,
+    ) -> Sequence[DagsterRun]:
+        """Walks the queued runs in priority order (breaking ties in the order in which the runs
+        were created), calling `try_select_run` on each one until `limit` runs have been selected.
+
+        When `try_select_run` returns False for a run, the rest of the runs in its bucket are
+        skipped for this call, so `try_select_run` must only return False if it would also return
+        False for every run with the same bucket key after it.
+        """
+        check.opt_int_param(limit, "limit")
+
+        # a heap of the buckets ordered by the runs at the top of their heaps
+        frontier = []
+        for bucket in self._buckets.values():
+            head = self._peek(bucket)
+            if head:
+                frontier.append((head, bucket))
+        heapq.heapify(frontier)
+
+        selected: list[DagsterRun] = []
+        # selected runs are popped off their bucket heaps to reach the runs after them, and pushed
+        # back on once the walk is done, since they stay queued until they are launched
+        popped: list[tuple[_QueuedRunBucket, tuple[int, int, int, _QueuedRunEntry]]] = []
+        try:
+            while frontier and (limit is None or len(selected) < limit):
+                head, bucket = heapq.heappop(frontier)
+                run = head[3].run
+                if not try_select_run(run):
+                    continue
+
+                selected.append(run)
+                popped.append((bucket, heapq.heappop(bucket.heap)))
+                next_head = self._peek(bucket)
+                if next_head:
+                    heapq.heappush(frontier, (next_head, bucket))
+        finally:
+            for bucket, item in popped:
+                heapq.heappush(bucket.heap, item)
+
+        return selected
+
+
+def _decrement(counts: dict[str, int], key: str) -> None:
+    counts[key] -= 1
+    if counts[key] <= 0:
+        del counts[key]
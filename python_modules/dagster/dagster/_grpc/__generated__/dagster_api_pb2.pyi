@@ -336,8 +336,18 @@ global___ExternalPartitionSetExecutionParamsRequest = ExternalPartitionSetExecut
 class ListRepositoriesRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
+    INCLUDE_REPOSITORY_SNAPSHOT_IDS_FIELD_NUMBER: builtins.int
+    include_repository_snapshot_ids: builtins.bool
     def __init__(
         self,
+        *,
+        include_repository_snapshot_ids: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing.Literal[
+            "include_repository_snapshot_ids", b"include_repository_snapshot_ids"
+        ],
     ) -> None: ...
 
 global___ListRepositoriesRequest = ListRepositoriesRequest
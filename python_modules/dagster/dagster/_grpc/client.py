@@ -341,8 +341,12 @@ def execution_plan_snapshot(
         )
         return res.serialized_execution_plan_snapshot
 
-    def list_repositories(self) -> str:
-        res = self._query("ListRepositories", dagster_api_pb2.ListRepositoriesRequest)
+    def list_repositories(self, include_repository_snapshot_ids: bool = False) -> str:
+        res = self._query(
+            "ListRepositories",
+            dagster_api_pb2.ListRepositoriesRequest,
+            include_repository_snapshot_ids=include_repository_snapshot_ids,
+        )
         return res.serialized_list_repositories_response_or_error
 
     async def gen_list_repositories(self, **kwargs) -> str:
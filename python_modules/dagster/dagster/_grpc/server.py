@@ -53,6 +53,7 @@
     ScheduleExecutionErrorSnap,
     SensorExecutionErrorSnap,
 )
+from dagster._core.remote_representation.repository_snapshot_cache import get_repository_snapshot_id
 from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshotErrorData
 from dagster._core.types.loadable_target_origin import (
     LoadableTargetOrigin,
@@ -246,6 +247,9 @@ def __init__(
         self._recon_repos_by_name: dict[str, ReconstructableRepository] = {}
         self._repo_defs_by_name: dict[str, RepositoryDefinition] = {}
         self._loadable_repository_symbols: list[LoadableRepositorySymbol] = []
+        # content hashes of the serialized (deferred) RepositorySnap of each repository, computed
+        # on request
+        self._repository_snapshot_ids: dict[str, str] = {}
 
         self._container_context = container_context
 
@@ -334,10 +338,23 @@ def definitions_by_name(self) -> Mapping[str, RepositoryDefinition]:
     def reconstructables_by_name(self) -> Mapping[str, ReconstructableRepository]:
         return self._recon_repos_by_name
 
+    def get_repository_snapshot_ids(self) -> Mapping[str, str]:
+        """Content hashes of the serialized (deferred) RepositorySnap of each repository, which
+        clients use as keys for a RepositorySnapshotCache. The definitions do not change until they
+        are reloaded, so each id is computed once and reused.
+        """
+        for repository_name, repo_def in self._repo_defs_by_name.items():
+            if repository_name not in self._repository_snapshot_ids:
+                self._repository_snapshot_ids[repository_name] = get_repository_snapshot_id(
+                    serialize_value(RepositorySnap.from_def(repo_def, defer_snapshots=True))
+                )
+        return dict(self._repository_snapshot_ids)
+
     def update_repo_defs(
         self, new_repo_defs_by_name: Mapping[str, RepositoryDefinition]
     ) -> "LoadedRepositories":
         self._repo_defs_by_name = dict(new_repo_defs_by_name)
+        self._repository_snapshot_ids = {}
         return self
 
 
@@ -909,6 +926,11 @@ def ListRepositories(  # ty: ignore[invalid-method-override]
                     container_context=self._container_context,
                     dagster_library_versions=DagsterLibraryRegistry.get(),
                     defs_state_info=self._defs_state_info,
+                    repository_snapshot_ids=(
+                        self._get_repository_snapshot_ids(loaded_repositories)
+                        if request.include_repository_snapshot_ids
+                        else None
+                    ),
                 )
             )
         except Exception:
@@ -921,6 +943,16 @@ def ListRepositories(  # ty: ignore[invalid-method-override]
             serialized_list_repositories_response_or_error=serialized_response
         )
 
+    def _get_repository_snapshot_ids(
+        self, loaded_repositories: LoadedRepositories
+    ) -> Mapping[str, str] | None:
+        try:
+            return loaded_repositories.get_repository_snapshot_ids()
+        except Exception:
+            # clients fetch the snapshot over gRPC instead, which reports the error
+            _maybe_log_exception(self._logger, "RepositorySnapshotIds")
+            return None
+
     def ExternalPartitionNames(  # ty: ignore[invalid-method-override]
         self, request: dagster_api_pb2.ExternalPartitionNamesRequest, _context: grpc.ServicerContext
     ) -> dagster_api_pb2.ExternalPartitionNamesReply:
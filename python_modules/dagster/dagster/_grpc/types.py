@@ -234,6 +234,8 @@ class ListRepositoriesResponse(IHaveNew):
     container_context: Mapping[str, Any] | None
     dagster_library_versions: Mapping[str, str] | None
     defs_state_info: DefsStateInfo | None
+    # content hash of the serialized RepositorySnap of each repository, used as a cache key
+    repository_snapshot_ids: Mapping[str, str] | None
 
     def __new__(
         cls,
@@ -245,6 +247,7 @@ def __new__(
         container_context: Mapping[str, Any] | None = None,
         dagster_library_versions: Mapping[str, str] | None = None,
         defs_state_info: DefsStateInfo | None = None,
+        repository_snapshot_ids: Mapping[str, str] | None = None,
     ):
         return super().__new__(
             cls,
@@ -258,6 +261,7 @@ def __new__(
             container_context=container_context,
             dagster_library_versions=dagster_library_versions,
             defs_state_info=defs_state_info,
+            repository_snapshot_ids=repository_snapshot_ids,
         )
 
 
@@ -60,6 +60,10 @@ def __init__(
         self.batch_load_fn = batch_load_fn
         self.max_batch_size = max_batch_size
 
+        # the number of calls made to batch_load_fn, and the total number of keys passed to them
+        self.num_batches = 0
+        self.num_keys_loaded = 0
+
     def prepare(self, keys: Iterable[KeyT]) -> None:
         # ensure that the provided keys will be fetched as a unit in the next fetch
         for key in keys:
@@ -78,6 +82,8 @@ def blocking_load(self, key: KeyT) -> ReturnT:
             ):
                 # uses independent event loop from the async system
                 chunk_results = self.batch_load_fn(chunk)
+                self.num_batches += 1
+                self.num_keys_loaded += len(chunk)
                 for k, v in zip(chunk, chunk_results):
                     self._cache[self.get_cache_key(k)] = v
 
@@ -135,6 +141,10 @@ def __init__(
         self._cache = cache_map if cache_map is not None else {}
         self._queue: list[Loader] = []
 
+        # the number of calls made to batch_load_fn, and the total number of keys passed to them
+        self.num_batches = 0
+        self.num_keys_loaded = 0
+
         super().__init__(batch_load_fn, max_batch_size)
 
     @property
@@ -290,6 +300,8 @@ async def dispatch_queue_batch(loader: DataLoader[Any, Any], queue: list[Loader]
     keys = [ql.key for ql in queue]
 
     # Call the provided batch_load_fn for this loader with the loader queue's keys.
+    loader.num_batches += 1
+    loader.num_keys_loaded += len(keys)
     try:
         batch_future = loader.batch_load_fn(keys)
     except Exception as e:
@@ -80,6 +80,9 @@ def __init__(
 
         self._dynamic_partitions_cache: dict[str, Sequence[str]] = {}
 
+        self._prefetched_latest_records: dict[AssetKeyPartitionKey, EventLogRecord | None] = {}
+        self._prefetched_latest_storage_ids_by_partition: dict[AssetKey, Mapping[str, int]] = {}
+
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
         self._respect_materialization_data_versions = (
@@ -108,6 +111,85 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch_latest_materialization_or_observation_records(
+        self, asset_partitions: Iterable[AssetKeyPartitionKey]
+    ) -> None:
+        """For performance, batches together the queries for the latest materialization or
+        observation record of the selected asset partitions. Asset partitions whose latest record
+        is read from the asset record are skipped, as those are batched by prefetch_asset_records.
+
+        For each selected partitioned asset, the latest storage id of every one of its partitions
+        is prefetched as well, since that is what partition-level lookups read.
+        """
+        asset_partitions = {
+            asset_partition
+            for asset_partition in asset_partitions
+            if self.asset_graph.has(asset_partition.asset_key)
+        }
+        self._prefetch_latest_storage_ids_by_partition(
+            {
+                asset_partition.asset_key
+                for asset_partition in asset_partitions
+                if self.asset_graph.get(asset_partition.asset_key).is_partitioned
+            }
+        )
+
+        asset_partitions_to_fetch = [
+            asset_partition
+            for asset_partition in asset_partitions
+            if asset_partition not in self._prefetched_latest_records
+            and not self._has_latest_record_on_asset_record(asset_partition)
+        ]
+        if not asset_partitions_to_fetch:
+            return
+
+        latest_materialization_records = self.instance.get_latest_asset_partition_records(
+            asset_partitions_to_fetch, event_type=DagsterEventType.ASSET_MATERIALIZATION
+        )
+        observable_asset_partitions = [
+            asset_partition
+            for asset_partition in asset_partitions_to_fetch
+            if self.asset_graph.get(asset_partition.asset_key).is_observable
+        ]
+        latest_observation_records = (
+            self.instance.get_latest_asset_partition_records(
+                observable_asset_partitions, event_type=DagsterEventType.ASSET_OBSERVATION
+            )
+            if observable_asset_partitions
+            else {}
+        )
+        for asset_partition in asset_partitions_to_fetch:
+            records = [
+                record
+                for record in (
+                    latest_materialization_records.get(asset_partition),
+                    latest_observation_records.get(asset_partition),
+                )
+                if record is not None
+            ]
+            # matches _get_latest_materialization_or_observation_record, which prefers the more
+            # recent of the latest materialization and observation
+            self._prefetched_latest_records[asset_partition] = max(
+                records, key=lambda record: record.timestamp, default=None
+            )
+
+    def _prefetch_latest_storage_ids_by_partition(self, asset_keys: AbstractSet[AssetKey]) -> None:
+        asset_keys_by_event_type: dict[DagsterEventType, list[AssetKey]] = defaultdict(list)
+        for asset_key in asset_keys:
+            if asset_key not in self._prefetched_latest_storage_ids_by_partition:
+                asset_keys_by_event_type[self._event_type_for_key(asset_key)].append(asset_key)
+
+        for event_type, event_type_asset_keys in asset_keys_by_event_type.items():
+            storage_ids_by_partition_by_asset_key = (
+                self.instance.get_latest_storage_ids_by_partition_for_assets(
+                    event_type_asset_keys, event_type=event_type
+                )
+            )
+            for asset_key in event_type_asset_keys:
+                self._prefetched_latest_storage_ids_by_partition[asset_key] = (
+                    storage_ids_by_partition_by_asset_key.get(asset_key, {})
+                )
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -259,6 +341,15 @@ def _event_type_for_key(self, asset_key: AssetKey) -> DagsterEventType:
         else:
             return DagsterEventType.ASSET_MATERIALIZATION
 
+    def _has_latest_record_on_asset_record(self, asset_partition: AssetKeyPartitionKey) -> bool:
+        """Whether the latest record for the asset partition is the last materialization record
+        stored on its asset record.
+        """
+        return asset_partition.partition_key is None and not (
+            self.asset_graph.has(asset_partition.asset_key)
+            and self.asset_graph.get(asset_partition.asset_key).is_observable
+        )
+
     @cached_method
     def _get_latest_materialization_or_observation_record(
         self, *, asset_partition: AssetKeyPartitionKey, before_cursor: int | None = None
@@ -268,19 +359,15 @@ def _get_latest_materialization_or_observation_record(
         AssetMaterialization.
         """
         # in the simple case, just use the asset record
-        if (
-            before_cursor is None
-            and asset_partition.partition_key is None
-            and not (
-                self.asset_graph.has(asset_partition.asset_key)
-                and self.asset_graph.get(asset_partition.asset_key).is_observable
-            )
-        ):
+        if before_cursor is None and self._has_latest_record_on_asset_record(asset_partition):
             asset_record = self.get_asset_record(asset_partition.asset_key)
             if asset_record is None:
                 return None
             return asset_record.asset_entry.last_materialization_record
 
+        if before_cursor is None and asset_partition in self._prefetched_latest_records:
+            return self._prefetched_latest_records[asset_partition]
+
         records_filter = AssetRecordsFilter(
             asset_key=asset_partition.asset_key,
             asset_partitions=(
@@ -326,12 +413,13 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            self._prefetch_latest_storage_ids_by_partition({asset_key})
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in self._prefetched_latest_storage_ids_by_partition[
+                        asset_key
+                    ].items()
                 }
             )
         return latest_storage_ids
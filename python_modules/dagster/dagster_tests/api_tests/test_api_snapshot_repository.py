@@ -1,10 +1,13 @@
+import os
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
 import dagster as dg
 import dagster._check as check
 import pytest
 from dagster import job
+from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.snapshot_repository import sync_get_external_repositories_data_grpc
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.instance import DagsterInstance
@@ -21,6 +24,7 @@
     extract_serialized_job_snap_from_serialized_job_data_snap,
 )
 from dagster._core.remote_representation.handle import RepositoryHandle
+from dagster._core.remote_representation.repository_snapshot_cache import RepositorySnapshotCache
 from dagster._core.storage.tags import EXTERNAL_JOB_SOURCE_TAG_KEY
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._utils.env import environ
@@ -90,6 +94,76 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+def test_external_repositories_api_grpc_snapshot_cache(tmp_path):
+    with dg.instance_for_test(
+        overrides={
+            "code_servers": {"snapshot_cache": {"enabled": True, "directory": str(tmp_path)}}
+        }
+    ) as instance:
+        snapshot_cache = check.not_none(instance.repository_snapshot_cache)
+        with get_bar_repo_code_location(instance) as code_location:
+            # snapshot ids are only computed when requested
+            assert sync_list_repositories_grpc(code_location.client).repository_snapshot_ids is None
+            snapshot_ids = sync_list_repositories_grpc(
+                code_location.client, include_repository_snapshot_ids=True
+            ).repository_snapshot_ids
+            assert snapshot_ids and set(snapshot_ids.keys()) == {"bar_repo"}
+
+            # the code location populated the cache when it loaded
+            cache_entry = check.not_none(snapshot_cache.get(snapshot_ids["bar_repo"]))
+            repository_snap = code_location.remote_repositories["bar_repo"].repository_snap
+            job_snaps = code_location._job_snaps_by_name["bar_repo"]  # noqa: SLF001
+            assert cache_entry.repository_snap == repository_snap
+            assert cache_entry.job_snaps == job_snaps
+
+            # later loads of the same snapshot do not fetch it from the code server
+            with mock.patch.object(
+                code_location.client, "external_repository", side_effect=Exception("fetched")
+            ):
+                repository_snaps = sync_get_external_repositories_data_grpc(
+                    code_location.client,
+                    code_location,
+                    defer_snapshots=True,
+                    snapshot_ids=snapshot_ids,
+                    snapshot_cache=snapshot_cache,
+                )
+            assert repository_snaps["bar_repo"] == (repository_snap, job_snaps)
+
+            # unknown snapshot ids are fetched and not cached, since the fetched snapshot does not
+            # match the id
+            unknown_id = "0" * 64
+            repository_snaps = sync_get_external_repositories_data_grpc(
+                code_location.client,
+                code_location,
+                defer_snapshots=True,
+                snapshot_ids={"bar_repo": unknown_id},
+                snapshot_cache=snapshot_cache,
+            )
+            assert repository_snaps["bar_repo"][0] == repository_snap
+            assert snapshot_cache.get(unknown_id) is None
+
+
+def test_repository_snapshot_cache_eviction(tmp_path):
+    with get_bar_repo_code_location() as code_location:
+        repository_snap = code_location.remote_repositories["bar_repo"].repository_snap
+
+    snapshot_cache = RepositorySnapshotCache(str(tmp_path), max_entries=2)
+    snapshot_ids = [str(i) * 64 for i in range(3)]
+    for i, snapshot_id in enumerate(snapshot_ids):
+        snapshot_cache.set(snapshot_id, repository_snap, {})
+        # make the modification times distinct
+        os.utime(tmp_path / f"{snapshot_id}.snap", (i, i))
+
+    snapshot_cache.set(snapshot_ids[2], repository_snap, {})
+    assert snapshot_cache.get(snapshot_ids[0]) is None
+    assert check.not_none(snapshot_cache.get(snapshot_ids[2])).repository_snap == repository_snap
+
+    # corrupt and invalid entries are treated as missing
+    (tmp_path / f"{snapshot_ids[2]}.snap").write_bytes(b"not a snapshot")
+    assert snapshot_cache.get(snapshot_ids[2]) is None
+    assert snapshot_cache.get("../../etc/passwd") is None
+
+
 @dg.op
 def do_something():
     return 1
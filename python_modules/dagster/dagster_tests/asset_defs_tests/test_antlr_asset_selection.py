@@ -3,6 +3,8 @@
 from dagster._core.definitions.antlr_asset_selection.antlr_asset_selection import (
     AntlrAssetSelectionParser,
     KeyWildCardAssetSelection,
+    _parse_asset_selection_string,
+    parse_asset_selection_string,
 )
 from dagster._core.definitions.antlr_asset_selection.generated.AssetSelectionParser import (
     AssetSelectionParser,
@@ -389,3 +391,43 @@ def multi_partitioned(): ...
     assert PartitionsAssetSelection(selected_partitions="multipartitions").resolve(asset_graph) == {
         dg.AssetKey("multi_partitioned")
     }
+
+
+def test_parse_asset_selection_string_cache() -> None:
+    _parse_asset_selection_string.cache_clear()
+    selection = parse_asset_selection_string('key:"a" or group:"g"')
+    assert selection == AntlrAssetSelectionParser('key:"a" or group:"g"').asset_selection
+    assert parse_asset_selection_string('key:"a" or group:"g"') is selection
+    assert AssetSelection.from_string('key:"a" or group:"g"') is selection
+    assert _parse_asset_selection_string.cache_info().hits == 2
+
+    # include_sources is part of the cache key
+    assert parse_asset_selection_string('key:"a" or group:"g"', True) is not selection
+
+    with pytest.raises(Exception):
+        parse_asset_selection_string("not_a_real_attribute:a")
+
+
+def test_key_wildcard_resolve() -> None:
+    from dagster._core.definitions.assets.graph.asset_graph import AssetGraph
+
+    @dg.asset(key=["a", "b"])
+    def a_b(): ...
+
+    @dg.asset(key=["a", "c"])
+    def a_c(): ...
+
+    @dg.asset(key=["a", "b", "c"])
+    def a_b_c(): ...
+
+    asset_graph = AssetGraph.from_assets([a_b, a_c, a_b_c])
+
+    assert KeyWildCardAssetSelection(selected_key_wildcard="a/b").resolve(asset_graph) == {
+        dg.AssetKey(["a", "b"])
+    }
+    assert KeyWildCardAssetSelection(selected_key_wildcard="a/*").resolve(asset_graph) == {
+        dg.AssetKey(["a", "b"]),
+        dg.AssetKey(["a", "c"]),
+        dg.AssetKey(["a", "b", "c"]),
+    }
+    assert KeyWildCardAssetSelection(selected_key_wildcard="a/d").resolve(asset_graph) == set()
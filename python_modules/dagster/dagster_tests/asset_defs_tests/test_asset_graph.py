@@ -1,3 +1,4 @@
+import random
 import time
 from collections.abc import Callable
 from datetime import datetime
@@ -15,6 +16,7 @@
     BaseAssetGraph,
     BaseAssetNode,
 )
+from dagster._core.definitions.assets.graph.reachability import ReachabilityIndex
 from dagster._core.definitions.assets.graph.remote_asset_graph import (
     RemoteAssetGraph,
     RemoteWorkspaceAssetGraph,
@@ -29,6 +31,7 @@
 from dagster._core.remote_representation.external import RemoteRepository
 from dagster._core.remote_representation.external_data import RepositorySnap
 from dagster._core.remote_representation.handle import RepositoryHandle
+from dagster._core.selector.subset_selector import DependencyGraph, fetch_connected
 from dagster._core.test_utils import freeze_time, mock_workspace_from_repos
 from dagster._time import create_datetime
 
@@ -800,6 +803,75 @@ def Bc(): ...
     ]
 
 
+def test_attribute_indexes(
+    asset_graph_from_assets: Callable[..., BaseAssetGraph],
+) -> None:
+    @dg.asset(group_name="g1", tags={"team": "a"}, kinds={"python"}, owners=["a@dagster.io"])
+    def A(): ...
+
+    @dg.asset(group_name="g1", tags={"team": "b"}, kinds={"python", "s3"})
+    def B(): ...
+
+    @dg.asset(group_name="g2", tags={"flag": ""}, owners=["a@dagster.io", "team:b"])
+    def C(): ...
+
+    external = AssetsDefinition(
+        specs=[dg.AssetSpec("external", group_name="g2", tags={"team": "a"}, kinds={"s3"})]
+    )
+
+    asset_graph = asset_graph_from_assets([A, B, C, external])
+
+    assert asset_graph.asset_keys_by_group == {
+        "g1": {A.key, B.key},
+        "g2": {C.key, external.key},
+    }
+    assert asset_graph.asset_keys_for_group("g2") == {C.key, external.key}
+    assert asset_graph.asset_keys_for_group("g2", require_materializable=True) == {C.key}
+    assert asset_graph.asset_keys_for_group("missing") == set()
+
+    assert asset_graph.get_asset_keys_for_tag("team", "a") == {A.key, external.key}
+    assert asset_graph.get_asset_keys_for_tag("team") == {A.key, B.key, external.key}
+    assert asset_graph.get_asset_keys_for_tag("flag", "") == {C.key}
+    assert asset_graph.get_asset_keys_for_tag("team", "c") == set()
+
+    assert asset_graph.asset_keys_by_kind == {
+        "python": {A.key, B.key},
+        "s3": {B.key, external.key},
+    }
+    assert asset_graph.asset_keys_without_kinds == {C.key}
+    assert asset_graph.asset_keys_by_owner == {
+        "a@dagster.io": {A.key, C.key},
+        "team:b": {C.key},
+    }
+
+    # selections resolve against the indexes
+    assert dg.AssetSelection.tag("team", "a").resolve(asset_graph) == {A.key}
+    assert dg.AssetSelection.tag("team", "a", include_sources=True).resolve(asset_graph) == {
+        A.key,
+        external.key,
+    }
+    assert dg.AssetSelection.kind("s3").resolve(asset_graph) == {B.key}
+    assert dg.AssetSelection.kind(None).resolve(asset_graph) == {C.key}
+    assert dg.AssetSelection.owner("a@dagster.io").resolve(asset_graph) == {A.key, C.key}
+    assert dg.AssetSelection.groups("g2", include_sources=True).resolve(asset_graph) == {
+        C.key,
+        external.key,
+    }
+
+    # the indexes are shared by every resolve, so they cannot be mutated by callers
+    assert isinstance(asset_graph.asset_keys_by_tag["team"]["a"], frozenset)
+    assert isinstance(asset_graph.asset_keys_by_owner["team:b"], frozenset)
+    assert isinstance(asset_graph.asset_keys_without_kinds, frozenset)
+    assert isinstance(asset_graph.asset_keys_by_user_string["A"], frozenset)
+    for selection_str in ["is:external", "is:materializable"]:
+        resolved = dg.AssetSelection.from_string(selection_str).resolve_inner(
+            asset_graph, allow_missing=False
+        )
+        assert isinstance(resolved, set)
+        assert resolved is not asset_graph.external_asset_keys
+        assert resolved is not asset_graph.materializable_asset_keys
+
+
 def test_with_job_nodes() -> None:
     @dg.asset
     def A(): ...
@@ -1236,3 +1308,71 @@ def repo():
     # Test: non-existent key should return empty
     result = asset_graph.get_assets_for_same_storage_address(dg.AssetKey("nonexistent"))
     assert result == set()
+
+
+def test_reachability_index() -> None:
+    rng = random.Random(0)
+    keys = [dg.AssetKey(f"asset_{i}") for i in range(300)]
+    upstream: dict[dg.AssetKey, set[dg.AssetKey]] = {key: set() for key in keys}
+    for i, key in enumerate(keys[1:], start=1):
+        upstream[key].update(rng.sample(keys[:i], min(i, rng.randint(0, 3))))
+    upstream[keys[5]].add(keys[5])  # self-dependency
+    downstream: dict[dg.AssetKey, set[dg.AssetKey]] = {key: set() for key in keys}
+    for key, parents in upstream.items():
+        for parent in parents:
+            downstream[parent].add(key)
+    graph: DependencyGraph[dg.AssetKey] = {"upstream": upstream, "downstream": downstream}
+
+    index = ReachabilityIndex(graph, keys)
+    for _ in range(100):
+        nodes = set(rng.sample(keys, rng.randint(1, 3)))
+        for direction in ("upstream", "downstream"):
+            for depth in (None, 0, 1, 2, 5, 1000):
+                assert index.fetch_connected(nodes, direction, depth) == nodes | fetch_connected(
+                    nodes, graph, direction=direction, depth=depth
+                )
+
+    for _ in range(500):
+        node, other = rng.choice(keys), rng.choice(keys)
+        assert index.is_upstream(node, other) == (
+            node == other or other in fetch_connected({node}, graph, direction="downstream")
+        )
+
+
+def test_asset_graph_reachability_index(
+    asset_graph_from_assets: Callable[..., BaseAssetGraph], monkeypatch
+) -> None:
+    @dg.asset
+    def a(): ...
+
+    @dg.asset(deps=[a])
+    def b(): ...
+
+    @dg.asset(deps=[a, b])
+    def c(): ...
+
+    @dg.asset(deps=[c])
+    def d(): ...
+
+    selections = [
+        dg.AssetSelection.assets(a).downstream(),
+        dg.AssetSelection.assets(a).downstream(depth=1, include_self=False),
+        dg.AssetSelection.assets(d).upstream(),
+        dg.AssetSelection.assets(d).upstream(depth=1),
+        dg.AssetSelection.assets(b, d).upstream(depth=2, include_self=False),
+    ]
+    asset_graph = asset_graph_from_assets([a, b, c, d])
+    expected = [selection.resolve(asset_graph) for selection in selections]
+    expected_ancestors = asset_graph.get_ancestor_asset_keys(d.key)
+    assert expected_ancestors == {a.key, b.key, c.key}
+
+    monkeypatch.setenv("DAGSTER_ASSET_GRAPH_REACHABILITY_INDEX", "1")
+    asset_graph = asset_graph_from_assets([a, b, c, d])
+    assert [selection.resolve(asset_graph) for selection in selections] == expected
+    assert asset_graph.get_ancestor_asset_keys(d.key) == expected_ancestors
+    assert asset_graph.get_ancestor_asset_keys(d.key, include_self=True) == {
+        a.key,
+        b.key,
+        c.key,
+        d.key,
+    }
@@ -14,12 +14,16 @@
 from dagster._core.definitions.partitions.snap import PartitionsSnap
 from dagster._core.definitions.partitions.subset import (
     AllPartitionsSubset,
+    BitmapPartitionsSubset,
     DefaultPartitionsSubset,
     KeyRangesPartitionsSubset,
     TimeWindowPartitionsSubset,
 )
 from dagster._core.definitions.partitions.utils import PersistedTimeWindow
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+)
 from dagster._core.instance.types import DynamicPartitionsStore
 from dagster._core.test_utils import freeze_time, instance_for_test
 from dagster._serdes import deserialize_value, serialize_value
@@ -460,6 +464,102 @@ def test_key_ranges_subset_dynamic_partitions():
         assert asset_graph_subset.asset_keys == {dg.AssetKey("asset")}
 
 
+def test_bitmap_subset():
+    partitions_def = dg.StaticPartitionsDefinition(["a", "b", "c", "d", "e"])
+    subset = BitmapPartitionsSubset.create_empty_subset(partitions_def)
+    assert subset.is_empty
+
+    abc = subset.with_partition_keys(["a", "b", "c"])
+    bcd = subset.with_partition_keys(["d", "c", "b"])
+    assert len(abc) == 3
+    assert "a" in abc and "d" not in abc and "z" not in abc
+    assert abc.get_partition_keys() == ["a", "b", "c"]
+
+    assert set((abc & bcd).get_partition_keys()) == {"b", "c"}
+    assert set((abc | bcd).get_partition_keys()) == {"a", "b", "c", "d"}
+    assert (abc - bcd).get_partition_keys() == ["a"]
+    assert abc - abc == subset
+    assert abc | subset == abc
+    assert abc == subset.with_partition_keys(["c", "b", "a"])
+
+    assert abc.get_partition_keys_not_in_subset(partitions_def) == ["d", "e"]
+    assert ((abc | bcd.with_partition_keys(["e"])) - bcd).get_partition_key_ranges(
+        partitions_def
+    ) == [dg.PartitionKeyRange("a", "a"), dg.PartitionKeyRange("e", "e")]
+
+    # set operations with other subset types fall back to comparing keys
+    assert set((abc | DefaultPartitionsSubset({"e"})).get_partition_keys()) == {"a", "b", "c", "e"}
+
+    with pytest.raises(dg.DagsterUnknownPartitionError):
+        abc.with_partition_keys(["z"])
+
+
+def test_bitmap_subset_serialization():
+    partitions_def = dg.StaticPartitionsDefinition([str(i) for i in range(10_000)])
+    subset = BitmapPartitionsSubset.create_empty_subset(partitions_def).with_partition_keys(
+        str(i) for i in range(0, 10_000, 3)
+    )
+    serialized = subset.serialize()
+    assert len(serialized) < len(
+        DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    )
+    assert BitmapPartitionsSubset.can_deserialize(partitions_def, serialized, None, None)
+    assert BitmapPartitionsSubset.from_serialized(partitions_def, serialized) == subset
+
+    # subsets serialized in the DefaultPartitionsSubset format can still be read
+    default_serialized = DefaultPartitionsSubset({"1", "5", "unknown"}).serialize()
+    assert BitmapPartitionsSubset.can_deserialize(partitions_def, default_serialized, None, None)
+    assert BitmapPartitionsSubset.from_serialized(
+        partitions_def, default_serialized
+    ).get_partition_keys() == ["1", "5"]
+
+    # the bitmap can't be interpreted once the keys are reordered
+    reordered_partitions_def = dg.StaticPartitionsDefinition(
+        [str(i) for i in reversed(range(10_000))]
+    )
+    assert not BitmapPartitionsSubset.can_deserialize(
+        reordered_partitions_def, serialized, None, None
+    )
+    with pytest.raises(DagsterDefinitionChangedDeserializationError):
+        BitmapPartitionsSubset.from_serialized(reordered_partitions_def, serialized)
+
+    # serdes-serialized values store the keys
+    assert deserialize_value(serialize_value(subset.to_serializable_subset())) == (
+        DefaultPartitionsSubset(set(subset.get_partition_keys()))
+    )
+
+
+def test_bitmap_subset_dynamic_partitions(monkeypatch):
+    monkeypatch.setenv("DAGSTER_BITMAP_PARTITIONS_SUBSETS", "1")
+    dynamic_partitions_def = dg.DynamicPartitionsDefinition(name="bitmap_partitions_def")
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("bitmap_partitions_def", ["a", "b", "c"])
+        with partition_loading_context(dynamic_partitions_store=instance):
+            assert dynamic_partitions_def.partitions_subset_class is BitmapPartitionsSubset
+            subset = dynamic_partitions_def.subset_with_partition_keys(["a", "c"])
+            assert isinstance(subset, BitmapPartitionsSubset)
+            serialized = subset.serialize()
+
+            # appended partitions don't invalidate the bitmap
+            instance.add_dynamic_partitions("bitmap_partitions_def", ["d"])
+            assert dynamic_partitions_def.can_deserialize_subset(serialized, None, None)
+            deserialized = dynamic_partitions_def.deserialize_subset(serialized)
+            assert deserialized == subset
+            assert deserialized.get_partition_keys_not_in_subset(dynamic_partitions_def) == [
+                "b",
+                "d",
+            ]
+            assert set((subset | deserialized.with_partition_keys(["d"])).get_partition_keys()) == {
+                "a",
+                "c",
+                "d",
+            }
+
+            # deleted partitions do
+            instance.delete_dynamic_partition("bitmap_partitions_def", "a")
+            assert not dynamic_partitions_def.can_deserialize_subset(serialized, None, None)
+
+
 def test_multi_partition_subset_to_range_conversion_grouping_choices():
     # Test that converting from a list of partitions keys to a subset, to a list of ranges, and back to
     # a list of partition keys for MultiPartitionsDefinitions does not lose any partitions.
@@ -605,3 +705,31 @@ def test_multi_partition_subset_to_range_conversion_time_partition():
             multi_partitions_def.get_partition_keys_in_range(partition_key_range)
         )
     assert sorted(partition_keys_from_ranges) == sorted(group_by_color_target_partitions)
+
+
+def test_partitions_subset_summary_str():
+    assert DefaultPartitionsSubset({"c", "a", "b"}).get_summary_str() == "a, b, c (3 keys)"
+    assert (
+        DefaultPartitionsSubset({"c", "a", "b"}).get_summary_str(max_items=2)
+        == "a, b, ... (+1 more) (3 keys)"
+    )
+    assert DefaultPartitionsSubset({"a"}).get_summary_str(max_items=0) == "1 key"
+    assert DefaultPartitionsSubset().get_summary_str() == "0 keys"
+
+    hourly_partitions_def = dg.HourlyPartitionsDefinition(start_date="2024-01-01-00:00")
+    with partition_loading_context(effective_dt=create_datetime(2024, 6, 1)):
+        subset = (
+            hourly_partitions_def.empty_subset()
+            .with_partition_key_range(
+                hourly_partitions_def,
+                dg.PartitionKeyRange("2024-01-01-00:00", "2024-03-01-23:00"),
+            )
+            .with_partition_keys(["2024-04-01-05:00", "2024-04-02-00:00", "2024-04-02-01:00"])
+        )
+        assert subset.get_summary_str() == (
+            "2024-01-01-00:00..2024-03-01-23:00, 2024-04-01-05:00, "
+            "2024-04-02-00:00..2024-04-02-01:00 (1467 keys)"
+        )
+        assert subset.get_summary_str(max_items=1) == (
+            "2024-01-01-00:00..2024-03-01-23:00, ... (+2 more) (1467 keys)"
+        )
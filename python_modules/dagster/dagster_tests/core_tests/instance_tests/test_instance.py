@@ -1,8 +1,11 @@
 import datetime
+import gc
 import json
 import os
 import re
 import tempfile
+import time
+import weakref
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -21,6 +24,8 @@
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
+from dagster._core.instance.events import write_behind
+from dagster._core.instance.events.write_behind import EventWriteBehindBuffer
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.remote_representation.external_data import PartitionsSnap
 from dagster._core.secrets.env_file import PerProjectEnvFileLoader
@@ -1108,3 +1113,89 @@ def test_invalid_run_id():
             match=r"run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_event_write_behind() -> None:
+    with (
+        environ(
+            {
+                "DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE": "5",
+                # long enough that the background thread does not flush during the test
+                "DAGSTER_EVENT_WRITE_BEHIND_INTERVAL_SECONDS": "600",
+            }
+        ),
+        dg.instance_for_test() as instance,
+    ):
+        run = create_run_for_test(instance, job_name="foo_job")
+        stored_messages = []
+        instance.add_event_listener(run.run_id, lambda event: stored_messages.append(event.message))
+
+        def _stored_messages_in_storage() -> list[str]:
+            return [event.message for event in instance.all_logs(run.run_id)]
+
+        for i in range(3):
+            instance.report_engine_event(f"engine event {i}", run)
+        # buffered until the batch size is reached
+        assert _stored_messages_in_storage() == []
+        assert stored_messages == []
+
+        for i in range(3, 6):
+            instance.report_engine_event(f"engine event {i}", run)
+        assert _stored_messages_in_storage() == [f"engine event {i}" for i in range(5)]
+        assert stored_messages == [f"engine event {i}" for i in range(5)]
+
+        # run status events are stored synchronously, after the events buffered before them
+        instance.report_run_canceling(run, message="canceling")
+        assert _stored_messages_in_storage() == [
+            *[f"engine event {i}" for i in range(6)],
+            "canceling",
+        ]
+        assert check.not_none(instance.get_run_by_id(run.run_id)).status == (
+            dg.DagsterRunStatus.CANCELING
+        )
+
+        instance.report_engine_event("last engine event", run)
+        assert _stored_messages_in_storage()[-1] == "canceling"
+
+    # disposing the instance flushes the buffer
+    assert stored_messages[-1] == "last engine event"
+
+
+def test_event_write_behind_background_flush() -> None:
+    with (
+        environ(
+            {
+                "DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE": "1000",
+                "DAGSTER_EVENT_WRITE_BEHIND_INTERVAL_SECONDS": "0.01",
+            }
+        ),
+        dg.instance_for_test() as instance,
+    ):
+        run = create_run_for_test(instance, job_name="foo_job")
+        instance.report_engine_event("engine event", run)
+
+        start = time.time()
+        while not instance.all_logs(run.run_id):
+            assert time.time() - start < 30, "Timed out waiting for the buffer to be flushed"
+            time.sleep(0.01)
+
+
+def test_event_write_behind_buffer_garbage_collected() -> None:
+    stored_events = []
+    buffer = EventWriteBehindBuffer(
+        store_events=stored_events.extend,
+        on_events_stored=lambda _: None,
+        max_batch_size=1000,
+        flush_interval_seconds=0.01,
+    )
+    buffer.append(MagicMock())
+    assert buffer in write_behind._live_buffers  # noqa: SLF001
+    buffer_ref = weakref.ref(buffer)
+    flush_thread = check.not_none(buffer._flush_thread)  # noqa: SLF001
+
+    # neither the flush thread nor the exit hook keeps a buffer that is never disposed alive
+    del buffer
+    gc.collect()
+    assert buffer_ref() is None
+    flush_thread.join(timeout=30)
+    assert not flush_thread.is_alive()
@@ -5,6 +5,7 @@
 from unittest import mock
 
 import dagster as dg
+import dagster._check as check
 import pytest
 from dagster import AssetSelection, DagsterEventType, DagsterInstance
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
@@ -462,3 +463,78 @@ def test_non_volatile_data_time(timeline):
                 times_by_key=times_by_key,
                 evaluation_time=get_current_datetime(),
             )
+
+
+def test_prefetch_latest_materialization_or_observation_records():
+    with DagsterInstance.ephemeral() as instance:
+        observe_sources("sA", "sB")(instance=instance, times_by_key=defaultdict(list))
+        run_assets("A", "B")(instance=instance)
+        observe_sources("sA")(instance=instance, times_by_key=defaultdict(list))
+
+        asset_partitions = [
+            AssetKeyPartitionKey(key) for key in versioned_repo.asset_graph.get_all_asset_keys()
+        ]
+        prefetched_queryer = _get_instance_queryer(instance, versioned_repo.asset_graph)
+        prefetched_queryer.prefetch_latest_materialization_or_observation_records(asset_partitions)
+        # prefetched records are read without issuing any per-asset queries
+        with mock.patch.object(
+            instance, "fetch_observations", side_effect=Exception("should be prefetched")
+        ):
+            prefetched_records = {
+                asset_partition: prefetched_queryer.get_latest_materialization_or_observation_record(
+                    asset_partition
+                )
+                for asset_partition in asset_partitions
+            }
+
+        queryer = _get_instance_queryer(instance, versioned_repo.asset_graph)
+        for asset_partition, prefetched_record in prefetched_records.items():
+            record = queryer.get_latest_materialization_or_observation_record(asset_partition)
+            assert (prefetched_record and prefetched_record.storage_id) == (
+                record and record.storage_id
+            )
+
+
+def test_prefetch_latest_storage_ids_by_partition():
+    partitions_def = dg.StaticPartitionsDefinition(["a", "b"])
+
+    @dg.asset(partitions_def=partitions_def)
+    def partitioned(): ...
+
+    @dg.asset(partitions_def=partitions_def)
+    def other_partitioned(): ...
+
+    asset_graph = AssetGraph.from_assets([partitioned, other_partitioned])
+    with DagsterInstance.ephemeral() as instance:
+        for partition_key in ["a", "b"]:
+            dg.materialize([partitioned], instance=instance, partition_key=partition_key)
+        dg.materialize([other_partitioned], instance=instance, partition_key="a")
+
+        queryer = _get_instance_queryer(instance, asset_graph)
+        queryer.prefetch_latest_materialization_or_observation_records(
+            [AssetKeyPartitionKey(partitioned.key), AssetKeyPartitionKey(other_partitioned.key)]
+        )
+        # the latest storage id of each partition is prefetched in bulk, so partition-level
+        # lookups do not query storage per asset
+        with mock.patch.object(
+            instance,
+            "get_latest_storage_id_by_partition",
+            side_effect=Exception("should be prefetched"),
+        ):
+            storage_ids = {
+                asset_partition: queryer.get_latest_materialization_or_observation_storage_id(
+                    asset_partition
+                )
+                for asset_partition in [
+                    AssetKeyPartitionKey(partitioned.key, "a"),
+                    AssetKeyPartitionKey(partitioned.key, "b"),
+                    AssetKeyPartitionKey(other_partitioned.key, "a"),
+                    AssetKeyPartitionKey(other_partitioned.key, "b"),
+                ]
+            }
+
+        for asset_partition, storage_id in storage_ids.items():
+            assert storage_id == instance.get_latest_storage_id_by_partition(
+                asset_partition.asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            ).get(check.not_none(asset_partition.partition_key))
+        assert storage_ids[AssetKeyPartitionKey(other_partitioned.key, "b")] is None
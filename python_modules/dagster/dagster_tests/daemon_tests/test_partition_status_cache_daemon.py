@@ -0,0 +1,254 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from unittest import mock
+
+import dagster as dg
+import dagster._daemon.partition_status_cache as partition_status_cache_daemon
+import pytest
+from dagster import AssetKey, DagsterInstance
+from dagster._core.storage.partition_status_cache import (
+    AssetStatusCacheValue,
+    get_and_update_asset_status_cache_value,
+    set_partition_status_cache_updated_timestamp,
+)
+from dagster._core.test_utils import create_test_daemon_workspace_context
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.partition_status_cache import PartitionStatusCacheDaemon
+
+from dagster_tests.freshness_tests.utils import create_target_from_fn_and_local_scope
+
+partitions_def = dg.DailyPartitionsDefinition(start_date="2020-01-01")
+
+
+def create_defs() -> dg.Definitions:
+    import dagster as dg
+
+    @dg.asset(partitions_def=dg.DailyPartitionsDefinition(start_date="2020-01-01"))
+    def daily(): ...
+
+    @dg.asset
+    def unpartitioned(): ...
+
+    defs = dg.Definitions(assets=[daily, unpartitioned])
+
+    return defs
+
+
+@contextmanager
+def setup_remote_repo(
+    instance: DagsterInstance, fn: Callable
+) -> Iterator[IWorkspaceProcessContext]:
+    with create_target_from_fn_and_local_scope("foo", fn) as target:
+        with create_test_daemon_workspace_context(
+            workspace_load_target=target,
+            instance=instance,
+        ) as workspace_context:
+            yield workspace_context
+
+
+@pytest.fixture
+def instance() -> Iterator[DagsterInstance]:
+    with dg.instance_for_test(overrides={"partition_status_cache": {"enabled": True}}) as instance:
+        yield instance
+
+
+def run_iter(daemon: PartitionStatusCacheDaemon, context: IWorkspaceProcessContext) -> None:
+    list(daemon.run_iteration(context))
+
+
+def report_materialization(instance: DagsterInstance, partition: str) -> None:
+    instance.report_runless_asset_event(
+        dg.AssetMaterialization(asset_key="daily", partition=partition)
+    )
+
+
+def get_stored_cache_value(instance: DagsterInstance) -> AssetStatusCacheValue | None:
+    asset_record = next(iter(instance.get_asset_records([AssetKey("daily")])), None)
+    return asset_record.asset_entry.cached_status if asset_record else None
+
+
+def get_materialized_keys(instance: DagsterInstance) -> set[str]:
+    cache_value = get_stored_cache_value(instance)
+    assert cache_value
+    return set(
+        cache_value.deserialize_materialized_partition_subsets(partitions_def).get_partition_keys()
+    )
+
+
+def test_required_daemon_types(instance: DagsterInstance) -> None:
+    assert PartitionStatusCacheDaemon.daemon_type() in instance.get_required_daemon_types()
+    with dg.instance_for_test() as default_instance:
+        assert not default_instance.partition_status_cache_daemon_enabled
+        assert (
+            PartitionStatusCacheDaemon.daemon_type()
+            not in default_instance.get_required_daemon_types()
+        )
+
+
+def test_partition_status_cache_daemon(instance: DagsterInstance) -> None:
+    daemon = PartitionStatusCacheDaemon()
+    report_materialization(instance, "2020-01-01")
+
+    with setup_remote_repo(instance, create_defs) as workspace_context:
+        # the first iteration brings the existing cache values up to date
+        run_iter(daemon, workspace_context)
+        assert get_materialized_keys(instance) == {"2020-01-01"}
+
+        report_materialization(instance, "2020-01-02")
+        # reads use the stored value as-is, so new events are not visible until the daemon runs
+        stale_value = get_and_update_asset_status_cache_value(
+            instance, AssetKey("daily"), partitions_def
+        )
+        assert stale_value == get_stored_cache_value(instance)
+        assert get_materialized_keys(instance) == {"2020-01-01"}
+
+        run_iter(daemon, workspace_context)
+        assert get_materialized_keys(instance) == {"2020-01-01", "2020-01-02"}
+
+        @dg.asset(partitions_def=partitions_def)
+        def daily():
+            raise Exception("failed")
+
+        result = dg.materialize(
+            [daily], instance=instance, partition_key="2020-01-03", raise_on_error=False
+        )
+        assert not result.success
+
+        run_iter(daemon, workspace_context)
+        cache_value = get_stored_cache_value(instance)
+        assert cache_value
+        assert cache_value.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == ["2020-01-03"]
+        assert not cache_value.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys()
+
+        # a fetch limit smaller than the number of new events spreads them over iterations, and
+        # is reported as lag
+        lags = []
+
+        class InstrumentedDaemon(PartitionStatusCacheDaemon):
+            def instrument_lag(self, lag_seconds: float, num_events: int) -> None:
+                lags.append((lag_seconds, num_events))
+
+        daemon = InstrumentedDaemon(event_log_fetch_limit=1)
+        report_materialization(instance, "2020-01-04")
+        report_materialization(instance, "2020-01-05")
+        run_iter(daemon, workspace_context)
+        assert get_materialized_keys(instance) == {
+            "2020-01-01",
+            "2020-01-02",
+            "2020-01-04",
+            "2020-01-05",
+        }
+        run_iter(daemon, workspace_context)
+        run_iter(daemon, workspace_context)
+        assert [num_events for _, num_events in lags] == [1, 1, 0]
+        assert lags[0][0] > 0
+        assert lags[2][0] == 0
+
+
+def test_partition_status_cache_read_when_daemon_behind(instance: DagsterInstance) -> None:
+    daemon = PartitionStatusCacheDaemon()
+    report_materialization(instance, "2020-01-01")
+
+    with setup_remote_repo(instance, create_defs) as workspace_context:
+        run_iter(daemon, workspace_context)
+        report_materialization(instance, "2020-01-02")
+
+        # the daemon is current, so reads use the stored value as-is
+        get_and_update_asset_status_cache_value(instance, AssetKey("daily"), partitions_def)
+        assert get_materialized_keys(instance) == {"2020-01-01"}
+
+        # once the daemon falls behind by more than the max staleness, reads bring the stored
+        # value up to date themselves
+        set_partition_status_cache_updated_timestamp(instance, time.time() - 3600)
+        cache_value = get_and_update_asset_status_cache_value(
+            instance, AssetKey("daily"), partitions_def
+        )
+        assert cache_value == get_stored_cache_value(instance)
+        assert get_materialized_keys(instance) == {"2020-01-01", "2020-01-02"}
+
+        # the daemon records its progress again on its next iteration
+        report_materialization(instance, "2020-01-03")
+        run_iter(daemon, workspace_context)
+        report_materialization(instance, "2020-01-04")
+        get_and_update_asset_status_cache_value(instance, AssetKey("daily"), partitions_def)
+        assert get_materialized_keys(instance) == {"2020-01-01", "2020-01-02", "2020-01-03"}
+
+
+def create_multi_asset_defs() -> dg.Definitions:
+    import dagster as dg
+
+    partitions_def = dg.DailyPartitionsDefinition(start_date="2020-01-01")
+
+    @dg.asset(partitions_def=partitions_def)
+    def daily_a(): ...
+
+    @dg.asset(partitions_def=partitions_def)
+    def daily_b(): ...
+
+    @dg.asset(partitions_def=partitions_def)
+    def daily_c(): ...
+
+    return dg.Definitions(assets=[daily_a, daily_b, daily_c])
+
+
+def test_partition_status_cache_daemon_rebuild_in_chunks(instance: DagsterInstance) -> None:
+    asset_keys = [AssetKey("daily_a"), AssetKey("daily_b"), AssetKey("daily_c")]
+    for asset_key in asset_keys:
+        instance.report_runless_asset_event(
+            dg.AssetMaterialization(asset_key=asset_key, partition="2020-01-01")
+        )
+
+    def _get_cached_keys() -> set[AssetKey]:
+        return {
+            record.asset_entry.asset_key
+            for record in instance.get_asset_records(asset_keys)
+            if record.asset_entry.cached_status
+        }
+
+    with setup_remote_repo(instance, create_multi_asset_defs) as workspace_context:
+        daemon = PartitionStatusCacheDaemon(rebuild_chunk_size=1)
+
+        # the rebuild yields between chunks, so it can be interrupted after the first chunk
+        iteration = daemon.run_iteration(workspace_context)
+        next(iteration)
+        next(iteration)
+        iteration.close()
+        assert _get_cached_keys() == {AssetKey("daily_a")}
+
+        # the next iteration resumes the rebuild from the persisted progress
+        updated_keys = []
+        update_asset_status_cache_values = (
+            partition_status_cache_daemon.update_asset_status_cache_values
+        )
+
+        def _update_asset_status_cache_values(instance, partitions_defs_by_key, **kwargs):
+            updated_keys.extend(partitions_defs_by_key.keys())
+            return update_asset_status_cache_values(instance, partitions_defs_by_key, **kwargs)
+
+        with mock.patch.object(
+            partition_status_cache_daemon,
+            "update_asset_status_cache_values",
+            _update_asset_status_cache_values,
+        ):
+            run_iter(daemon, workspace_context)
+        assert updated_keys == [AssetKey("daily_b"), AssetKey("daily_c")]
+        assert _get_cached_keys() == set(asset_keys)
+
+        # once rebuilt, new events are tailed from the event log
+        instance.report_runless_asset_event(
+            dg.AssetMaterialization(asset_key="daily_b", partition="2020-01-02")
+        )
+        run_iter(daemon, workspace_context)
+        asset_record = next(iter(instance.get_asset_records([AssetKey("daily_b")])))
+        cache_value = asset_record.asset_entry.cached_status
+        assert cache_value
+        assert set(
+            cache_value.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2020-01-01", "2020-01-02"}
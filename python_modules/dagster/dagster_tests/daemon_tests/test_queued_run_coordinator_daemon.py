@@ -350,6 +350,89 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
 
         assert self.get_run_ids(instance.run_launcher.queue()) == [bad_pri_run_id]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(
+                max_concurrent_runs=2,
+                tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+            ),
+        ],
+    )
+    def test_queue_updated_between_iterations(
+        self, instance, workspace_context, job_handle, daemon
+    ):
+        asset_graph = workspace_context.create_request_context().asset_graph
+        run_id_1, run_id_2, tiny_run_id, tiny_run_id_2, canceled_run_id, hi_pri_run_id = [
+            make_new_run_id() for _ in range(6)
+        ]
+        self.create_queued_run(instance, job_handle, run_id=run_id_1, asset_graph=asset_graph)
+        self.create_queued_run(instance, job_handle, run_id=run_id_2, asset_graph=asset_graph)
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_2]
+
+        # runs enqueued and canceled after the queue was first read
+        for run_id in [tiny_run_id, tiny_run_id_2]:
+            self.create_queued_run(
+                instance,
+                job_handle,
+                run_id=run_id,
+                tags={"database": "tiny"},
+                asset_graph=asset_graph,
+            )
+        canceled_run = self.create_queued_run(
+            instance,
+            job_handle,
+            run_id=canceled_run_id,
+            tags={PRIORITY_TAG: "5"},
+            asset_graph=asset_graph,
+        )
+        instance.report_run_canceled(canceled_run)
+        self.create_queued_run(
+            instance,
+            job_handle,
+            run_id=hi_pri_run_id,
+            tags={PRIORITY_TAG: "3"},
+            asset_graph=asset_graph,
+        )
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [run_id_1, run_id_2]
+
+        for run_id in [run_id_1, run_id_2]:
+            instance.report_run_canceled(instance.get_run_by_id(run_id))
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            run_id_1,
+            run_id_2,
+            hi_pri_run_id,
+            tiny_run_id,
+        ]
+
+        instance.report_run_canceled(instance.get_run_by_id(hi_pri_run_id))
+
+        list(daemon.run_iteration(workspace_context))
+        # tiny_run_id_2 is still blocked by the tag limit
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            run_id_1,
+            run_id_2,
+            hi_pri_run_id,
+            tiny_run_id,
+        ]
+
+        instance.report_run_canceled(instance.get_run_by_id(tiny_run_id))
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            run_id_1,
+            run_id_2,
+            hi_pri_run_id,
+            tiny_run_id,
+            tiny_run_id_2,
+        ]
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
@@ -0,0 +1,69 @@
+import asyncio
+from unittest import mock
+
+import dagster as dg
+from dagster import AutomationCondition
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+
+condition = AutomationCondition.eager()
+
+
+@dg.asset(automation_condition=condition)
+def slow_root() -> None: ...
+
+
+@dg.asset(deps=[slow_root], automation_condition=condition)
+def slow_child() -> None: ...
+
+
+@dg.asset(automation_condition=condition)
+def fast_root() -> None: ...
+
+
+@dg.asset(deps=[fast_root], automation_condition=condition)
+def fast_child() -> None: ...
+
+
+# not evaluated, so fast_grandchild must wait on fast_child through it
+@dg.asset(deps=[fast_child])
+def unconditioned() -> None: ...
+
+
+@dg.asset(deps=[unconditioned], automation_condition=condition)
+def fast_grandchild() -> None: ...
+
+
+defs = dg.Definitions(
+    assets=[slow_root, slow_child, fast_root, fast_child, unconditioned, fast_grandchild]
+)
+
+
+def test_entities_do_not_wait_for_unrelated_entities() -> None:
+    events = []
+    evaluate_entity = AutomationConditionEvaluator.evaluate_entity
+
+    async def _evaluate_entity(self, key):
+        events.append(("start", key.to_user_string()))
+        if key == slow_root.key:
+            # yield until every other entity that does not depend on slow_root is evaluated
+            while ("end", fast_grandchild.key.to_user_string()) not in events:
+                await asyncio.sleep(0)
+        await evaluate_entity(self, key)
+        events.append(("end", key.to_user_string()))
+
+    with mock.patch.object(AutomationConditionEvaluator, "evaluate_entity", _evaluate_entity):
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=dg.DagsterInstance.ephemeral()
+        )
+
+    # results are returned in topological order
+    result_keys = [r.key for r in result.results]
+    assert len(result_keys) == 5
+    assert result_keys.index(slow_root.key) < result_keys.index(slow_child.key)
+    assert result_keys.index(fast_child.key) < result_keys.index(fast_grandchild.key)
+
+    assert events.index(("end", "fast_child")) < events.index(("start", "fast_grandchild"))
+    assert events.index(("end", "fast_grandchild")) < events.index(("end", "slow_root"))
+    assert events.index(("end", "slow_root")) < events.index(("start", "slow_child"))
@@ -0,0 +1,118 @@
+import datetime
+
+import dagster as dg
+from dagster import AutomationCondition
+from dagster._core.definitions.declarative_automation.incremental_evaluation import (
+    AUTOMATION_INCREMENTAL_EVALUATION_ENV_VAR,
+)
+from dagster._core.test_utils import environ
+
+
+@dg.asset
+def root() -> None: ...
+
+
+@dg.asset(deps=[root], automation_condition=AutomationCondition.eager())
+def eager_child() -> None: ...
+
+
+@dg.asset(
+    deps=[eager_child],
+    automation_condition=AutomationCondition.on_cron("0 * * * *"),
+)
+def cron_grandchild() -> None: ...
+
+
+@dg.asset(
+    partitions_def=dg.StaticPartitionsDefinition(["a", "b"]),
+    automation_condition=AutomationCondition.on_missing(),
+)
+def unrelated() -> None: ...
+
+
+defs = dg.Definitions(assets=[root, eager_child, cron_grandchild, unrelated])
+
+
+def _run_ticks(incremental: bool) -> list[tuple[int, int]]:
+    """Runs the same sequence of ticks and events, returning the number of evaluated entities and
+    the number of requested entity partitions on each tick.
+    """
+    instance = dg.DagsterInstance.ephemeral()
+    current_time = datetime.datetime(2024, 1, 1, 0, 5)
+    cursor = None
+    ticks = []
+
+    def _tick() -> None:
+        nonlocal cursor, current_time
+        with environ({AUTOMATION_INCREMENTAL_EVALUATION_ENV_VAR: "1" if incremental else "0"}):
+            result = dg.evaluate_automation_conditions(
+                defs=defs, instance=instance, cursor=cursor, evaluation_time=current_time
+            )
+        cursor = result.cursor
+        current_time += datetime.timedelta(minutes=10)
+        ticks.append((len(result.results), result.total_requested))
+
+    _tick()
+    _tick()
+    _tick()
+
+    # an upstream update causes eager_child to be requested
+    instance.report_runless_asset_event(dg.AssetMaterialization("root"))
+    _tick()
+    _tick()
+    _tick()
+
+    # the hourly cron tick is crossed, and cron_grandchild is requested once its dep is updated
+    current_time = datetime.datetime(2024, 1, 1, 1, 5)
+    _tick()
+    instance.report_runless_asset_event(dg.AssetMaterialization("eager_child"))
+    _tick()
+    instance.report_runless_asset_event(dg.AssetMaterialization("cron_grandchild"))
+    _tick()
+    _tick()
+    _tick()
+    _tick()
+    return ticks
+
+
+def test_incremental_evaluation_matches_full_evaluation() -> None:
+    full_ticks = _run_ticks(incremental=False)
+    incremental_ticks = _run_ticks(incremental=True)
+
+    # the same entities are requested on every tick
+    assert [num_requested for _, num_requested in incremental_ticks] == [
+        num_requested for _, num_requested in full_ticks
+    ]
+    assert [num_requested for _, num_requested in full_ticks] == [
+        0,
+        0,
+        0,
+        1,
+        0,
+        0,
+        0,
+        1,
+        0,
+        0,
+        0,
+        0,
+    ]
+
+    # every entity is evaluated on every tick without incremental evaluation
+    assert all(num_evaluated == 3 for num_evaluated, _ in full_ticks)
+    # with incremental evaluation, an entity is skipped once its previous evaluation is a fixed
+    # point, until an event, a request, or a cron tick affects it
+    assert [num_evaluated for num_evaluated, _ in incremental_ticks] == [
+        3,
+        3,
+        3,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        1,
+        0,
+    ]
@@ -2216,6 +2216,116 @@ def test_asset_subset_or(a, b, result) -> None:
     )
 
 
+@pytest.mark.parametrize("seed", range(5))
+def test_time_window_subset_set_operations_match_partition_key_sets(seed: int) -> None:
+    partitions_def = dg.HourlyPartitionsDefinition("2020-01-01-00:00", end_offset=0)
+    with partition_loading_context(effective_dt=create_datetime(2020, 3, 1)):
+        all_keys = partitions_def.get_partition_keys()
+        rand = random.Random(seed)
+        a_keys = set(rand.sample(all_keys, 500))
+        b_keys = set(rand.sample(all_keys, 500))
+        # contiguous runs of keys, so that the subsets contain multi-partition windows
+        start = rand.randrange(len(all_keys) - 200)
+        a_keys.update(all_keys[start : start + 200])
+        b_keys.update(all_keys[start + 100 : start + 300])
+
+        a = partitions_def.empty_subset().with_partition_keys(a_keys)
+        b = partitions_def.empty_subset().with_partition_keys(b_keys)
+        assert len(a) == len(a_keys)
+        assert set(a.get_partition_keys()) == a_keys
+
+        for subset, expected_keys in [
+            (a & b, a_keys & b_keys),
+            (a | b, a_keys | b_keys),
+            (a - b, a_keys - b_keys),
+            (b - a, b_keys - a_keys),
+        ]:
+            assert set(subset.get_partition_keys()) == expected_keys
+            assert len(subset) == len(expected_keys)
+            assert all(key in subset for key in rand.sample(sorted(expected_keys), 20))
+            round_tripped = partitions_def.deserialize_subset(subset.serialize())
+            assert round_tripped == subset
+
+        # adding keys that are already in the subset does not change it
+        assert a.with_partition_keys(list(a_keys)[:50]) == a
+        assert len(a.with_partition_keys(list(a_keys)[:50] + list(b_keys))) == len(a_keys | b_keys)
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        dg.HourlyPartitionsDefinition("2020-01-01-00:00", end_date="2020-12-01-00:00"),
+        dg.HourlyPartitionsDefinition(
+            "2020-01-01-00:00", timezone="America/New_York", end_date="2020-12-01-00:00"
+        ),
+        dg.DailyPartitionsDefinition("2019-01-01", timezone="US/Pacific", end_date="2021-01-01"),
+        # midnight is skipped by DST transitions in Sao Paulo before 2019
+        dg.DailyPartitionsDefinition("2015-01-01", timezone="America/Sao_Paulo", end_offset=1),
+        dg.TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *",
+            start="2020-03-01-00:00",
+            end="2020-04-15-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            timezone="Europe/Berlin",
+        ),
+        dg.TimeWindowPartitionsDefinition(
+            cron_schedule="0 0 * * *",
+            start="2020-01-01",
+            end="2020-06-01",
+            fmt=DATE_FORMAT,
+            exclusions=[
+                TimestampWithTimezone(create_datetime(2020, 1, 5).timestamp(), "UTC"),
+                TimestampWithTimezone(create_datetime(2020, 2, 10).timestamp(), "UTC"),
+                # not a tick
+                TimestampWithTimezone(create_datetime(2020, 2, 11, 5).timestamp(), "UTC"),
+            ],
+        ),
+    ],
+)
+def test_closed_form_partition_key_lookups_match_iteration(
+    partitions_def: TimeWindowPartitionsDefinition,
+) -> None:
+    def iterative_partitions_def() -> TimeWindowPartitionsDefinition:
+        pd = copy(partitions_def)
+        pd.__dict__["_closed_form_tick_index"] = None
+        return pd
+
+    with partition_loading_context(effective_dt=create_datetime(2021, 1, 1)):
+        assert partitions_def._closed_form_tick_index is not None  # noqa: SLF001
+        keys = iterative_partitions_def().get_partition_keys()
+        num_partitions = len(keys)
+        for start_idx, end_idx in [(0, 10), (50, 53), (num_partitions - 5, num_partitions + 5)]:
+            assert (
+                partitions_def.get_partition_keys_between_indexes(start_idx, end_idx)
+                == keys[start_idx:end_idx]
+            )
+
+        rand = random.Random(0)
+        sample = rand.sample(keys, 100)
+        unknown_keys = ["2020-01-05", "2020-02-11", "2020-01-01-00:07", "1999-01-01", "junk"]
+        assert [partitions_def.has_partition_key(key) for key in sample + unknown_keys] == [
+            iterative_partitions_def().has_partition_key(key) for key in sample + unknown_keys
+        ]
+        assert [partitions_def.time_window_for_partition_key(key) for key in sample] == [
+            iterative_partitions_def().time_window_for_partition_key(key) for key in sample
+        ]
+        assert partitions_def.time_windows_for_partition_keys(
+            frozenset(sample)
+        ) == iterative_partitions_def().time_windows_for_partition_keys(frozenset(sample))
+
+
+def test_closed_form_partition_key_lookups_unsupported() -> None:
+    for partitions_def in [
+        # 30 minute DST shift
+        dg.HourlyPartitionsDefinition("2020-01-01-00:00", timezone="Australia/Lord_Howe"),
+        dg.WeeklyPartitionsDefinition("2020-01-01"),
+        dg.TimeWindowPartitionsDefinition(
+            cron_schedule="0 0 * * *", start="2020-01-01", fmt=DATE_FORMAT, exclusions=["0 0 * * 6"]
+        ),
+    ]:
+        assert partitions_def._closed_form_tick_index is None  # noqa: SLF001
+
+
 def test_persisted_time_window_serdes():
     serialized_time_window = '{"__class__": "TimeWindow", "end": {"__class__": "TimestampWithTimezone", "timestamp": 1717680319.16809, "timezone": "America/Chicago"}, "start": {"__class__": "TimestampWithTimezone", "timestamp": 1717593919.168011, "timezone": "America/Chicago"}}'
     deserialized_time_window = dg.deserialize_value(serialized_time_window, PersistedTimeWindow)
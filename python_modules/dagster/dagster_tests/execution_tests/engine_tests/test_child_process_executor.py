@@ -11,6 +11,8 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -48,6 +50,26 @@ def execute(self):
         segfault()
 
 
+class PidWorkerCommand(ChildProcessWorkerCommand):
+    def execute_with_term_event(self, term_event):
+        yield os.getpid()
+
+
+class CrashyWorkerCommand(ChildProcessWorkerCommand):
+    def execute_with_term_event(self, term_event):
+        os._exit(1)
+
+
+class WaitForTermEventWorkerCommand(ChildProcessWorkerCommand):
+    def execute_with_term_event(self, term_event):
+        yield term_event.wait(timeout=5)
+
+
+class IsTermEventSetWorkerCommand(ChildProcessWorkerCommand):
+    def execute_with_term_event(self, term_event):
+        yield term_event.is_set()
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -115,6 +137,64 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def _execute_in_pool(pool, command):
+    worker = pool.acquire()
+    try:
+        return [
+            event
+            for event in worker.execute(command)
+            if event is not None and not isinstance(event, ChildProcessEvent)
+        ]
+    finally:
+        pool.release(worker)
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing_ctx) as pool:
+        pids = [_execute_in_pool(pool, PidWorkerCommand())[0] for _ in range(3)]
+    assert len(set(pids)) == 1
+    assert pids[0] != os.getpid()
+
+
+def test_worker_pool_recycles_workers():
+    with ChildProcessWorkerPool(multiprocessing_ctx, max_commands_per_worker=2) as pool:
+        pids = [_execute_in_pool(pool, PidWorkerCommand())[0] for _ in range(4)]
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+
+
+@pytest.mark.skipif(IS_PYTHON_3_14, reason="multiprocessing crash handling differs on 3.14")
+def test_worker_pool_crashy_command():
+    with ChildProcessWorkerPool(multiprocessing_ctx) as pool:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _execute_in_pool(pool, CrashyWorkerCommand())
+        assert exc.value.exit_code == 1
+
+        # the crashed worker is replaced
+        assert _execute_in_pool(pool, PidWorkerCommand())[0] != exc.value.pid
+
+
+def test_worker_term_event():
+    with ChildProcessWorkerPool(multiprocessing_ctx) as pool:
+        worker = pool.acquire()
+        try:
+            # an interrupt sent as soon as the command is dispatched reaches the command
+            events = worker.execute(WaitForTermEventWorkerCommand())
+            next(events)
+            worker.term_event.set()
+            assert [
+                event
+                for event in events
+                if event is not None and not isinstance(event, ChildProcessEvent)
+            ] == [True]
+        finally:
+            pool.release(worker)
+
+        # the interrupt does not carry over to the next command executed by the worker
+        assert _execute_in_pool(pool, IsTermEventSetWorkerCommand()) == [False]
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing_ctx, LongRunningCommand()))
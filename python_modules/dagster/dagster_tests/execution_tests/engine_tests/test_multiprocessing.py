@@ -90,6 +90,54 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def test_worker_pool_execution():
+    with dg.instance_for_test() as instance:
+        recon_job = dg.reconstructable(define_diamond_job)
+        with dg.execute_job(
+            recon_job,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 1, "worker_pool": {}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"].value  # ty: ignore[unresolved-attribute]
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(worker_pids) == 1
+
+
+def test_worker_pool_max_steps_per_worker():
+    with dg.instance_for_test() as instance:
+        recon_job = dg.reconstructable(define_diamond_job)
+        with dg.execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 1},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"].value  # ty: ignore[unresolved-attribute]
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            assert len(worker_pids) == 4
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -422,6 +470,21 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"  # ty: ignore[unresolved-attribute]
+
+
 # segfault test
 @dg.op
 def segfault_op(context):
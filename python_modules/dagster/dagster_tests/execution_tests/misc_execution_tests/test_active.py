@@ -443,3 +443,56 @@ def test_active_concurrency_changing_default(use_tags):
                             event_specific_data=StepSuccessData(duration_ms=1.0),
                         )
                     )
+
+
+def test_active_execution_priority_order():
+    @dg.op(tags={"dagster/priority": "1"})
+    def low():
+        return 1
+
+    @dg.op(tags={"dagster/priority": "3"})
+    def high():
+        return 1
+
+    @dg.op(tags={"dagster/priority": "2"})
+    def downstream(x):
+        return x
+
+    @dg.job
+    def priority_job():
+        downstream(low())
+        high()
+
+    def _succeed(active_execution, step_key):
+        active_execution.handle_event(
+            dg.DagsterEvent(
+                DagsterEventType.STEP_OUTPUT.value,
+                job_name=priority_job.name,
+                event_specific_data=StepOutputData(
+                    StepOutputHandle(step_key=step_key, output_name="result")
+                ),
+                step_key=step_key,
+            )
+        )
+        active_execution.handle_event(
+            dg.DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                job_name=priority_job.name,
+                event_specific_data=StepSuccessData(duration_ms=1.0),
+                step_key=step_key,
+            )
+        )
+
+    with create_execution_plan(priority_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute(limit=1)] == ["high"]
+        assert [step.key for step in active_execution.get_steps_to_execute(limit=1)] == ["low"]
+        assert not active_execution.get_steps_to_execute()
+
+        # downstream only becomes executable once its upstream step has resolved
+        _succeed(active_execution, "low")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["downstream"]
+
+        _succeed(active_execution, "high")
+        _succeed(active_execution, "downstream")
+        assert not active_execution.get_steps_to_execute()
+        assert active_execution.is_complete
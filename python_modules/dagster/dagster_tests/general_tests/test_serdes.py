@@ -1249,3 +1249,61 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compiled_unpack_matches_field_loop() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"})
+    class Foo(NamedTuple("_Foo", [("color", str), ("size", int)])):
+        def __new__(cls, color: str, size: int = 1):
+            return super().__new__(cls, color, size)
+
+    serializer = test_env.object_serializers["Foo"]
+    for unpacked_dict in [
+        {"__class__": "Foo", "colour": "red", "size": 2},
+        # values stored under the loaded field name are also accepted
+        {"__class__": "Foo", "color": "red", "size": 2},
+        # unknown keys are ignored and missing params fall back to their defaults
+        {"__class__": "Foo", "colour": "red", "shape": "square"},
+    ]:
+        context = UnpackContext()
+        compiled = serializer._compiled_unpack(dict(unpacked_dict), test_env, context)  # noqa: SLF001
+        generic = serializer._unpack_fields(dict(unpacked_dict), test_env, context)  # noqa: SLF001
+        assert compiled == generic
+        assert dg.deserialize_value(json.dumps(unpacked_dict), whitelist_map=test_env) == generic
+
+
+def test_compiled_unpack_event_log_entry() -> None:
+    from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+    from dagster._core.events.log import EventLogEntry
+    from dagster_shared.serdes.serdes import _WHITELIST_MAP
+
+    entry = EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id="run_id",
+        timestamp=1.0,
+        step_key="step",
+        job_name="job",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "job",
+            event_specific_data=StepMaterializationData(
+                dg.AssetMaterialization(asset_key="asset", metadata={"rows": 1})
+            ),
+            step_key="step",
+        ),
+    )
+    # the EventLogEntry fields as they are passed to its serializer during deserialization, i.e.
+    # with nested objects already unpacked
+    unpacked_dict = {
+        **json.loads(dg.serialize_value(entry)),
+        "dagster_event": entry.dagster_event,
+    }
+    serializer = _WHITELIST_MAP.object_serializers["EventLogEntry"]
+
+    compiled = serializer._compiled_unpack(dict(unpacked_dict), _WHITELIST_MAP, UnpackContext())  # noqa: SLF001
+    generic = serializer._unpack_fields(dict(unpacked_dict), _WHITELIST_MAP, UnpackContext())  # noqa: SLF001
+    assert compiled == generic == entry
@@ -0,0 +1,125 @@
+from enum import Enum
+from typing import NamedTuple
+
+import dagster as dg
+import pytest
+from dagster._core.definitions.events import AssetKey
+from dagster._core.events.log import EventLogEntry
+from dagster_shared.serdes.binary import (
+    BINARY_SERDES_FORMAT_VERSION,
+    BINARY_SERDES_MAGIC,
+    deserialize_value_from_bytes,
+    is_binary_serdes_payload,
+    serialize_value_to_bytes,
+)
+from dagster_shared.serdes.errors import DeserializationError, SerializationError
+from dagster_shared.serdes.serdes import WhitelistMap, _whitelist_for_serdes
+
+pytest.importorskip("msgpack")
+
+test_map = WhitelistMap.create()
+
+
+@_whitelist_for_serdes(whitelist_map=test_map)
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@_whitelist_for_serdes(whitelist_map=test_map, storage_field_names={"name": "old_name"})
+class Leaf(NamedTuple):
+    name: str
+    color: Color
+
+
+@_whitelist_for_serdes(whitelist_map=test_map)
+class Tree(NamedTuple):
+    leaves: list[Leaf]
+    tags: frozenset[str]
+    counts: dict[str, float]
+    child: "Tree | None"
+
+
+def _tree() -> Tree:
+    return Tree(
+        leaves=[Leaf("a", Color.RED), Leaf("b", Color.BLUE)],
+        tags=frozenset({"x", "y"}),
+        counts={"one": 1.0, "big": 2.0**60},
+        child=Tree(leaves=[Leaf("c", Color.RED)], tags=frozenset(), counts={}, child=None),
+    )
+
+
+def test_msgpack_round_trip():
+    tree = _tree()
+    data = serialize_value_to_bytes(tree, codec="msgpack", whitelist_map=test_map)
+    assert is_binary_serdes_payload(data)
+    assert data[len(BINARY_SERDES_MAGIC)] == BINARY_SERDES_FORMAT_VERSION
+    assert deserialize_value_from_bytes(data, Tree, whitelist_map=test_map) == tree
+
+
+def test_msgpack_interns_class_names():
+    tree = Tree(
+        leaves=[Leaf(str(i), Color.RED) for i in range(100)],
+        tags=frozenset(),
+        counts={},
+        child=None,
+    )
+    data = serialize_value_to_bytes(tree, codec="msgpack", whitelist_map=test_map)
+    assert data.count(b"Leaf") == 1
+    assert deserialize_value_from_bytes(data, whitelist_map=test_map) == tree
+
+
+def test_msgpack_large_payload():
+    # larger than msgpack's default unpacker buffer size of 100MiB
+    leaf = Leaf("x" * (101 * 1024 * 1024), Color.RED)
+    data = serialize_value_to_bytes(leaf, codec="msgpack", whitelist_map=test_map)
+    assert deserialize_value_from_bytes(data, Leaf, whitelist_map=test_map) == leaf
+
+
+def test_json_codec_is_readable_as_json():
+    tree = _tree()
+    data = serialize_value_to_bytes(tree, whitelist_map=test_map)
+    assert not is_binary_serdes_payload(data)
+    assert data.decode("utf-8") == dg.serialize_value(tree, whitelist_map=test_map)
+
+    # readers accept JSON as bytes or str
+    assert deserialize_value_from_bytes(data, Tree, whitelist_map=test_map) == tree
+    assert deserialize_value_from_bytes(data.decode("utf-8"), Tree, whitelist_map=test_map) == tree
+
+
+def test_dagster_objects_round_trip():
+    entry = EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="hello",
+        run_id="some_run",
+        timestamp=1.0,
+        dagster_event=None,
+    )
+    key = AssetKey(["a", "b"])
+    for value in [entry, key, {"nested": [key, {key}]}]:
+        data = serialize_value_to_bytes(value, codec="msgpack")
+        assert deserialize_value_from_bytes(data) == value
+
+
+def test_newer_format_version():
+    data = bytearray(serialize_value_to_bytes(_tree(), codec="msgpack", whitelist_map=test_map))
+    data[len(BINARY_SERDES_MAGIC)] = BINARY_SERDES_FORMAT_VERSION + 1
+    with pytest.raises(DeserializationError, match="newer version of dagster"):
+        deserialize_value_from_bytes(bytes(data), whitelist_map=test_map)
+
+
+def test_unknown_codec():
+    with pytest.raises(SerializationError, match="Unknown serdes codec"):
+        serialize_value_to_bytes(_tree(), codec="not_a_codec", whitelist_map=test_map)
+
+    data = bytearray(serialize_value_to_bytes(_tree(), codec="msgpack", whitelist_map=test_map))
+    data[len(BINARY_SERDES_MAGIC) + 1] = 255
+    with pytest.raises(DeserializationError, match="unknown codec"):
+        deserialize_value_from_bytes(bytes(data), whitelist_map=test_map)
+
+
+def test_wrong_type():
+    data = serialize_value_to_bytes(_tree(), codec="msgpack", whitelist_map=test_map)
+    with pytest.raises(DeserializationError, match="not expected type"):
+        deserialize_value_from_bytes(data, Leaf, whitelist_map=test_map)
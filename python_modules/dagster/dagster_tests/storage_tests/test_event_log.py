@@ -412,6 +412,9 @@ def _ops():
 
     assert incremental_run_stats == run_stats
 
+    # run stats can be built from a stream of events
+    assert build_run_stats_from_events(result.run_id, iter(events)) == run_stats
+
 
 def test_step_stats():
     @dg.op
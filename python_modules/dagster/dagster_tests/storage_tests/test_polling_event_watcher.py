@@ -1,8 +1,10 @@
 import tempfile
+import threading
 import time
 from collections.abc import Callable, Mapping
 from contextlib import contextmanager
 from typing import Any
+from unittest import mock
 
 import dagster as dg
 import dagster._check as check
@@ -147,3 +149,110 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_multiple_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        other_run_id = make_new_run_id()
+        watched_1 = []
+        watched_2 = []
+
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched_1.append(event))
+        storage.watch(other_run_id, None, lambda event, _cursor: watched_2.append(event))
+
+        # a single polling thread serves every watched run
+        assert storage._watcher  # noqa: SLF001
+        assert len([t for t in threading.enumerate() if t.name == "sql-event-watch"]) == 1
+
+        storage.store_event(create_event(1))
+        storage.store_event(create_event(2, run_id=other_run_id))
+        storage.store_event(create_event(3, run_id=other_run_id))
+
+        attempts = 10
+        while (len(watched_1) < 1 or len(watched_2) < 2) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched_1] == [1]
+        assert [int(evt.message) for evt in watched_2] == [2, 3]
+
+
+def test_watch_survives_failures():
+    with create_sqlite_run_event_logstorage() as storage:
+        other_run_id = make_new_run_id()
+        watched = []
+
+        def failing_callback(_event, _cursor):
+            raise Exception("callback failed")
+
+        storage.watch(RUN_ID, None, failing_callback)
+        storage.watch(other_run_id, None, lambda event, _cursor: watched.append(event))
+
+        # a failing callback for one run does not stop events for the other run
+        storage.store_event(create_event(1))
+        storage.store_event(create_event(2, run_id=other_run_id))
+
+        attempts = 10
+        while len(watched) < 1 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched] == [2]
+
+        # a failing poll is retried on the next poll period
+        get_records_for_runs = storage.get_records_for_runs
+        num_failed_polls = 0
+
+        def _flaky_get_records_for_runs(*args, **kwargs):
+            nonlocal num_failed_polls
+            if num_failed_polls < 2:
+                num_failed_polls += 1
+                raise Exception("poll failed")
+            return get_records_for_runs(*args, **kwargs)
+
+        with mock.patch.object(storage, "get_records_for_runs", _flaky_get_records_for_runs):
+            storage.store_event(create_event(3, run_id=other_run_id))
+
+            attempts = 20
+            while len(watched) < 2 and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+        assert num_failed_polls == 2
+        assert [int(evt.message) for evt in watched] == [2, 3]
+
+
+def test_watch_restarts_poll_thread():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+        received_event = threading.Event()
+
+        def _callback(event, _cursor):
+            watched.append(event)
+            received_event.set()
+
+        storage.watch(RUN_ID, None, _callback)
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+        first_poll_thread = check.not_none(watcher._poll_thread)  # noqa: SLF001
+
+        # simulate the polling thread exiting unexpectedly on its next poll
+        poll = watcher._poll  # noqa: SLF001
+        num_failed_polls = 0
+
+        def _exiting_poll():
+            nonlocal num_failed_polls
+            if num_failed_polls == 0:
+                num_failed_polls += 1
+                raise SystemExit()
+            return poll()
+
+        with mock.patch.object(watcher, "_poll", _exiting_poll):
+            first_poll_thread.join(timeout=10)
+            assert not first_poll_thread.is_alive()
+
+            # a new polling thread keeps delivering events to the runs that are already watched
+            storage.store_event(create_event(1))
+            assert received_event.wait(timeout=10)
+
+        assert num_failed_polls == 1
+        assert watcher._poll_thread is not first_poll_thread  # noqa: SLF001
+        assert [int(evt.message) for evt in watched] == [1]
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 import random
 import re
 import string
@@ -39,6 +40,7 @@
 )
 from dagster._core.definitions.dependency import NodeHandle
 from dagster._core.definitions.events import (
+    AssetKeyPartitionKey,
     AssetMaterializationFailure,
     AssetMaterializationFailureReason,
     AssetMaterializationFailureType,
@@ -47,7 +49,7 @@
 from dagster._core.definitions.partitions.context import partition_loading_context
 from dagster._core.definitions.partitions.snap import PartitionsSnap
 from dagster._core.definitions.partitions.subset import AllPartitionsSubset
-from dagster._core.event_api import EventLogCursor, PartitionKeyFilter
+from dagster._core.event_api import EventLogCursor, PartitionKeyFilter, SerializedEventLogEntry
 from dagster._core.events import (
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     AssetMaterializationPlannedData,
@@ -64,7 +66,7 @@
 from dagster._core.execution.api import execute_run
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.loader import LoadingContextForTest
 from dagster._core.remote_origin import (
@@ -564,6 +566,47 @@ def test_event_log_storage_store_with_multiple_runs(
             for run in runs:
                 instance.delete_run(run)
 
+    def test_store_unindexed_event_batch(
+        self,
+        instance: DagsterInstance,
+        storage: EventLogStorage,
+    ):
+        runs = [make_new_run_id() for _ in range(2)]
+        if instance:
+            for run in runs:
+                create_run_for_test(instance, run_id=run)
+
+        events = [
+            dg.EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message=f"message {i}",
+                run_id=runs[i % 2],
+                timestamp=time.time(),
+                dagster_event=(
+                    dg.DagsterEvent(
+                        DagsterEventType.STEP_SUCCESS.value,
+                        "nonce",
+                        event_specific_data=StepSuccessData(duration_ms=100.0),
+                    )
+                    if i % 3 == 0
+                    else None
+                ),
+            )
+            for i in range(10)
+        ]
+        storage.store_unindexed_event_batch(events)
+
+        for run_index, run_id in enumerate(runs):
+            assert [event.user_message for event in storage.get_logs_for_run(run_id)] == [
+                f"message {i}" for i in range(10) if i % 2 == run_index
+            ]
+        assert storage.get_stats_for_run(runs[0]).steps_succeeded == 2
+
+        if instance:
+            for run in runs:
+                instance.delete_run(run)
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_log_storage_watch(
@@ -1087,6 +1130,66 @@ def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
             stats_two = storage.get_stats_for_run(result_two.run_id)
             assert stats_two.steps_succeeded == 1
 
+    def test_get_stats_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(two_asset_ops)
+        unknown_run_id = make_new_run_id()
+
+        with create_and_delete_test_runs(instance, [result_one.run_id, result_two.run_id]):
+            for event in [*events_one, *events_two]:
+                storage.store_event(event)
+
+            run_ids = [result_one.run_id, result_two.run_id, unknown_run_id]
+            stats_by_run_id = storage.get_stats_for_runs(run_ids)
+            assert list(stats_by_run_id.keys()) == run_ids
+            for run_id in run_ids:
+                assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+
+            assert stats_by_run_id[result_one.run_id].steps_succeeded == 1
+            assert stats_by_run_id[result_two.run_id].steps_succeeded == 2
+            assert stats_by_run_id[unknown_run_id].steps_succeeded == 0
+            assert storage.get_stats_for_runs([]) == {}
+
+    def test_fetch_materializations_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(one_asset_op)
+        events_two, result_two = _synthesize_events(two_asset_ops)
+        events_three, result_three = _synthesize_events(two_asset_ops)
+
+        with create_and_delete_test_runs(
+            instance, [result_one.run_id, result_two.run_id, result_three.run_id]
+        ):
+            for event in [*events_one, *events_two, *events_three]:
+                storage.store_event(event)
+
+            run_ids = [result_one.run_id, result_two.run_id]
+            result = storage.fetch_materializations_for_runs(run_ids, limit=10)
+            assert not result.has_more
+            assert len(result.records) == 4
+            assert {record.run_id for record in result.records} == set(run_ids)
+            storage_ids = [record.storage_id for record in result.records]
+            assert storage_ids == sorted(storage_ids)
+            assert {record.asset_key for record in result.records} == {
+                dg.AssetKey("asset_1"),
+                dg.AssetKey("asset_2"),
+                dg.AssetKey(["path", "to", "asset_3"]),
+            }
+
+            # paginate with the returned cursor
+            first_page = storage.fetch_materializations_for_runs(run_ids, limit=3)
+            assert first_page.has_more
+            assert [record.storage_id for record in first_page.records] == storage_ids[:3]
+            second_page = storage.fetch_materializations_for_runs(
+                run_ids, limit=3, cursor=first_page.cursor
+            )
+            assert [record.storage_id for record in second_page.records] == storage_ids[3:]
+
+            after = storage.fetch_materializations_for_runs(
+                run_ids, limit=10, after_storage_id=storage_ids[1]
+            )
+            assert [record.storage_id for record in after.records] == storage_ids[2:]
+
+            assert not storage.fetch_materializations_for_runs([], limit=10).records
+
     def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
         events_one, result_one = _synthesize_events(return_one_op_func)
         events_two, result_two = _synthesize_events(return_one_op_func)
@@ -1111,6 +1214,126 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
             assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
+    def test_get_records_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+        run_id_one = result_one.run_id
+        run_id_two = result_two.run_id
+
+        with create_and_delete_test_runs(instance, [run_id_one, run_id_two]):
+            for event in events_one:
+                storage.store_event(event)
+
+            conns = storage.get_records_for_runs({run_id_one: None, run_id_two: None})
+            assert len(conns[run_id_one].records) == len(events_one)
+            assert len(conns[run_id_two].records) == 0
+
+            for event in events_two:
+                storage.store_event(event)
+
+            conns = storage.get_records_for_runs(
+                {run_id_one: conns[run_id_one].cursor, run_id_two: conns[run_id_two].cursor}
+            )
+            assert len(conns[run_id_one].records) == 0
+            assert len(conns[run_id_two].records) == len(events_two)
+            assert {record.run_id for record in conns[run_id_two].records} == {run_id_two}
+
+            # the limit applies to each run, so one run's backlog does not hold up the other's
+            conns = storage.get_records_for_runs({run_id_one: None, run_id_two: None}, limit=2)
+            assert len(conns[run_id_one].records) == 2
+            assert len(conns[run_id_two].records) == 2
+            assert conns[run_id_one].has_more
+            assert conns[run_id_two].has_more
+
+            # paginate through both runs from the start
+            cursors = {run_id_one: None, run_id_two: None}
+            records_by_run_id = defaultdict(list)
+            while True:
+                conns = storage.get_records_for_runs(cursors, limit=2)
+                for run_id, conn in conns.items():
+                    records_by_run_id[run_id].extend(conn.records)
+                    cursors[run_id] = conn.cursor
+                if not any(conn.has_more for conn in conns.values()):
+                    break
+
+            assert len(records_by_run_id[run_id_one]) == len(events_one)
+            assert len(records_by_run_id[run_id_two]) == len(events_two)
+            for records in records_by_run_id.values():
+                storage_ids = [record.storage_id for record in records]
+                assert storage_ids == sorted(set(storage_ids))
+
+    def test_iter_records_for_run(self, instance, storage):
+        events, result = _synthesize_events(return_one_op_func)
+        run_id = result.run_id
+
+        with create_and_delete_test_runs(instance, [run_id]):
+            for event in events:
+                storage.store_event(event)
+
+            all_records = storage.get_records_for_run(run_id).records
+            for batch_size in [1, 2, len(events), len(events) + 1]:
+                records = list(storage.iter_records_for_run(run_id, batch_size=batch_size))
+                assert [record.storage_id for record in records] == [
+                    record.storage_id for record in all_records
+                ]
+
+            records = list(storage.iter_records_for_run(run_id, ascending=False, batch_size=2))
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in reversed(all_records)
+            ]
+
+            records = list(
+                storage.iter_records_for_run(
+                    run_id, of_type=DagsterEventType.STEP_SUCCESS, batch_size=1
+                )
+            )
+            assert len(records) == 1
+            assert records[0].event_log_entry.dagster_event_type == DagsterEventType.STEP_SUCCESS
+
+            assert list(storage.iter_records_for_run(make_new_run_id())) == []
+
+            # stats are built from the streamed records
+            assert storage.get_step_stats_for_run(run_id)[0].status == StepEventStatus.SUCCESS
+
+            if isinstance(storage, SqlEventLogStorage):
+                # rows are streamed from a single query when the storage supports it
+                with mock.patch.object(type(storage), "supports_server_side_cursors", True):
+                    records = list(storage.iter_records_for_run(run_id, batch_size=2))
+                    assert [record.storage_id for record in records] == [
+                        record.storage_id for record in all_records
+                    ]
+                    step_stats = storage.get_step_stats_for_run(run_id)
+                    assert step_stats[0].status == StepEventStatus.SUCCESS
+
+    def test_lazy_event_log_records(self, instance, storage):
+        events, result = _synthesize_events(return_one_op_func)
+        with create_and_delete_test_runs(instance, [result.run_id]):
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_records_for_run(result.run_id).records
+            assert len(records) == len(events)
+            for record in records:
+                serialized_entry = record[1]
+                if isinstance(serialized_entry, SerializedEventLogEntry):
+                    # reading the indexed columns does not deserialize the event
+                    assert record.run_id == result.run_id
+                    if serialized_entry.dagster_event_type is not None:
+                        assert record.event_type.value == serialized_entry.dagster_event_type
+                    assert not serialized_entry.is_deserialized
+
+                entry = record.event_log_entry
+                assert isinstance(entry, dg.EventLogEntry)
+                assert record.run_id == entry.run_id
+                assert record.timestamp == entry.timestamp
+                if entry.is_dagster_event:
+                    assert record.event_type == entry.dagster_event_type
+                assert record == dg.EventLogRecord(
+                    storage_id=record.storage_id, event_log_entry=entry
+                )
+                assert pickle.loads(pickle.dumps(record)) == record
+                assert dg.deserialize_value(dg.serialize_value(record), dg.EventLogRecord) == record
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_watcher_single_run_event(self, storage, test_run_id):
@@ -2182,6 +2405,51 @@ def _one():
         assert step_stats[0].attempts == 4
         assert len(step_stats[0].attempts_list) == 4
 
+    def test_run_step_stats_match_events(self, storage, test_run_id):
+        @dg.op(
+            ins={"_input": dg.In(str)},
+            out=dg.Out(str),
+        )
+        def materialize_and_retry(context, _input):
+            yield dg.AssetMaterialization(asset_key=dg.AssetKey("asset_1"))
+            yield dg.ExpectationResult(success=True, label="expectation")
+            if context.retry_number < 2:
+                raise dg.RetryRequested(max_retries=2)
+            yield dg.Output("done")
+
+        def _one():
+            materialize_and_retry(should_succeed())
+
+        events, result = _synthesize_events(_one, run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        expected_step_stats = build_run_step_stats_from_events(result.run_id, events)
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+
+        # step stats aggregated by the storage match those folded from the full events, up to the
+        # precision with which timestamps are stored
+        assert [stats.step_key for stats in step_stats] == [
+            stats.step_key for stats in expected_step_stats
+        ]
+        for stats, expected_stats in zip(step_stats, expected_step_stats):
+            assert stats.status == expected_stats.status
+            assert stats.start_time == pytest.approx(expected_stats.start_time, abs=1e-3)
+            assert stats.end_time == pytest.approx(expected_stats.end_time, abs=1e-3)
+            assert stats.attempts == expected_stats.attempts
+            assert len(stats.attempts_list) == len(expected_stats.attempts_list)
+            assert stats.materialization_events == expected_stats.materialization_events
+            assert stats.expectation_results == expected_stats.expectation_results
+            assert len(stats.markers) == len(expected_stats.markers)
+
+        [retried_stats] = [
+            stats for stats in step_stats if stats.step_key == "materialize_and_retry"
+        ]
+        assert retried_stats.status == StepEventStatus.SUCCESS
+        assert retried_stats.attempts == 3
+        assert len(retried_stats.materialization_events) == 3
+        assert len(retried_stats.expectation_results) == 3
+
     # After adding the IN_PROGRESS field to the StepEventStatus enum, tests in internal fail
     # Temporarily skipping this test
     @pytest.mark.skip
@@ -3392,6 +3660,18 @@ def _assert_storage_matches(expected, partition: str | None = None):
                 == expected
             )
 
+        def _assert_bulk_storage_matches():
+            # the storage ids of many assets fetched at once match those fetched per asset
+            asset_keys = [a, b, dg.AssetKey(["c"])]
+            assert storage.get_latest_storage_ids_by_partition_for_assets(
+                asset_keys, DagsterEventType.ASSET_MATERIALIZATION
+            ) == {
+                asset_key: storage.get_latest_storage_id_by_partition(
+                    asset_key, DagsterEventType.ASSET_MATERIALIZATION
+                )
+                for asset_key in asset_keys
+            }
+
         def _store_partition_event(asset_key, partition) -> int:
             storage.store_event(
                 dg.EventLogEntry(
@@ -3445,13 +3725,113 @@ def _store_partition_event(asset_key, partition) -> int:
             # p2 materialized
             latest_storage_ids["p3"] = _store_partition_event(a, "p3")
             _assert_storage_matches(latest_storage_ids)
+            _assert_bulk_storage_matches()
 
             storage.wipe_asset(a)
             latest_storage_ids = {}
             _assert_storage_matches(latest_storage_ids)
+            _assert_bulk_storage_matches()
 
             latest_storage_ids["p1"] = _store_partition_event(a, "p1")
             _assert_storage_matches(latest_storage_ids)
+            _assert_bulk_storage_matches()
+
+    def test_get_latest_asset_partition_records(self, storage, instance):
+        a = dg.AssetKey(["a"])
+        b = dg.AssetKey(["b"])
+        c = dg.AssetKey(["c"])
+        run_id = make_new_run_id()
+
+        def _store_event(asset_key, partition=None, observation=False) -> int:
+            if observation:
+                dagster_event = dg.DagsterEvent(
+                    DagsterEventType.ASSET_OBSERVATION.value,
+                    "nonce",
+                    event_specific_data=AssetObservationData(
+                        dg.AssetObservation(asset_key=asset_key, partition=partition)
+                    ),
+                )
+            else:
+                dagster_event = dg.DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        dg.AssetMaterialization(asset_key=asset_key, partition=partition)
+                    ),
+                )
+            storage.store_event(
+                dg.EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=dagster_event,
+                )
+            )
+            return storage.get_event_records(
+                dg.EventRecordsFilter(dagster_event.event_type, asset_key=asset_key),
+                limit=1,
+                ascending=False,
+            )[0].storage_id
+
+        def _latest_storage_ids(asset_partitions, event_type):
+            return {
+                asset_partition: record.storage_id
+                for asset_partition, record in storage.get_latest_asset_partition_records(
+                    asset_partitions, event_type
+                ).items()
+            }
+
+        asset_partitions = [
+            AssetKeyPartitionKey(a),
+            AssetKeyPartitionKey(a, "p1"),
+            AssetKeyPartitionKey(a, "p2"),
+            AssetKeyPartitionKey(b),
+            AssetKeyPartitionKey(c, "p1"),
+        ]
+        with create_and_delete_test_runs(instance, [run_id]):
+            assert (
+                _latest_storage_ids(asset_partitions, DagsterEventType.ASSET_MATERIALIZATION) == {}
+            )
+
+            a_p1 = _store_event(a, "p1")
+            a_p2 = _store_event(a, "p2")
+            a_p1 = _store_event(a, "p1")
+            b_latest = _store_event(b)
+            c_p1 = _store_event(c, "p1")
+            _store_event(c, "p2")
+            c_p1_observation = _store_event(c, "p1", observation=True)
+
+            latest_materializations = storage.get_latest_asset_partition_records(
+                asset_partitions, DagsterEventType.ASSET_MATERIALIZATION
+            )
+            assert {
+                asset_partition: record.storage_id
+                for asset_partition, record in latest_materializations.items()
+            } == {
+                AssetKeyPartitionKey(a): a_p1,
+                AssetKeyPartitionKey(a, "p1"): a_p1,
+                AssetKeyPartitionKey(a, "p2"): a_p2,
+                AssetKeyPartitionKey(b): b_latest,
+                AssetKeyPartitionKey(c, "p1"): c_p1,
+            }
+            for asset_partition, record in latest_materializations.items():
+                assert record.asset_key == asset_partition.asset_key
+                if asset_partition.partition_key:
+                    assert record.partition_key == asset_partition.partition_key
+
+            assert _latest_storage_ids(asset_partitions, DagsterEventType.ASSET_OBSERVATION) == {
+                AssetKeyPartitionKey(c, "p1"): c_p1_observation
+            }
+
+            storage.wipe_asset(a)
+            assert _latest_storage_ids(
+                asset_partitions, DagsterEventType.ASSET_MATERIALIZATION
+            ) == {
+                AssetKeyPartitionKey(b): b_latest,
+                AssetKeyPartitionKey(c, "p1"): c_p1,
+            }
 
     @pytest.mark.parametrize(
         "dagster_event_type",
@@ -4,7 +4,8 @@
 from functools import cached_property
 
 import pytest
-from dagster._core.loader import LoadableBy, LoadingContext
+from dagster._core.loader import LoadableBy, LoadingContext, blocking_batch_load_runner
+from dagster._utils import Counter, traced_counter
 from dagster._utils.aiodataloader import DataLoader
 from dagster_shared.record import record
 
@@ -203,3 +204,49 @@ def test_sync_loadable_by() -> None:
     d2 = LoadableThing.blocking_get(context, "d")
     assert d1 == d2
     assert context.instance.query.call_count == 2
+    assert context.get_loader_batch_counts() == {"LoadableThing": 2}
+
+
+def test_loader_batch_counts() -> None:
+    traced_counter.set(Counter())
+    context = MockedLoadingContext()
+    assert context.get_loader_batch_counts() == {}
+
+    async def _main() -> None:
+        await asyncio.gather(*[LoadableThing.gen(context, key) for key in ["a", "b", "c"]])
+        # cached keys do not issue another batch
+        await LoadableThing.gen_many(context, ["a", "d"])
+
+    asyncio.run(_main())
+
+    loader, _ = context.get_loaders_for(LoadableThing)
+    assert loader.num_batches == 2
+    assert loader.num_keys_loaded == 4
+    assert context.get_loader_batch_counts() == {"LoadableThing": 2}
+
+    LoadableThing.blocking_get_many(context, ["a", "b"])
+    assert context.get_loader_batch_counts() == {"LoadableThing": 3}
+
+    # batches are included in the traced call counts for the request
+    assert traced_counter.get().counts() == {"LoadableThing.batch_load": 3}  # ty: ignore[unresolved-attribute]
+
+
+def test_blocking_batch_load_runner() -> None:
+    context = MockedLoadingContext()
+    run_keys = []
+
+    async def _runner(fn, keys, context):
+        run_keys.append(list(keys))
+        return await asyncio.to_thread(fn, keys, context)
+
+    async def _main() -> list:
+        token = blocking_batch_load_runner.set(_runner)
+        try:
+            return await asyncio.gather(*[LoadableThing.gen(context, key) for key in ["a", "b"]])
+        finally:
+            blocking_batch_load_runner.reset(token)
+
+    things = asyncio.run(_main())
+    assert [thing.key for thing in things] == ["a", "b"]  # ty: ignore[possibly-missing-attribute]
+    # the batch is handed to the runner instead of being loaded inline
+    assert run_keys == [["a", "b"]]
@@ -109,6 +109,10 @@ def upgrade(self) -> None:
     def inst_data(self) -> ConfigurableClassData | None:
         return self._inst_data
 
+    @property
+    def supports_server_side_cursors(self) -> bool:
+        return True
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
         return mysql_config()
@@ -151,6 +151,10 @@ def upgrade(self) -> None:
     def inst_data(self) -> ConfigurableClassData | None:
         return self._inst_data
 
+    @property
+    def supports_server_side_cursors(self) -> bool:
+        return True
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
         return pg_config()
@@ -0,0 +1,263 @@
+"""Binary wire formats for serdes.
+
+`serialize_value` always produces JSON text. For large payloads that are written and read often
+(e.g. repository snapshots and daemon cursors), a binary encoding of the same packed structure is
+both smaller and faster to encode and decode. This module lets callers opt in to a binary codec
+while keeping JSON as the default and always-readable format.
+
+Binary payloads start with a fixed header:
+
+* ``BINARY_SERDES_MAGIC`` -- a byte sequence that can never begin a JSON document, so a reader can
+  tell binary and JSON payloads apart (and an older reader fails loudly instead of misparsing).
+* one byte holding the binary format version.
+* one byte holding the id of the codec that encoded the payload.
+
+JSON payloads are written without a header, so they remain readable by `deserialize_value`.
+"""
+
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Final
+
+from typing_extensions import TypeVar
+
+import dagster_shared.check as check
+from dagster_shared.match import match_type
+from dagster_shared.serdes.errors import DeserializationError, SerdesUsageError, SerializationError
+from dagster_shared.serdes.serdes import (
+    _WHITELIST_MAP,
+    JsonSerializableValue,
+    PackableValue,
+    SerializableObject,
+    UnpackContext,
+    UnpackedValue,
+    WhitelistMap,
+    _root,
+    _transform_for_serialization,
+    _unpack_object,
+    deserialize_value,
+    serialize_value,
+)
+from dagster_shared.utils.warnings import disable_dagster_warnings
+
+BINARY_SERDES_MAGIC: Final = b"\x00dgs"
+BINARY_SERDES_FORMAT_VERSION: Final = 1
+_HEADER_LENGTH: Final = len(BINARY_SERDES_MAGIC) + 2
+
+JSON_CODEC_NAME: Final = "json"
+MSGPACK_CODEC_NAME: Final = "msgpack"
+
+T_PackableValue = TypeVar("T_PackableValue", bound=PackableValue, default=PackableValue)
+
+
+class SerdesCodec(ABC):
+    """A binary encoding of the packed (JSON-compatible) form of a serdes value.
+
+    Codecs receive the whitelist map so that they can intern class names or otherwise specialize
+    the encoding, and must produce values that `_unpack_object` can turn back into domain objects.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def codec_id(self) -> int:
+        """Identifies the codec in the payload header. Must be stable across releases."""
+
+    @abstractmethod
+    def encode(self, val: PackableValue, whitelist_map: WhitelistMap) -> bytes: ...
+
+    @abstractmethod
+    def decode(
+        self, data: memoryview, whitelist_map: WhitelistMap, context: UnpackContext
+    ) -> UnpackedValue: ...
+
+
+class MsgpackSerdesCodec(SerdesCodec):
+    """Encodes packed values with msgpack.
+
+    Object class names are interned: each storage name is written once in a table that precedes
+    the packed value, and objects refer to it by index. The payload is two consecutive msgpack
+    values, the name table and the packed value.
+
+    Requires the optional `msgpack` dependency (`pip install dagster-shared[msgpack]`).
+    """
+
+    @property
+    def name(self) -> str:
+        return MSGPACK_CODEC_NAME
+
+    @property
+    def codec_id(self) -> int:
+        return 1
+
+    def _msgpack(self) -> Any:
+        try:
+            import msgpack
+        except ImportError as e:
+            raise SerdesUsageError(
+                "The msgpack serdes codec requires the `msgpack` package. Install it with "
+                "`pip install dagster-shared[msgpack]`."
+            ) from e
+        return msgpack
+
+    def encode(self, val: PackableValue, whitelist_map: WhitelistMap) -> bytes:
+        msgpack = self._msgpack()
+        name_indices: dict[str, int] = {}
+        packed = _transform_for_serialization(
+            val,
+            whitelist_map=whitelist_map,
+            object_handler=partial(_pack_object_interned, name_indices=name_indices),
+            descent_path=_root(val),
+        )
+        try:
+            return msgpack.packb(list(name_indices), use_bin_type=True) + msgpack.packb(
+                packed, use_bin_type=True
+            )
+        except (OverflowError, TypeError, ValueError) as e:
+            raise SerializationError(f"Could not encode value with msgpack: {e}") from e
+
+    def decode(
+        self, data: memoryview, whitelist_map: WhitelistMap, context: UnpackContext
+    ) -> UnpackedValue:
+        msgpack = self._msgpack()
+        names: list[str] = []
+        # the default buffer size limit of 100MiB would reject larger payloads, like big
+        # snapshots, so allow the buffer to hold the whole payload
+        unpacker = msgpack.Unpacker(
+            max_buffer_size=len(data),
+            raw=False,
+            strict_map_key=False,
+            object_hook=partial(
+                _unpack_object_interned, names=names, whitelist_map=whitelist_map, context=context
+            ),
+        )
+        unpacker.feed(data)
+        try:
+            names.extend(next(unpacker))
+            return next(unpacker)
+        except (StopIteration, ValueError, msgpack.UnpackException) as e:
+            raise DeserializationError(f"Could not decode msgpack serdes payload: {e}") from e
+
+
+def _pack_object_interned(
+    obj: SerializableObject,
+    whitelist_map: WhitelistMap,
+    descent_path: str,
+    name_indices: dict[str, int],
+) -> dict[str, JsonSerializableValue]:
+    # object_handler that replaces each object's storage name with its index in the name table
+    serializer = whitelist_map.object_serializers[obj.__class__.__name__]
+    handler = partial(_pack_object_interned, name_indices=name_indices)
+    packed = dict(serializer.pack_items(obj, whitelist_map, handler, descent_path))
+    storage_name = packed["__class__"]
+    index = name_indices.get(storage_name)  # ty: ignore[invalid-argument-type]
+    if index is None:
+        index = name_indices[storage_name] = len(name_indices)  # ty: ignore[invalid-assignment]
+    packed["__class__"] = index
+    return packed
+
+
+def _unpack_object_interned(
+    val: dict, names: list[str], whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    klass = val.get("__class__")
+    if type(klass) is int:
+        val["__class__"] = names[klass]
+    return _unpack_object(val, whitelist_map, context)
+
+
+_CODECS_BY_NAME: dict[str, SerdesCodec] = {}
+_CODECS_BY_ID: dict[int, SerdesCodec] = {}
+
+
+def register_serdes_codec(codec: SerdesCodec) -> None:
+    check.inst_param(codec, "codec", SerdesCodec)
+    check.invariant(0 < codec.codec_id < 256, "codec_id must fit in a single byte")
+    existing = _CODECS_BY_ID.get(codec.codec_id)
+    check.invariant(
+        existing is None or existing.name == codec.name,
+        f"codec_id {codec.codec_id} is already registered to codec {existing and existing.name}",
+    )
+    _CODECS_BY_NAME[codec.name] = codec
+    _CODECS_BY_ID[codec.codec_id] = codec
+
+
+register_serdes_codec(MsgpackSerdesCodec())
+
+
+def is_binary_serdes_payload(data: bytes | memoryview) -> bool:
+    return bytes(data[: len(BINARY_SERDES_MAGIC)]) == BINARY_SERDES_MAGIC
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    codec: str = JSON_CODEC_NAME,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to bytes with the given codec.
+
+    The default `json` codec produces the UTF-8 encoding of `serialize_value`, with no header.
+    Any other codec produces a binary payload prefixed with the versioned serdes header.
+    """
+    check.str_param(codec, "codec")
+    if codec == JSON_CODEC_NAME:
+        return serialize_value(val, whitelist_map).encode("utf-8")
+
+    if codec not in _CODECS_BY_NAME:
+        raise SerializationError(
+            f'Unknown serdes codec "{codec}". Available codecs: '
+            f"{sorted([JSON_CODEC_NAME, *_CODECS_BY_NAME])}"
+        )
+    serdes_codec = _CODECS_BY_NAME[codec]
+    header = BINARY_SERDES_MAGIC + bytes([BINARY_SERDES_FORMAT_VERSION, serdes_codec.codec_id])
+    return header + serdes_codec.encode(val, whitelist_map)
+
+
+def deserialize_value_from_bytes(
+    val: bytes | str,
+    as_type: type[T_PackableValue] | None = None,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> T_PackableValue:
+    """Deserialize a value written by `serialize_value_to_bytes` or `serialize_value`.
+
+    Payloads without the binary serdes header are treated as JSON.
+    """
+    if isinstance(val, str):
+        return deserialize_value(val, as_type, whitelist_map)  # type: ignore
+
+    check.inst_param(val, "val", (bytes, bytearray, memoryview))
+    data = memoryview(val)
+    if not is_binary_serdes_payload(data):
+        return deserialize_value(str(data, "utf-8"), as_type, whitelist_map)  # type: ignore
+
+    if len(data) < _HEADER_LENGTH:
+        raise DeserializationError("Binary serdes payload is truncated.")
+    version = data[len(BINARY_SERDES_MAGIC)]
+    codec_id = data[len(BINARY_SERDES_MAGIC) + 1]
+    if version > BINARY_SERDES_FORMAT_VERSION:
+        raise DeserializationError(
+            f"Binary serdes payload has format version {version}, but this version of dagster "
+            f"only supports up to version {BINARY_SERDES_FORMAT_VERSION}. The payload was "
+            "likely written by a newer version of dagster."
+        )
+    if codec_id not in _CODECS_BY_ID:
+        raise DeserializationError(f"Binary serdes payload uses unknown codec id {codec_id}.")
+
+    with (
+        disable_dagster_warnings(),
+        check.EvalContext.contextual_namespace(whitelist_map.object_type_map),
+    ):
+        context = UnpackContext()
+        unpacked_value = _CODECS_BY_ID[codec_id].decode(
+            data[_HEADER_LENGTH:], whitelist_map, context
+        )
+        unpacked_value = context.finalize_unpack(unpacked_value)
+
+    if as_type is not None and not match_type(unpacked_value, as_type):
+        raise DeserializationError(
+            f"Deserialized object was not expected type {as_type}, got {type(unpacked_value)}"
+        )
+    return unpacked_value  # type: ignore
@@ -549,6 +549,16 @@ def get_storage_name(self) -> str:
 )
 
 
+_MISSING: Final = object()
+
+
+class _FieldPackPlan(NamedTuple):
+    storage_key: str
+    custom: "FieldSerializer | None"
+    skip_when_empty: bool
+    skip_when_none: bool
+
+
 class ObjectSerializer(Serializer, Generic[T]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
     def __init__(
@@ -584,30 +594,9 @@ def unpack(
     ) -> T:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
-            unpacked: dict[str, PackableValue] = {}
-            for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
-                # Naively implements backwards compatibility by filtering arguments that aren't present in
-                # the constructor. If a property is present in the serialized object, but doesn't exist in
-                # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
-
-                else:
-                    context.clear_ignored_unknown_values(value)
-
-            return self.klass(**unpacked)
+            if not context.observed_unknown_serdes_values:
+                return self._compiled_unpack(unpacked_dict, whitelist_map, context)
+            return self._unpack_fields(unpacked_dict, whitelist_map, context)
         except Exception as exc:
             value = self.handle_unpack_error(exc, context, unpacked_dict)
             if isinstance(context, UnpackContext):
@@ -615,6 +604,77 @@ def unpack(
                 context.clear_ignored_unknown_values(unpacked_dict)
             return value
 
+    def _unpack_fields(
+        self,
+        unpacked_dict: dict[str, UnpackedValue],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> T:
+        unpacked: dict[str, PackableValue] = {}
+        for key, value in unpacked_dict.items():
+            loaded_name = self.loaded_field_names.get(key, key)
+            # Naively implements backwards compatibility by filtering arguments that aren't present in
+            # the constructor. If a property is present in the serialized object, but doesn't exist in
+            # the version of the class loaded into memory, that property will be completely ignored.
+            if loaded_name in self.constructor_param_names:
+                # custom unpack regardless of hook vs recursive descent
+                custom = self.field_serializers.get(loaded_name)
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
+
+            else:
+                context.clear_ignored_unknown_values(value)
+
+        return self.klass(**unpacked)
+
+    @cached_property
+    def _compiled_unpack(
+        self,
+    ) -> Callable[[dict[str, UnpackedValue], WhitelistMap, UnpackContext], T]:
+        """A constructor call specialized to this class, compiled on first use.
+
+        Equivalent to `_unpack_fields` for the common case where no unknown values have
+        been observed: storage field names and field serializers are resolved ahead of time, and
+        keys that don't correspond to a constructor param are never looked at.
+        """
+        lines = [
+            "def __compiled_unpack__(unpacked_dict, whitelist_map, context):",
+            "    get = unpacked_dict.get",
+            "    kwargs = {}",
+        ]
+        for name in self.constructor_param_names:
+            storage_key = self.storage_field_names.get(name, name)
+            lines.append(f"    value = get({storage_key!r}, _MISSING)")
+            if storage_key != name:
+                # the unpack loop also accepts values stored under the loaded field name
+                lines.append("    if value is _MISSING:")
+                lines.append(f"        value = get({name!r}, _MISSING)")
+            lines.append("    if value is not _MISSING:")
+            if name in self.field_serializers:
+                lines.append(
+                    f"        kwargs[{name!r}] = field_serializers[{name!r}].unpack("
+                    "value, whitelist_map=whitelist_map, context=context)"
+                )
+            else:
+                lines.append(f"        kwargs[{name!r}] = value")
+        lines.append("    return klass(**kwargs)")
+
+        namespace: dict[str, Any] = {
+            "_MISSING": _MISSING,
+            "klass": self.klass,
+            "field_serializers": self.field_serializers,
+        }
+        exec(compile("\n".join(lines), f"<serdes unpack {self.klass.__name__}>", "exec"), namespace)
+        return namespace["__compiled_unpack__"]
+
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
     def before_unpack(
@@ -642,9 +702,12 @@ def pack_items(
         descent_path: str,
     ) -> Iterator[tuple[str, JsonSerializableValue]]:
         yield "__class__", self.get_storage_name()
+        pack_plan = self._pack_plan
         for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
+            plan = pack_plan.get(key)
+            if plan is None:
+                plan = pack_plan[key] = self._field_pack_plan(key)
+            storage_key, custom, skip_when_empty, skip_when_none = plan
             if custom:
                 field_value = custom.pack(
                     inner_value,
@@ -654,8 +717,8 @@ def pack_items(
             else:
                 field_value = inner_value
 
-            if (key in self.skip_when_empty_fields and field_value in EMPTY_VALUES_TO_SKIP) or (
-                key in self.skip_when_none_fields and field_value is None
+            if (skip_when_empty and field_value in EMPTY_VALUES_TO_SKIP) or (
+                skip_when_none and field_value is None
             ):
                 continue
 
@@ -671,6 +734,20 @@ def pack_items(
         for key, default in self.old_fields.items():
             yield key, default
 
+    @cached_property
+    def _pack_plan(self) -> dict[str, "_FieldPackPlan"]:
+        # filled lazily by pack_items, since object_as_mapping may yield keys that aren't
+        # constructor params
+        return {}
+
+    def _field_pack_plan(self, key: str) -> "_FieldPackPlan":
+        return _FieldPackPlan(
+            storage_key=self.storage_field_names.get(key, key),
+            custom=self.field_serializers.get(key),
+            skip_when_empty=key in self.skip_when_empty_fields,
+            skip_when_none=key in self.skip_when_none_fields,
+        )
+
     # Hook: Modify the contents of the object before packing
     def before_pack(self, value: T) -> T:
         return value